@@ -66,7 +66,7 @@ class ThemeDemo:
             self.control_frame,
             text="Break Mode",
             variable=self.break_var,
-            command=self.update_theme
+            command=self.update_timer_color
         )
         self.break_toggle.pack(side=tk.LEFT, padx=5)
         
@@ -91,6 +91,7 @@ class ThemeDemo:
         
         # Initialize the theme manager
         self.theme_manager = ThemeManager(root, Config())
+        self.theme_manager.ensure_styles("Treeview", "TCombobox", "TScale")
         
         # Store widgets for theming
         self.widgets = {
@@ -297,6 +298,10 @@ class ThemeDemo:
     def update_theme(self):
         """Update the theme for all widgets."""
         self.theme_manager.apply(self.widgets, on_break=self.break_var.get())
+    
+    def update_timer_color(self):
+        """Recolor just the timer label when break mode is toggled."""
+        self.theme_manager.apply_timer_color(self.timer_label, self.break_var.get())
 
 def main():
     """Run the theme demo."""
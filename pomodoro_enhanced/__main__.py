@@ -6,6 +6,8 @@ Enhanced Pomodoro Timer - Main Application
 import sys
 import os
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 from typing import Optional
 
@@ -14,17 +16,26 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from pomodoro_enhanced.core.data_manager import DataManager
 from pomodoro_enhanced.core.timer_service import TimerService, TimerState, TimerMode
+from pomodoro_enhanced.core.updater import cleanup_previous_update
 from pomodoro_enhanced.ui.main_window import MainWindow
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('pomodoro_enhanced.log')
-    ]
-)
+# Configure logging. Records are handed to a queue and written by a
+# listener thread, so console and file I/O stay off the Tk thread.
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.StreamHandler(),
+    logging.FileHandler('pomodoro_enhanced.log')
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# Only merge the message arguments here; the listener does the full formatting
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+
 logger = logging.getLogger(__name__)
 
 class PomodoroApp:
@@ -58,6 +69,13 @@ class PomodoroApp:
         """Run the application."""
         self.logger.info("Starting Pomodoro App")
         self.main_window.mainloop()
+        
+        # The window is gone; stop per-second updates aimed at it
+        self.timer_service.unregister_update_callback(self._on_timer_update)
+        
+        # Sessions are saved on a background thread; write out any still queued
+        if not self.timer_service.flush(timeout=5):
+            self.logger.warning("Timed out saving pending sessions")
     
     # Signal handlers
     
@@ -67,11 +85,11 @@ class PomodoroApp:
     
     def _on_timer_state_change(self, state: TimerState) -> None:
         """Handle timer state change events."""
-        self.main_window.update_ui_state()
+        self.main_window.on_state_change(state)
     
     def _on_timer_mode_change(self, mode: TimerMode) -> None:
         """Handle timer mode change events."""
-        self.main_window.update_ui_mode(mode)
+        self.main_window.on_mode_change(mode)
     
     def _on_session_complete(self, session) -> None:
         """Handle session completion events."""
@@ -79,12 +97,19 @@ class PomodoroApp:
 
 def main() -> None:
     """Main entry point for the application."""
+    _log_listener.start()
     try:
+        # Drop the backup left by a portable update applied last time
+        cleanup_previous_update()
+        
         app = PomodoroApp()
         app.run()
     except Exception as e:
         logger.critical("Unhandled exception", exc_info=True)
         sys.exit(1)
+    finally:
+        # Write out any queued records before exiting
+        _log_listener.stop()
 
 if __name__ == "__main__":
     main()
@@ -23,6 +23,7 @@ def main():
         from .ui.main_window import MainWindow
         from .core.theme import theme_manager
         from .core.settings import TimerSettings
+        from .core.timer_service import flush_persistence
         
         # Initialize root window
         root = tk.Tk()
@@ -41,6 +42,8 @@ def main():
         # Save settings on exit
         def on_closing():
             settings.save(settings_path)
+            # Let queued session saves finish before the process exits
+            flush_persistence(timeout=5)
             root.destroy()
             
         root.protocol("WM_DELETE_WINDOW", on_closing)
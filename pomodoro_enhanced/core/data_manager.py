@@ -1,5 +1,6 @@
 import json
 import os
+import threading
 from pathlib import Path
 from typing import List, Dict, Any, Optional, TypeVar, Type
 from datetime import datetime
@@ -15,6 +16,11 @@ class DataManager:
         """Initialize the data manager with optional custom data directory."""
         self.logger = logging.getLogger(__name__)
         
+        # Serializes changes and saves: sessions are saved from the timer's
+        # persistence worker while tasks are edited from the UI thread, and
+        # each save renames the current files into backups before rewriting
+        self._lock = threading.RLock()
+        
         # Set up data directory
         if data_dir:
             self.data_dir = Path(data_dir)
@@ -94,30 +100,32 @@ class DataManager:
     
     def save_all_data(self) -> bool:
         """Save all data to disk."""
-        success = True
-        
-        # Save tasks
-        tasks_data = [task.to_dict() for task in self.tasks]
-        if not self._save_json_file(self.tasks_file, tasks_data):
-            success = False
-        
-        # Save sessions
-        sessions_data = [session.to_dict() for session in self.sessions]
-        if not self._save_json_file(self.sessions_file, sessions_data):
-            success = False
-        
-        # Save settings
-        settings_data = self.settings.to_dict()
-        if not self._save_json_file(self.settings_file, settings_data):
-            success = False
-        
-        return success
+        with self._lock:
+            success = True
+            
+            # Save tasks
+            tasks_data = [task.to_dict() for task in self.tasks]
+            if not self._save_json_file(self.tasks_file, tasks_data):
+                success = False
+            
+            # Save sessions
+            sessions_data = [session.to_dict() for session in self.sessions]
+            if not self._save_json_file(self.sessions_file, sessions_data):
+                success = False
+            
+            # Save settings
+            settings_data = self.settings.to_dict()
+            if not self._save_json_file(self.settings_file, settings_data):
+                success = False
+            
+            return success
     
     # Task management
     def add_task(self, task: Task) -> str:
         """Add a new task."""
-        self.tasks.append(task)
-        self.save_all_data()
+        with self._lock:
+            self.tasks.append(task)
+            self.save_all_data()
         return task.id
     
     def get_task(self, task_id: str) -> Optional[Task]:
@@ -129,20 +137,22 @@ class DataManager:
     
     def update_task(self, task: Task) -> bool:
         """Update an existing task."""
-        for i, t in enumerate(self.tasks):
-            if t.id == task.id:
-                self.tasks[i] = task
-                self.save_all_data()
-                return True
+        with self._lock:
+            for i, t in enumerate(self.tasks):
+                if t.id == task.id:
+                    self.tasks[i] = task
+                    self.save_all_data()
+                    return True
         return False
     
     def delete_task(self, task_id: str) -> bool:
         """Delete a task by ID."""
-        for i, task in enumerate(self.tasks):
-            if task.id == task_id:
-                del self.tasks[i]
-                self.save_all_data()
-                return True
+        with self._lock:
+            for i, task in enumerate(self.tasks):
+                if task.id == task_id:
+                    del self.tasks[i]
+                    self.save_all_data()
+                    return True
         return False
     
     def get_tasks(self, **filters) -> List[Task]:
@@ -162,8 +172,9 @@ class DataManager:
     # Session management
     def add_session(self, session: PomodoroSession) -> str:
         """Add a new session."""
-        self.sessions.append(session)
-        self.save_all_data()
+        with self._lock:
+            self.sessions.append(session)
+            self.save_all_data()
         return session.id
     
     def get_sessions(self, **filters) -> List[PomodoroSession]:
@@ -183,8 +194,9 @@ class DataManager:
     # Settings management
     def update_settings(self, settings: TimerSettings) -> bool:
         """Update application settings."""
-        self.settings = settings
-        return self.save_all_data()
+        with self._lock:
+            self.settings = settings
+            return self.save_all_data()
     
     def get_settings(self) -> TimerSettings:
         """Get current settings."""
@@ -221,19 +233,20 @@ class DataManager:
             with open(backup_file, 'r', encoding='utf-8') as f:
                 backup_data = json.load(f)
             
-            # Restore tasks
-            self.tasks = [Task.from_dict(task_data) for task_data in backup_data.get('tasks', [])]
-            
-            # Restore sessions
-            self.sessions = [PomodoroSession.from_dict(session_data) 
-                           for session_data in backup_data.get('sessions', [])]
-            
-            # Restore settings
-            if 'settings' in backup_data:
-                self.settings = TimerSettings.from_dict(backup_data['settings'])
-            
-            # Save the restored data
-            return self.save_all_data()
+            with self._lock:
+                # Restore tasks
+                self.tasks = [Task.from_dict(task_data) for task_data in backup_data.get('tasks', [])]
+                
+                # Restore sessions
+                self.sessions = [PomodoroSession.from_dict(session_data) 
+                               for session_data in backup_data.get('sessions', [])]
+                
+                # Restore settings
+                if 'settings' in backup_data:
+                    self.settings = TimerSettings.from_dict(backup_data['settings'])
+                
+                # Save the restored data
+                return self.save_all_data()
             
         except Exception as e:
             self.logger.error(f"Error restoring backup: {e}")
@@ -3,8 +3,8 @@
 This module provides a more maintainable and type-safe implementation of theme management,
 separating concerns and improving code organization.
 """
-from dataclasses import dataclass
-from typing import Literal, Mapping, Optional, TypeVar, Any, Dict, Callable
+from dataclasses import dataclass, field
+from typing import Literal, Mapping, Optional, TypeVar, Any, Dict, Callable, List, Set, Tuple
 import tkinter as tk
 from tkinter import ttk
 import logging
@@ -12,6 +12,7 @@ import logging
 # Type variables for better type hints
 T = TypeVar('T')
 WidgetMap = Mapping[str, tk.Widget]
+NamedWidgets = List[Tuple[str, tk.Widget]]
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -19,9 +20,9 @@ logger = logging.getLogger(__name__)
 # Type for theme modes
 ThemeMode = Literal["light", "dark"]
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ThemeConfig:
-    """Dataclass to hold theme configuration values."""
+    """Immutable, hashable dataclass holding theme configuration values."""
     bg: str
     fg: str
     surface: str
@@ -30,6 +31,13 @@ class ThemeConfig:
     button_active_bg: str
     work: str
     brk: str
+    # Derived disabled-state colours, computed once per theme
+    fg_disabled: str = field(init=False)
+    primary_disabled: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "fg_disabled", f"{self.fg}80")
+        object.__setattr__(self, "primary_disabled", f"{self.primary}80")
 
 class ThemeDetector:
     """Handles detection of system theme."""
@@ -55,8 +63,18 @@ class ThemeConfigFactory:
     """Factory for creating ThemeConfig instances from configuration."""
     
     def __init__(self, config_module):
-        """Initialize with the application's config module."""
+        """Initialize with the application's config module.
+
+        The upper-case settings are snapshotted once, so later lookups are
+        plain dict probes instead of attribute access on the module.
+        """
         self._cfg = config_module
+        self._snap: Dict[str, Any] = {
+            name: getattr(config_module, name)
+            for name in dir(config_module)
+            if name.isupper()
+        }
+        self._themes: Dict[str, ThemeConfig] = {}
         self._validate_config()
 
     def _validate_config(self) -> None:
@@ -65,16 +83,19 @@ class ThemeConfigFactory:
             "BACKGROUND_COLOR", "FOREGROUND_COLOR", 
             "SURFACE_COLOR", "PRIMARY_COLOR", "SECONDARY_COLOR"
         ]
-        missing = [attr for attr in required_attrs if not hasattr(self._cfg, attr)]
+        missing = [attr for attr in required_attrs if attr not in self._snap]
         if missing:
             raise ValueError(f"Config module missing required attributes: {', '.join(missing)}")
 
     def _get_with_fallback(self, attr: str, default: T) -> T:
         """Helper to get attribute with fallback to default if not found."""
-        return getattr(self._cfg, attr, default)
+        return self._snap.get(attr, default)
 
     def create(self, mode: ThemeMode) -> ThemeConfig:
         """Create a ThemeConfig for the specified mode.
+
+        Themes are built once per mode and the same instance is returned on
+        later calls.
         
         Args:
             mode: The theme mode ('light' or 'dark')
@@ -82,87 +103,136 @@ class ThemeConfigFactory:
         Returns:
             Configured ThemeConfig instance
         """
-        cfg = self._cfg
-        
+        theme = self._themes.get(mode)
+        if theme is None:
+            theme = self._themes[mode] = self._build(mode)
+        return theme
+
+    def _build(self, mode: ThemeMode) -> ThemeConfig:
+        """Build a new ThemeConfig for the specified mode."""
+        cfg = self._snap
+        get = cfg.get
+
+        if mode == "dark":
+            # Dark theme uses direct config values with fallbacks
+            return ThemeConfig(
+                bg=cfg["BACKGROUND_COLOR"],
+                fg=cfg["FOREGROUND_COLOR"],
+                surface=cfg["SURFACE_COLOR"],
+                primary=cfg["PRIMARY_COLOR"],
+                secondary=cfg["SECONDARY_COLOR"],
+                button_active_bg=get("BUTTON_ACTIVE_BG_DARK", "#3c3c3c"),
+                work=get("WORK_COLOR_DARK", "#ff8a80"),
+                brk=get("BREAK_COLOR_DARK", "#80cbc4"),
+            )
+
         # Light theme defaults with fallbacks
-        light_theme = {
-            "bg": self._get_with_fallback("BACKGROUND_COLOR_LIGHT", "#f5f5f5"),
-            "fg": self._get_with_fallback("FOREGROUND_COLOR_LIGHT", "#212121"),
-            "surface": self._get_with_fallback("SURFACE_COLOR_LIGHT", "#ffffff"),
-            "primary": self._get_with_fallback("PRIMARY_COLOR_LIGHT", "#007bff"),
-            "secondary": self._get_with_fallback("SECONDARY_COLOR_LIGHT", "#ff9800"),
-            "button_active_bg": self._get_with_fallback("BUTTON_ACTIVE_BG_LIGHT", "#e0e0e0"),
-            "work": self._get_with_fallback("WORK_COLOR_LIGHT", "#d32f2f"),
-            "brk": self._get_with_fallback("BREAK_COLOR_LIGHT", "#00796b"),
-        }
-        
-        # Dark theme uses direct config values with fallbacks
-        dark_theme = {
-            "bg": cfg.BACKGROUND_COLOR,
-            "fg": cfg.FOREGROUND_COLOR,
-            "surface": cfg.SURFACE_COLOR,
-            "primary": cfg.PRIMARY_COLOR,
-            "secondary": cfg.SECONDARY_COLOR,
-            "button_active_bg": self._get_with_fallback("BUTTON_ACTIVE_BG_DARK", "#3c3c3c"),
-            "work": self._get_with_fallback("WORK_COLOR_DARK", "#ff8a80"),
-            "brk": self._get_with_fallback("BREAK_COLOR_DARK", "#80cbc4"),
-        }
-        
-        theme_dict = dark_theme if mode == "dark" else light_theme
-        return ThemeConfig(**theme_dict)
+        return ThemeConfig(
+            bg=get("BACKGROUND_COLOR_LIGHT", "#f5f5f5"),
+            fg=get("FOREGROUND_COLOR_LIGHT", "#212121"),
+            surface=get("SURFACE_COLOR_LIGHT", "#ffffff"),
+            primary=get("PRIMARY_COLOR_LIGHT", "#007bff"),
+            secondary=get("SECONDARY_COLOR_LIGHT", "#ff9800"),
+            button_active_bg=get("BUTTON_ACTIVE_BG_LIGHT", "#e0e0e0"),
+            work=get("WORK_COLOR_LIGHT", "#d32f2f"),
+            brk=get("BREAK_COLOR_LIGHT", "#00796b"),
+        )
 
 class ThemeManager:
     """Manages theme detection, resolution, and application for Tkinter applications."""
     
-    def __init__(self, root: tk.Tk, config_module):
+    def __init__(self, root: tk.Tk, config_module, *, direct_configure: bool = False):
         """Initialize the theme manager.
         
         Args:
             root: The root Tkinter window
             config_module: Module containing theme configuration
+            direct_configure: If True, apply() configures widgets with raw Tcl
+                calls, bypassing Tkinter's keyword-option handling
         """
         self._root = root
         self._cfg = config_module
+        self._direct_configure = direct_configure
         self._style = ttk.Style()
         self._factory = ThemeConfigFactory(config_module)
+        self._lazy_style_groups: Set[str] = set()
         self.theme = self._factory.create(ThemeDetector.detect())
+        self._widget_groups: Optional[Tuple[tuple, Dict[type, NamedWidgets], NamedWidgets]] = None
+        self._build_apply_plans()
         self._register_ttk_styles()
 
     def apply(self, widgets: WidgetMap, *, on_break: bool = False) -> None:
         """Apply the current theme to the provided widgets and root window.
+
+        Redraws are left to Tk's normal idle processing rather than forced.
         
         Args:
             widgets: Mapping of widget names to Tkinter widgets
             on_break: If True, use break color for timer labels
         """
-        t = self.theme
-        timer_fg = t.brk if on_break else t.work
-        
-        # Widget type to configuration mapping
-        widget_configs = {
-            tk.Frame: {"bg": t.bg},
-            tk.Label: {
-                "bg": t.bg, 
-                "fg": lambda name: timer_fg if name == "timer_label" else t.fg
-            },
-            # Add more widget types as needed
-        }
+        self._root.configure(bg=self.theme.bg)
+        groups, timer_labels = self._group_widgets(widgets)
+
+        # Apply each widget type's prebuilt configuration to all its widgets
+        for cls, members in groups.items():
+            self._configure_all(members, self._apply_plans[cls])
+        self._configure_all(timer_labels, self._timer_label_plans[on_break])
+
+    def apply_timer_color(self, label: tk.Widget, on_break: bool) -> None:
+        """Recolor only the timer label, e.g. on a work/break transition.
+
+        Args:
+            label: The timer label widget
+            on_break: If True, use the break color, otherwise the work color
+        """
+        try:
+            # "foreground" is understood by both tk.Label and ttk.Label
+            label.configure(foreground=self._timer_fg_break if on_break else self._timer_fg_work)
+        except tk.TclError as exc:
+            logger.debug("Timer label could not be recolored: %s", exc)
+
+    def _group_widgets(self, widgets: WidgetMap) -> Tuple[Dict[type, NamedWidgets], NamedWidgets]:
+        """Partition themeable widgets by class, separating timer labels.
+
+        The partition of the last mapping is reused while its names and
+        widgets are unchanged.
+        """
+        key = (tuple(widgets), tuple(widgets.values()))
+        cached = self._widget_groups
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
 
-        # Apply configurations to each widget
+        groups: Dict[type, NamedWidgets] = {}
+        timer_labels: NamedWidgets = []
         for name, widget in widgets.items():
+            cls = type(widget)
+            if cls not in self._apply_plans:
+                continue
+            if cls is tk.Label and name == "timer_label":
+                timer_labels.append((name, widget))
+            else:
+                groups.setdefault(cls, []).append((name, widget))
+
+        self._widget_groups = (key, groups, timer_labels)
+        return groups, timer_labels
+
+    def _configure_all(self, members: NamedWidgets, config: Dict[str, str]) -> None:
+        """Apply one configuration to a group of widgets."""
+        if self._direct_configure:
+            args = [arg for option, value in config.items() for arg in (f"-{option}", value)]
+            for name, widget in members:
+                try:
+                    widget.tk.call(widget._w, "configure", *args)
+                except tk.TclError as exc:
+                    logger.debug("Widget %s could not be themed: %s", name, exc)
+            return
+
+        for name, widget in members:
             try:
-                config = widget_configs.get(type(widget))
-                if config:
-                    kwargs = {k: v(name) if callable(v) else v 
-                            for k, v in config.items()}
-                    widget.configure(**kwargs)
+                widget.configure(**config)
             except tk.TclError as exc:
                 logger.debug("Widget %s could not be themed: %s", name, exc)
 
-        # Update root window
-        self._root.configure(bg=t.bg)
-        self._root.update_idletasks()
-
     def update_theme(self, dark_mode: Optional[bool] = None) -> None:
         """Update the current theme based on preference or system detection.
         
@@ -171,16 +241,81 @@ class ThemeManager:
                       If None, detects system theme.
         """
         mode: ThemeMode = "dark" if dark_mode else "light" if dark_mode is not None else ThemeDetector.detect()
-        self.theme = self._factory.create(mode)
+        theme = self._factory.create(mode)
+        if theme is self.theme:
+            return
+        self.theme = theme
+        self._build_apply_plans()
         self._register_ttk_styles()
 
+    def _build_apply_plans(self) -> None:
+        """Prebuild the per-widget-type configure options for the current theme."""
+        t = self.theme
+        self._label_fg_default = t.fg
+        self._timer_fg_work = t.work
+        self._timer_fg_break = t.brk
+
+        # Widget type to configuration mapping
+        self._apply_plans: Dict[type, Dict[str, str]] = {
+            tk.Frame: {"bg": t.bg},
+            tk.Label: {"bg": t.bg, "fg": self._label_fg_default},
+            # Add more widget types as needed
+        }
+        # Timer label options indexed by on_break
+        self._timer_label_plans = (
+            {"bg": t.bg, "fg": self._timer_fg_work},
+            {"bg": t.bg, "fg": self._timer_fg_break},
+        )
+        self._widget_groups = None
+
+    def ensure_styles(self, *groups: str) -> None:
+        """Register on-demand ttk styles before their widgets are first created.
+
+        Args:
+            groups: Style groups to register ("Treeview", "TCombobox", "TScale")
+        """
+        pending = [g for g in groups if g not in self._lazy_style_groups]
+        if not pending:
+            return
+        specs = self._lazy_style_specs()
+        for group in pending:
+            if group not in specs:
+                raise ValueError(f"Unknown ttk style group: {group}")
+            self._configure_styles(specs[group])
+            self._lazy_style_groups.add(group)
+
     def _register_ttk_styles(self) -> None:
-        """Register and configure ttk styles for the current theme."""
-        self._style.theme_use("clam")
+        """Register and configure ttk styles for the current theme.
+
+        Styles are configured as a single batch; Tk coalesces the resulting
+        redraws into one idle pass, so no flush is forced here. Rarely used
+        styles are only registered once requested via ensure_styles().
+        """
+        # Re-selecting the active theme broadcasts <<ThemeChanged>> to every widget
+        if self._style.theme_use() != "clam":
+            self._style.theme_use("clam")
+
+        self._configure_styles(self._core_style_specs())
+        if self._lazy_style_groups:
+            specs = self._lazy_style_specs()
+            for group in self._lazy_style_groups:
+                self._configure_styles(specs[group])
+
+        # Configure root window
+        self._root.configure(bg=self.theme.bg)
+
+    def _configure_styles(self, styles: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
+        """Apply a mapping of style names to configure/map options."""
+        for style_name, config in styles.items():
+            if "configure" in config:
+                self._style.configure(style_name, **config["configure"])
+            if "map" in config:
+                self._style.map(style_name, **config["map"])
+
+    def _core_style_specs(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Build the styles registered eagerly for the current theme."""
         t = self.theme
-        
-        # Base style configuration
-        base_style = {
+        return {
             ".": {
                 "configure": {
                     "background": t.bg,
@@ -211,7 +346,7 @@ class ThemeManager:
                     ],
                     "foreground": [
                         ("active", t.fg), 
-                        ("disabled", f"{t.fg}80")
+                        ("disabled", t.fg_disabled)
                     ],
                 }
             },
@@ -228,7 +363,7 @@ class ThemeManager:
                     "background": [
                         ("active", t.secondary), 
                         ("pressed", t.secondary), 
-                        ("disabled", f"{t.primary}80")
+                        ("disabled", t.primary_disabled)
                     ],
                 }
             },
@@ -244,13 +379,17 @@ class ThemeManager:
                 "configure": {"background": t.bg}
             },
             "TNotebook": {
-                "configure": {"background": t.bg, "borderwidth": 0}
+                "configure": {
+                    "background": t.bg,
+                    "tabmargins": [2, 5, 2, 0],
+                }
             },
             "TNotebook.Tab": {
                 "configure": {
-                    "padding": [10, 4],
+                    "padding": [10, 5],
                     "background": t.surface,
                     "foreground": t.fg,
+                    "font": ("Helvetica", 10, "normal"),
                 },
                 "map": {
                     "background": [("selected", t.primary), ("active", t.button_active_bg)],
@@ -270,22 +409,6 @@ class ThemeManager:
                     "foreground": [("readonly", t.fg)],
                 }
             },
-            "TCombobox": {
-                "configure": {
-                    "fieldbackground": t.surface,
-                    "foreground": t.fg,
-                    "selectbackground": t.primary,
-                    "selectforeground": t.fg,
-                    "arrowcolor": t.fg,
-                    "arrowsize": 12,
-                },
-                "map": {
-                    "fieldbackground": [("readonly", t.surface)],
-                    "foreground": [("readonly", t.fg)],
-                    "selectbackground": [("readonly", t.primary)],
-                    "selectforeground": [("readonly", t.fg)],
-                }
-            },
             "TCheckbutton": {
                 "configure": {
                     "background": t.bg,
@@ -300,15 +423,6 @@ class ThemeManager:
                     "indicatormargin": 4,
                 }
             },
-            "TScale": {
-                "configure": {
-                    "background": t.bg,
-                    "troughcolor": t.surface,
-                    "bordercolor": t.fg,
-                    "darkcolor": t.primary,
-                    "lightcolor": t.primary,
-                }
-            },
             "TScrollbar": {
                 "configure": {
                     "background": t.surface,
@@ -347,85 +461,89 @@ class ThemeManager:
                     "darkcolor": t.primary,
                 }
             },
-            "TNotebook": {
-                "configure": {
-                    "background": t.bg,
-                    "tabmargins": [2, 5, 2, 0],
-                }
-            },
-            "TNotebook.Tab": {
-                "configure": {
-                    "padding": [10, 5],
-                    "background": t.surface,
-                    "foreground": t.fg,
-                    "font": ("Helvetica", 10, "normal"),
-                },
-                "map": {
-                    "background": [("selected", t.primary), ("active", t.button_active_bg)],
-                    "foreground": [("selected", t.fg), ("active", t.fg)],
-                }
-            },
+        }
+
+    def _lazy_style_specs(self) -> Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]:
+        """Build the on-demand style groups for the current theme."""
+        t = self.theme
+        return {
             "Treeview": {
-                "configure": {
-                    "background": t.surface,
-                    "foreground": t.fg,
-                    "fieldbackground": t.surface,
-                    "bordercolor": t.fg,
-                    "lightcolor": t.primary,
-                    "darkcolor": t.primary,
+                "Treeview": {
+                    "configure": {
+                        "background": t.surface,
+                        "foreground": t.fg,
+                        "fieldbackground": t.surface,
+                        "bordercolor": t.fg,
+                        "lightcolor": t.primary,
+                        "darkcolor": t.primary,
+                    },
+                    "map": {
+                        "background": [("selected", t.primary)],
+                        "foreground": [("selected", t.fg)],
+                    }
+                },
+                "Treeview.Item": {
+                    "configure": {
+                        "padding": [2, 4],
+                    }
+                },
+                "Treeview.Heading": {
+                    "configure": {
+                        "background": t.primary,
+                        "foreground": t.fg,
+                        "font": ("Helvetica", 10, "bold"),
+                        "relief": "raised",
+                        "borderwidth": 1,
+                    }
+                },
+                "Treeview.Cell": {
+                    "configure": {
+                        "padding": [4, 2],
+                    }
+                },
+                "Treeview.Row": {
+                    "configure": {
+                        "padding": [2, 1],
+                    }
+                },
+                "Treeview.Column": {
+                    "configure": {
+                        "padding": [4, 2],
+                    }
+                },
+                "Treeview.Field": {
+                    "configure": {
+                        "padding": [4, 2],
+                    }
                 },
-                "map": {
-                    "background": [("selected", t.primary)],
-                    "foreground": [("selected", t.fg)],
-                }
-            },
-            "Treeview.Item": {
-                "configure": {
-                    "padding": [2, 4],
-                }
-            },
-            "Treeview.Heading": {
-                "configure": {
-                    "background": t.primary,
-                    "foreground": t.fg,
-                    "font": ("Helvetica", 10, "bold"),
-                    "relief": "raised",
-                    "borderwidth": 1,
-                }
-            },
-            "Treeview.Cell": {
-                "configure": {
-                    "padding": [4, 2],
-                }
-            },
-            "Treeview.Row": {
-                "configure": {
-                    "padding": [2, 1],
-                }
-            },
-            "Treeview.Column": {
-                "configure": {
-                    "padding": [4, 2],
-                }
             },
-            "Treeview.Field": {
-                "configure": {
-                    "padding": [4, 2],
-                }
+            "TCombobox": {
+                "TCombobox": {
+                    "configure": {
+                        "fieldbackground": t.surface,
+                        "foreground": t.fg,
+                        "selectbackground": t.primary,
+                        "selectforeground": t.fg,
+                        "arrowcolor": t.fg,
+                        "arrowsize": 12,
+                    },
+                    "map": {
+                        "fieldbackground": [("readonly", t.surface)],
+                        "foreground": [("readonly", t.fg)],
+                        "selectbackground": [("readonly", t.primary)],
+                        "selectforeground": [("readonly", t.fg)],
+                    }
+                },
             },
-            "Treeview.Item": {
-                "configure": {
-                    "padding": [2, 4],
-                }
+            "TScale": {
+                "TScale": {
+                    "configure": {
+                        "background": t.bg,
+                        "troughcolor": t.surface,
+                        "bordercolor": t.fg,
+                        "darkcolor": t.primary,
+                        "lightcolor": t.primary,
+                    }
+                },
             },
         }
-
-        # Apply all styles
-        for style_name, config in base_style.items():
-            if "configure" in config:
-                self._style.configure(style_name, **config["configure"])
-            if "map" in config:
-                self._style.map(style_name, **config["map"])
-
-        # Configure root window
-        self._root.configure(bg=t.bg)
@@ -4,20 +4,22 @@ import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum, auto
-from typing import Optional, Callable, List, Dict, Any
+from typing import Optional, Callable, Dict, Any
 import logging
 
 logger = logging.getLogger(__name__)
 
+_NS_PER_SECOND = 1_000_000_000
+
 class TimerMode(Enum):
     """Timer modes."""
     WORK = auto()
     SHORT_BREAK = auto()
     LONG_BREAK = auto()
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TimerState:
-    """Current state of the timer."""
+    """Immutable snapshot of the timer state."""
     mode: TimerMode
     remaining: int  # seconds
     is_running: bool
@@ -28,9 +30,45 @@ class TimerState:
     long_break_duration: int
     long_break_interval: int
 
+# Next mode keyed by (current mode, whether a long break is due)
+_NEXT_MODE = {
+    (TimerMode.WORK, False): TimerMode.SHORT_BREAK,
+    (TimerMode.WORK, True): TimerMode.LONG_BREAK,
+    (TimerMode.SHORT_BREAK, False): TimerMode.WORK,
+    (TimerMode.LONG_BREAK, False): TimerMode.WORK,
+}
+
+_DURATION_ATTR = {
+    TimerMode.WORK: "work_duration",
+    TimerMode.SHORT_BREAK: "short_break_duration",
+    TimerMode.LONG_BREAK: "long_break_duration",
+}
+
+def _state_setting(name: str) -> property:
+    """Property for a setting that is part of the cached TimerState.
+
+    Assigning it drops the cached snapshot so the next ``state`` read sees
+    the new value.
+    """
+    attr = "_" + name
+
+    def fget(self):
+        return getattr(self, attr)
+
+    def fset(self, value):
+        setattr(self, attr, value)
+        self._state_cache = None
+
+    return property(fget, fset)
+
 class TimerService:
     """Manages the Pomodoro timer state and notifies observers of changes."""
     
+    work_duration = _state_setting("work_duration")
+    short_break_duration = _state_setting("short_break_duration")
+    long_break_duration = _state_setting("long_break_duration")
+    long_break_interval = _state_setting("long_break_interval")
+    
     def __init__(
         self,
         work_duration: int = 25 * 60,  # seconds
@@ -45,38 +83,53 @@ class TimerService:
         
         self._mode = TimerMode.WORK
         self._remaining = work_duration
+        self._remaining_ns = work_duration * _NS_PER_SECOND
         self._is_running = False
         self._current_cycle = 0
-        self._last_tick = None
-        self._observers: List[Callable[['TimerState'], None]] = []
+        self._end_ns: Optional[int] = None  # monotonic deadline while running
+        self._next_boundary_ns = 0  # when the displayed second next changes
+        # Insertion-ordered set of observers (dict keys give O(1) removal)
+        self._observers: Dict[Callable[['TimerState'], None], None] = {}
+        self._last_notified_remaining: Optional[int] = None
+        self._state_cache: Optional[TimerState] = None
+        # Tk widget driving update() via after(), see schedule_updates()
+        self._tk_root: Optional[Any] = None
+        self._after_id: Optional[str] = None
         
     @property
     def state(self) -> TimerState:
-        """Get the current timer state."""
-        return TimerState(
-            mode=self._mode,
-            remaining=self._remaining,
-            is_running=self._is_running,
-            current_cycle=self._current_cycle,
-            total_cycles=self.long_break_interval,
-            work_duration=self.work_duration,
-            short_break_duration=self.short_break_duration,
-            long_break_duration=self.long_break_duration,
-            long_break_interval=self.long_break_interval,
-        )
+        """Get the current timer state.
+
+        The snapshot is cached and only rebuilt after the timer changes.
+        """
+        if self._state_cache is None:
+            self._state_cache = TimerState(
+                mode=self._mode,
+                remaining=self._remaining,
+                is_running=self._is_running,
+                current_cycle=self._current_cycle,
+                total_cycles=self.long_break_interval,
+                work_duration=self.work_duration,
+                short_break_duration=self.short_break_duration,
+                long_break_duration=self.long_break_duration,
+                long_break_interval=self.long_break_interval,
+            )
+        return self._state_cache
     
     def add_observer(self, callback: Callable[[TimerState], None]) -> None:
         """Add an observer to be notified of timer state changes."""
-        self._observers.append(callback)
+        self._observers[callback] = None
     
     def remove_observer(self, callback: Callable[[TimerState], None]) -> None:
-        """Remove an observer."""
-        self._observers.remove(callback)
+        """Remove an observer. Unknown callbacks are ignored."""
+        self._observers.pop(callback, None)
     
     def _notify_observers(self) -> None:
         """Notify all observers of the current state."""
         state = self.state
-        for observer in self._observers:
+        self._last_notified_remaining = state.remaining
+        # Iterate over a snapshot so observers may unsubscribe themselves
+        for observer in tuple(self._observers):
             try:
                 observer(state)
             except Exception as e:
@@ -86,23 +139,26 @@ class TimerService:
         """Start the timer."""
         if not self._is_running:
             self._is_running = True
-            self._last_tick = time.monotonic()
+            self._state_cache = None
+            self._end_ns = time.monotonic_ns() + self._remaining_ns
+            self._next_boundary_ns = self._end_ns - max(0, self._remaining - 1) * _NS_PER_SECOND
+            self._schedule_next_update()
             self._notify_observers()
     
     def pause(self) -> None:
         """Pause the timer."""
         if self._is_running:
-            self._is_running = False
-            self._update_remaining()
-            self._notify_observers()
+            self._sync_remaining(time.monotonic_ns())
+            if self._is_running:  # the timer may have just completed
+                self._halt()
+                self._notify_observers()
     
     def reset(self) -> None:
         """Reset the timer to the initial state."""
-        self._is_running = False
+        self._halt()
         self._mode = TimerMode.WORK
         self._current_cycle = 0
-        self._remaining = self.work_duration
-        self._last_tick = None
+        self._set_remaining(self.work_duration)
         self._notify_observers()
     
     def toggle(self) -> None:
@@ -116,54 +172,109 @@ class TimerService:
         """Skip to the next timer phase."""
         self._advance_phase()
     
+    def _halt(self) -> None:
+        """Mark the timer as not running and drop its deadline."""
+        self._is_running = False
+        self._end_ns = None
+        self._state_cache = None
+        self._cancel_scheduled_update()
+
+    def _set_remaining(self, seconds: int) -> None:
+        """Set the remaining time of a stopped timer to whole seconds."""
+        self._remaining = seconds
+        self._state_cache = None
+        self._remaining_ns = seconds * _NS_PER_SECOND
+
     def _update_remaining(self) -> None:
-        """Update remaining time based on elapsed time since last tick."""
-        if self._is_running and self._last_tick is not None:
-            now = time.monotonic()
-            elapsed = now - self._last_tick
-            self._last_tick = now
-            
-            self._remaining = max(0, self._remaining - elapsed)
-            
-            if self._remaining <= 0:
-                self._on_timer_complete()
+        """Update remaining time from the monotonic deadline."""
+        if self._is_running and self._end_ns is not None:
+            now = time.monotonic_ns()
+            # Fast path: the displayed second cannot have changed yet
+            if now < self._next_boundary_ns:
+                return
+            self._sync_remaining(now)
+
+    def _sync_remaining(self, now: int) -> None:
+        """Recompute the exact remaining time of a running timer at ``now``."""
+        self._remaining_ns = max(0, self._end_ns - now)
+        # Round up so a freshly started timer shows its full duration
+        remaining = -(-self._remaining_ns // _NS_PER_SECOND)
+        if remaining != self._remaining:
+            self._remaining = remaining
+            self._state_cache = None
+        self._next_boundary_ns = self._end_ns - max(0, remaining - 1) * _NS_PER_SECOND
+        
+        if self._remaining_ns == 0:
+            self._on_timer_complete()
     
     def _on_timer_complete(self) -> None:
         """Handle timer completion."""
-        if self._mode == TimerMode.WORK:
-            self._current_cycle += 1
-            if self._current_cycle % self.long_break_interval == 0:
-                self._mode = TimerMode.LONG_BREAK
-                self._remaining = self.long_break_duration
-            else:
-                self._mode = TimerMode.SHORT_BREAK
-                self._remaining = self.short_break_duration
-        else:
-            self._mode = TimerMode.WORK
-            self._remaining = self.work_duration
-        
-        self._is_running = False
-        self._notify_observers()
+        self._transition_to_next_mode()
     
     def _advance_phase(self) -> None:
         """Advance to the next timer phase."""
-        if self._mode == TimerMode.WORK:
+        self._transition_to_next_mode()
+    
+    def _transition_to_next_mode(self) -> None:
+        """Stop the timer and move to the next mode in the Pomodoro cycle."""
+        is_work = self._mode is TimerMode.WORK
+        if is_work:
             self._current_cycle += 1
-            if self._current_cycle % self.long_break_interval == 0:
-                self._mode = TimerMode.LONG_BREAK
-                self._remaining = self.long_break_duration
-            else:
-                self._mode = TimerMode.SHORT_BREAK
-                self._remaining = self.short_break_duration
-        else:
-            self._mode = TimerMode.WORK
-            self._remaining = self.work_duration
+        long_break = is_work and self._current_cycle % self.long_break_interval == 0
+        self._mode = _NEXT_MODE[self._mode, long_break]
+        self._set_remaining(getattr(self, _DURATION_ATTR[self._mode]))
         
-        self._is_running = False
+        self._halt()
         self._notify_observers()
     
+    def schedule_updates(self, root: Any) -> None:
+        """Drive update() from a Tk event loop instead of polling it.
+
+        While the timer runs, update() is scheduled with ``root.after`` to
+        fire once per displayed second, right after the remaining time
+        crosses a whole-second boundary.
+
+        Args:
+            root: Any Tk widget, usually the application's root window
+        """
+        self._cancel_scheduled_update()
+        self._tk_root = root
+        if self._is_running:
+            self._schedule_next_update()
+
+    def _ms_until_next_second(self) -> int:
+        """Milliseconds until the displayed remaining time changes."""
+        until_boundary = max(0, self._next_boundary_ns - time.monotonic_ns())
+        return -(-until_boundary // 1_000_000)
+
+    def _schedule_next_update(self) -> None:
+        """Arm the next Tk-driven update if a root has been attached."""
+        if self._tk_root is not None and self._after_id is None:
+            self._after_id = self._tk_root.after(
+                self._ms_until_next_second(), self._on_scheduled_update
+            )
+
+    def _cancel_scheduled_update(self) -> None:
+        """Cancel a pending Tk-driven update."""
+        if self._after_id is not None:
+            self._tk_root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _on_scheduled_update(self) -> None:
+        """Run a scheduled update and re-arm while the timer is running."""
+        self._after_id = None
+        self.update()
+        if self._is_running:
+            self._schedule_next_update()
+
     def update(self) -> None:
-        """Update the timer state. Call this regularly from the main loop."""
+        """Update the timer state.
+
+        Either call this from the main loop or let schedule_updates() drive
+        it. Observers are only notified when the whole-second remaining time
+        changes; completion notifies on its own.
+        """
         if self._is_running:
             self._update_remaining()
-            self._notify_observers()
+            if self._is_running and self._remaining != self._last_notified_remaining:
+                self._notify_observers()
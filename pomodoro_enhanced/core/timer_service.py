@@ -1,12 +1,135 @@
+import heapq
+import itertools
+import math
+import queue
 import time
 import threading
 from datetime import datetime, timedelta
 from enum import Enum, auto
-from typing import Optional, Callable, Dict, Any, List
+from typing import Optional, Callable, Dict, Any, List, Tuple
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from .models import TimerMode, PomodoroSession, Task
 
+_NS_PER_SECOND = 1_000_000_000
+_now = datetime.now
+
+# Time-only updates closer together than this are coalesced into one
+_MIN_NOTIFY_INTERVAL_NS = 200_000_000
+
+logger = logging.getLogger(__name__)
+
+# Session persistence runs on a single background worker so disk I/O stays off
+# the caller's thread; the FIFO queue keeps jobs in submission order.
+_persist_queue: "queue.SimpleQueue[Tuple[Callable[..., Any], tuple]]" = queue.SimpleQueue()
+_persist_worker: Optional[threading.Thread] = None
+_persist_worker_lock = threading.Lock()
+
+def _persist_worker_loop() -> None:
+    """Run queued persistence jobs forever."""
+    while True:
+        func, args = _persist_queue.get()
+        try:
+            func(*args)
+        except Exception:
+            logger.exception("Error in background persistence job")
+
+def _submit_persist_job(func: Callable[..., Any], *args: Any) -> None:
+    """Queue a job for the persistence worker, starting it on first use."""
+    global _persist_worker
+    with _persist_worker_lock:
+        if _persist_worker is None or not _persist_worker.is_alive():
+            _persist_worker = threading.Thread(
+                target=_persist_worker_loop, name="pomodoro-persist", daemon=True
+            )
+            _persist_worker.start()
+    _persist_queue.put((func, args))
+
+def flush_persistence(timeout: Optional[float] = None) -> bool:
+    """Block until every queued persistence job has run.
+
+    Returns:
+        bool: False if the timeout expired first
+    """
+    done = threading.Event()
+    _submit_persist_job(done.set)
+    return done.wait(timeout)
+
+class _ScheduledCall:
+    """Handle for a callback queued on the shared deadline scheduler."""
+    
+    __slots__ = ('callback', 'cancelled')
+    
+    def __init__(self, callback: Callable[[], None]):
+        self.callback = callback
+        self.cancelled = False
+    
+    def cancel(self) -> None:
+        """Tombstone the call; the scheduler drops it when it surfaces."""
+        self.cancelled = True
+
+class _Scheduler:
+    """Runs callbacks at monotonic deadlines from a single shared thread.
+    
+    Pending calls sit in a heap ordered by deadline, so any number of timers
+    cost one thread, and the thread sleeps exactly until the nearest deadline.
+    Cancelled calls stay in the heap and are skipped when they reach the top.
+    """
+    
+    def __init__(self):
+        self._heap: List[Tuple[int, int, _ScheduledCall]] = []
+        self._counter = itertools.count()  # tie-breaker for equal deadlines
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+    
+    def schedule(self, deadline_ns: int, callback: Callable[[], None]) -> _ScheduledCall:
+        """Run ``callback`` on the scheduler thread once ``deadline_ns`` passes.
+        
+        Args:
+            deadline_ns: Deadline on the time.monotonic_ns() clock
+            callback: Function to call with no arguments
+            
+        Returns:
+            _ScheduledCall: Handle whose cancel() drops the call
+        """
+        call = _ScheduledCall(callback)
+        with self._condition:
+            heapq.heappush(self._heap, (deadline_ns, next(self._counter), call))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="pomodoro-timer", daemon=True
+                )
+                self._thread.start()
+            elif self._heap[0][2] is call:
+                # New earliest deadline: wake the thread so it sleeps less
+                self._condition.notify()
+        return call
+    
+    def _run(self) -> None:
+        """Pop and run due calls, sleeping until the nearest deadline."""
+        heap = self._heap
+        while True:
+            with self._condition:
+                while True:
+                    while heap and heap[0][2].cancelled:
+                        heapq.heappop(heap)
+                    if not heap:
+                        self._condition.wait()
+                        continue
+                    wait_ns = heap[0][0] - time.monotonic_ns()
+                    if wait_ns <= 0:
+                        break
+                    self._condition.wait(wait_ns / _NS_PER_SECOND)
+                call = heapq.heappop(heap)[2]
+            if call.cancelled:
+                continue
+            try:
+                call.callback()
+            except Exception:
+                logger.exception("Error in scheduled timer callback")
+
+_scheduler = _Scheduler()
+
 class TimerState(Enum):
     """Possible states of the Pomodoro timer."""
     STOPPED = auto()
@@ -14,9 +137,13 @@ class TimerState(Enum):
     PAUSED = auto()
     COMPLETED = auto()
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimerUpdate:
-    """Data class for timer update events."""
+    """Data class for timer update events.
+
+    Instances are immutable, so callbacks may keep a reference or hand it to
+    another thread.
+    """
     time_left: int  # seconds
     mode: TimerMode
     state: TimerState
@@ -49,6 +176,7 @@ class TimerService:
         self.work_duration = self.settings.work_duration * 60
         self.short_break_duration = self.settings.short_break_duration * 60
         self.long_break_duration = self.settings.long_break_duration * 60
+        self.reload_settings()
         
         # Session tracking
         self.current_cycle = 0
@@ -56,18 +184,36 @@ class TimerService:
         self.current_session: Optional[PomodoroSession] = None
         self.current_task: Optional[Task] = None
         
-        # Threading
-        self._timer_thread: Optional[threading.Thread] = None
-        self._stop_event = threading.Event()
-        self._paused = False
-        self._paused_event = threading.Event()
-        self._paused_event.set()  # Start not paused
+        # Scheduling (ticks run on the shared _scheduler thread)
+        self._tick: Optional[_ScheduledCall] = None  # pending tick or auto-start
+        self._deadline_ns = 0  # monotonic_ns at which the running timer completes
+        self._last_emit_key: Optional[tuple] = None  # last notified (second, state, mode, cycle)
+        self._min_notify_interval_ns = _MIN_NOTIFY_INTERVAL_NS
+        self._last_notify_ns = 0
+        self._pending_notify: Optional[_ScheduledCall] = None  # trailing debounced update
+        self._update_template = TimerUpdate(
+            time_left=0,
+            mode=self.mode,
+            state=self.state,
+            current_cycle=self.current_cycle,
+            total_cycles=self.total_cycles,
+        )
         
-        # Callbacks
-        self._update_callbacks: List[Callable[[TimerUpdate], None]] = []
-        self._mode_change_callbacks: List[Callable[[TimerMode], None]] = []
-        self._state_change_callbacks: List[Callable[[TimerState], None]] = []
-        self._session_complete_callbacks: List[Callable[[PomodoroSession], None]] = []
+        # Callbacks live in insertion-ordered dicts (O(1) membership) keyed by
+        # the callback itself. Each change republishes an immutable tuple
+        # snapshot under _callbacks_lock so the timer thread can iterate the
+        # _*_callbacks attributes without locking.
+        self._callbacks_lock = threading.Lock()
+        self._callback_registry: Dict[str, Dict[Callable[..., None], None]] = {
+            '_update_callbacks': {},
+            '_mode_change_callbacks': {},
+            '_state_change_callbacks': {},
+            '_session_complete_callbacks': {},
+        }
+        self._update_callbacks: Tuple[Callable[[TimerUpdate], None], ...] = ()
+        self._mode_change_callbacks: Tuple[Callable[[TimerMode], None], ...] = ()
+        self._state_change_callbacks: Tuple[Callable[[TimerState], None], ...] = ()
+        self._session_complete_callbacks: Tuple[Callable[[PomodoroSession], None], ...] = ()
     
     # Public API
     
@@ -80,25 +226,14 @@ class TimerService:
         self.current_task = task
         
         if self.state == TimerState.STOPPED:
-            # Start a new session
-            self.current_session = PomodoroSession(
-                task_id=task.id if task else None,
-                mode=self.mode,
-                start_time=datetime.now()
-            )
+            self._begin_session()
             self.logger.info(f"Started new {self.mode.name} session")
         else:  # Resuming from paused
             self.logger.info(f"Resumed {self.mode.name} session")
         
         self.state = TimerState.RUNNING
-        self._stop_event.clear()
-        self._paused = False
-        self._paused_event.set()
-        
-        # Start the timer thread if not already running
-        if not self._timer_thread or not self._timer_thread.is_alive():
-            self._timer_thread = threading.Thread(target=self._run_timer, daemon=True)
-            self._timer_thread.start()
+        self._deadline_ns = time.monotonic_ns() + round(self.time_left * _NS_PER_SECOND)
+        self._schedule_tick()
         
         self._notify_state_change()
         self._notify_update()
@@ -111,12 +246,12 @@ class TimerService:
             return False
             
         self.state = TimerState.PAUSED
-        self._paused = True
-        self._paused_event.clear()
+        self.time_left = self._remaining_ns() / _NS_PER_SECOND
+        self._cancel_tick()
         
         # Record the pause time for accurate duration calculation
         if self.current_session:
-            self.current_session.pause_time = datetime.now()
+            self.current_session.pause_time = _now()
         
         self.logger.info("Timer paused")
         self._notify_state_change()
@@ -134,31 +269,11 @@ class TimerService:
             
         self.logger.info(f"Stopping timer (completed: {completed})")
         
-        # Complete the current session
-        if self.current_session:
-            self.current_session.complete()
-            self.current_session.was_completed = completed
-            
-            # Save the session
-            self.data_manager.add_session(self.current_session)
-            
-            # Update task stats if there's an associated task
-            if self.current_task and completed and self.mode == TimerMode.WORK:
-                self.current_task.time_spent += self.work_duration
-                self.current_task.pomodoros_completed += 1
-                self.data_manager.update_task(self.current_task)
-            
-            # Notify listeners
-            self._notify_session_complete(self.current_session)
-            
-            # Clean up
-            self.current_session = None
+        self._complete_current_session(completed)
         
         # Reset timer state
         self.state = TimerState.STOPPED
-        self._stop_event.set()
-        self._paused = False
-        self._paused_event.set()
+        self._cancel_tick()
         
         # If completed naturally, move to next mode
         if completed:
@@ -223,64 +338,183 @@ class TimerService:
         self._notify_update()
         return True
     
+    def get_time_left(self) -> float:
+        """Seconds left in the current period, computed on demand.
+        
+        Unlike ``time_left``, this is exact while the timer is running even
+        when no update callbacks (and so no per-second ticks) are registered.
+        """
+        if self.state == TimerState.RUNNING:
+            return self._remaining_ns() / _NS_PER_SECOND
+        return self.time_left
+    
+    def reload_settings(self, settings=None) -> None:
+        """Refresh the cached auto-start and long-break settings.
+        
+        Call after the settings have been edited and saved.
+        
+        Args:
+            settings: Optional new TimerSettings to use from now on
+        """
+        if settings is not None:
+            self.settings = settings
+        self._auto_start_breaks = bool(self.settings.auto_start_breaks)
+        self._auto_start_pomodoros = bool(self.settings.auto_start_pomodoros)
+        self._long_break_interval = int(self.settings.long_break_interval)
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for pending session saves, e.g. before shutting down.
+        
+        Returns:
+            bool: False if the timeout expired first
+        """
+        return flush_persistence(timeout)
+    
     # Callback registration
     
     def register_update_callback(self, callback: Callable[[TimerUpdate], None]) -> None:
         """Register a callback for timer updates."""
-        if callback not in self._update_callbacks:
-            self._update_callbacks.append(callback)
+        self._add_callback('_update_callbacks', callback)
+        if self.state == TimerState.RUNNING:
+            # Switch from deadline-only to per-second ticks
+            self._schedule_tick()
     
     def unregister_update_callback(self, callback: Callable[[TimerUpdate], None]) -> None:
         """Unregister a timer update callback."""
-        if callback in self._update_callbacks:
-            self._update_callbacks.remove(callback)
+        self._remove_callback('_update_callbacks', callback)
     
     def register_mode_change_callback(self, callback: Callable[[TimerMode], None]) -> None:
         """Register a callback for mode changes."""
-        if callback not in self._mode_change_callbacks:
-            self._mode_change_callbacks.append(callback)
+        self._add_callback('_mode_change_callbacks', callback)
     
     def register_state_change_callback(self, callback: Callable[[TimerState], None]) -> None:
         """Register a callback for state changes."""
-        if callback not in self._state_change_callbacks:
-            self._state_change_callbacks.append(callback)
+        self._add_callback('_state_change_callbacks', callback)
     
     def register_session_complete_callback(self, callback: Callable[[PomodoroSession], None]) -> None:
         """Register a callback for session completion."""
-        if callback not in self._session_complete_callbacks:
-            self._session_complete_callbacks.append(callback)
+        self._add_callback('_session_complete_callbacks', callback)
     
     # Private methods
     
-    def _run_timer(self) -> None:
-        """Main timer loop."""
-        last_update = time.time()
+    def _add_callback(self, attr: str, callback: Callable[..., None]) -> None:
+        """Add ``callback`` to a registry and republish its snapshot."""
+        with self._callbacks_lock:
+            registry = self._callback_registry[attr]
+            if callback not in registry:
+                registry[callback] = None
+                setattr(self, attr, tuple(registry))
+    
+    def _remove_callback(self, attr: str, callback: Callable[..., None]) -> None:
+        """Remove ``callback`` from a registry and republish its snapshot."""
+        with self._callbacks_lock:
+            registry = self._callback_registry[attr]
+            if callback in registry:
+                del registry[callback]
+                setattr(self, attr, tuple(registry))
+    
+    def _schedule_tick(self) -> None:
+        """Schedule the next tick for when the displayed second changes.
         
-        while not self._stop_event.is_set():
-            current_time = time.time()
-            elapsed = current_time - last_update
-            last_update = current_time
-            
-            if self.state == TimerState.RUNNING and not self._paused:
-                self.time_left = max(0, self.time_left - elapsed)
-                
-                # Notify listeners of the update
-                self._notify_update()
-                
-                # Check if timer has completed
-                if self.time_left <= 0:
-                    self.logger.info(f"Timer completed: {self.mode.name}")
-                    self.stop(completed=True)
-                    
-                    # Auto-start next timer if configured
-                    if (self.mode == TimerMode.WORK and self.settings.auto_start_breaks) or \
-                       (self.mode != TimerMode.WORK and self.settings.auto_start_pomodoros):
-                        # Small delay before starting next timer
-                        time.sleep(1)
-                        self.start(task=self.current_task)
-            
-            # Sleep to prevent high CPU usage
-            time.sleep(0.1)
+        With no update callbacks registered nobody needs per-second ticks,
+        so the only wakeup is at the deadline itself.
+        """
+        self._cancel_tick()
+        if not self._update_callbacks:
+            self._tick = _scheduler.schedule(self._deadline_ns, self._on_tick)
+            return
+        remaining_ns = self._remaining_ns()
+        boundary_ns = (-(-remaining_ns // _NS_PER_SECOND) - 1) * _NS_PER_SECOND
+        self._tick = _scheduler.schedule(
+            self._deadline_ns - max(0, boundary_ns), self._on_tick
+        )
+    
+    def _cancel_tick(self) -> None:
+        """Drop any pending tick or auto-start."""
+        if self._tick is not None:
+            self._tick.cancel()
+            self._tick = None
+    
+    def _on_tick(self) -> None:
+        """Update the countdown; runs on the scheduler thread."""
+        if self.state != TimerState.RUNNING:
+            return
+        
+        self.time_left = self._remaining_ns() / _NS_PER_SECOND
+        
+        # Notify listeners of the update
+        self._notify_update()
+        
+        if self.time_left > 0:
+            self._schedule_tick()
+            return
+        
+        self.logger.info(f"Timer completed: {self.mode.name}")
+        self._complete_current_session(True)
+        self._tick = None
+        self._next_mode()
+        
+        # Auto-start the next period if configured, staying RUNNING throughout
+        auto_start = (self._auto_start_pomodoros if self.mode == TimerMode.WORK
+                      else self._auto_start_breaks)
+        if auto_start:
+            self._begin_session()
+            self.logger.info(f"Auto-started {self.mode.name} session")
+            self._deadline_ns = time.monotonic_ns() + round(self.time_left * _NS_PER_SECOND)
+            self._schedule_tick()
+            self._notify_update()
+            return
+        
+        self.state = TimerState.STOPPED
+        self._notify_state_change()
+        self._notify_update()
+    
+    def _begin_session(self) -> None:
+        """Open a new session record for the current mode and task."""
+        task = self.current_task
+        self.current_session = PomodoroSession(
+            task_id=task.id if task else None,
+            mode=self.mode,
+            start_time=_now()
+        )
+    
+    def _complete_current_session(self, completed: bool) -> None:
+        """Close the current session and queue it for saving.
+        
+        Args:
+            completed: Whether the period ran to the end
+        """
+        session = self.current_session
+        if not session:
+            return
+        
+        session.complete()
+        session.was_completed = completed
+        
+        # Update task stats if there's an associated task
+        task = None
+        if self.current_task and completed and self.mode == TimerMode.WORK:
+            task = self.current_task
+            task.time_spent += self.work_duration
+            task.pomodoros_completed += 1
+        
+        # Save in the background; listeners are notified once it is stored
+        _submit_persist_job(self._persist_session, session, task)
+        self.current_session = None
+    
+    def _persist_session(self, session: PomodoroSession, task: Optional[Task]) -> None:
+        """Store a finished session (and its task) and notify listeners.
+        
+        Runs on the persistence worker thread.
+        """
+        self.data_manager.add_session(session)
+        if task is not None:
+            self.data_manager.update_task(task)
+        self._notify_session_complete(session)
+    
+    def _remaining_ns(self) -> int:
+        """Nanoseconds left until the running timer's deadline."""
+        return max(0, self._deadline_ns - time.monotonic_ns())
     
     def _next_mode(self) -> None:
         """Transition to the next mode in the Pomodoro cycle."""
@@ -290,7 +524,7 @@ class TimerService:
             self.current_cycle += 1
             
             # Check if it's time for a long break
-            if self.current_cycle % self.settings.long_break_interval == 0:
+            if self.current_cycle % self._long_break_interval == 0:
                 self.mode = TimerMode.LONG_BREAK
                 self.time_left = self.long_break_duration
             else:
@@ -307,42 +541,75 @@ class TimerService:
     # Notification methods
     
     def _notify_update(self) -> None:
-        """Notify all registered callbacks of a timer update."""
-        update = TimerUpdate(
-            time_left=int(self.time_left),
+        """Notify all registered callbacks of a timer update.
+
+        Skipped when the displayed second, state, mode and cycle are the
+        same as in the previous notification. Changes to the time alone that
+        arrive within the debounce interval are held back and delivered once
+        the interval has passed; state, mode and cycle changes and the final
+        zero always go out immediately.
+        """
+        seconds = math.ceil(self.time_left)
+        key = (seconds, self.state, self.mode, self.current_cycle)
+        last_key = self._last_emit_key
+        if key == last_key:
+            return
+        
+        now_ns = time.monotonic_ns()
+        if (seconds and last_key is not None and key[1:] == last_key[1:]
+                and now_ns - self._last_notify_ns < self._min_notify_interval_ns):
+            if self._pending_notify is None:
+                self._pending_notify = _scheduler.schedule(
+                    self._last_notify_ns + self._min_notify_interval_ns,
+                    self._flush_pending_notify,
+                )
+            return
+        
+        if self._pending_notify is not None:
+            self._pending_notify.cancel()
+            self._pending_notify = None
+        self._last_emit_key = key
+        self._last_notify_ns = now_ns
+        
+        # Derive this update from the immutable template
+        update = replace(
+            self._update_template,
+            time_left=seconds,
             mode=self.mode,
             state=self.state,
             current_cycle=self.current_cycle,
             total_cycles=self.total_cycles,
-            current_task=self.current_task
+            current_task=self.current_task,
         )
         
-        for callback in self._update_callbacks:
-            try:
-                callback(update)
-            except Exception as e:
-                self.logger.error(f"Error in update callback: {e}")
+        self._dispatch(self._update_callbacks, update, self.logger, "update")
+    
+    def _flush_pending_notify(self) -> None:
+        """Deliver an update held back by the debounce interval."""
+        self._pending_notify = None
+        self._notify_update()
     
     def _notify_mode_change(self) -> None:
         """Notify all registered callbacks of a mode change."""
-        for callback in self._mode_change_callbacks:
-            try:
-                callback(self.mode)
-            except Exception as e:
-                self.logger.error(f"Error in mode change callback: {e}")
+        self._dispatch(self._mode_change_callbacks, self.mode, self.logger, "mode change")
     
     def _notify_state_change(self) -> None:
         """Notify all registered callbacks of a state change."""
-        for callback in self._state_change_callbacks:
-            try:
-                callback(self.state)
-            except Exception as e:
-                self.logger.error(f"Error in state change callback: {e}")
+        self._dispatch(self._state_change_callbacks, self.state, self.logger, "state change")
     
     def _notify_session_complete(self, session: PomodoroSession) -> None:
         """Notify all registered callbacks of a completed session."""
-        for callback in self._session_complete_callbacks:
+        self._dispatch(self._session_complete_callbacks, session, self.logger, "session complete")
+    
+    @staticmethod
+    def _dispatch(callbacks: Tuple[Callable[[Any], None], ...], arg: Any,
+                  log: logging.Logger, kind: str) -> None:
+        """Call each callback with ``arg``, logging (not raising) failures.
+        
+        A failing callback does not stop the remaining ones from running.
+        """
+        for callback in callbacks:
             try:
-                callback(session)
-            except Exception as e:
-                self.logger.error(f"Error in session complete callback: {e}")
+                callback(arg)
+            except Exception:
+                log.exception("Error in %s callback", kind)
@@ -3,21 +3,85 @@ Update management for the Enhanced Pomodoro Timer.
 Handles checking for and applying application updates.
 """
 
+import base64
+import hashlib
+import http.client
 import json
 import logging
+import os
 import platform
+import shutil
+import ssl
 import subprocess
 import sys
 import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, Callable
-from urllib.request import urlopen, Request
-from urllib.error import URLError
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass, urlopen, Request
+from urllib.error import HTTPError, URLError
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Buffer sizes for streaming downloads to disk
+_COPY_BUFFER_SIZE = 1024 * 1024
+_PROGRESS_CHUNK_SIZE = 256 * 1024
+
+_EXTRACT_WORKERS = 4
+
+# Written into the app dir by a portable update; lists paths to delete on next launch
+_CLEANUP_MARKER = '.cleanup'
+
+_REDIRECT_CODES = frozenset((301, 302, 303, 307, 308))
+_MAX_REDIRECTS = 5
+
+class _HashingWriter:
+    """File wrapper that feeds every written block to a hash object."""
+    
+    __slots__ = ('_file', '_hash')
+    
+    def __init__(self, file, hash_obj):
+        self._file = file
+        self._hash = hash_obj
+    
+    def write(self, data) -> int:
+        self._hash.update(data)
+        return self._file.write(data)
+
+# Platform details never change while the process runs, so look them up once
+_OS = platform.system().lower()
+_ARCH_RAW = platform.machine().lower()
+_ARCH = {
+    'x86_64': 'x64',
+    'amd64': 'x64',
+    'i386': 'x86',
+    'i686': 'x86',
+    'x86': 'x86',
+    'arm64': 'arm64',
+    'aarch64': 'arm64',
+}.get(_ARCH_RAW, _ARCH_RAW)
+
+def _find_proxy(scheme: str, netloc: str) -> Optional[Tuple[str, Dict[str, str]]]:
+    """Return the proxy host and its auth headers for a request, if one applies.
+    
+    Proxies come from the same environment/system settings urlopen uses.
+    """
+    proxy = getproxies().get(scheme)
+    if not proxy or proxy_bypass(netloc):
+        return None
+    if '://' not in proxy:
+        proxy = 'http://' + proxy
+    parts = urlsplit(proxy)
+    headers = {}
+    if parts.username is not None:
+        credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        token = base64.b64encode(credentials.encode()).decode('ascii')
+        headers['Proxy-Authorization'] = f'Basic {token}'
+    return parts.netloc.rpartition('@')[2], headers
+
 class UpdateManager:
     """Manages application updates."""
     
@@ -25,7 +89,8 @@ class UpdateManager:
                  current_version: str,
                  update_url: str,
                  app_name: str = "Enhanced Pomodoro Timer",
-                 app_dir: Optional[Path] = None):
+                 app_dir: Optional[Path] = None,
+                 ca_file: Optional[Path] = None):
         """Initialize the update manager.
         
         Args:
@@ -33,12 +98,23 @@ class UpdateManager:
             update_url: Base URL for checking updates
             app_name: Application name
             app_dir: Application directory (for portable updates)
+            ca_file: PEM bundle to trust for HTTPS instead of the system store
         """
         self.current_version = current_version
         self.update_url = update_url.rstrip('/')
         self.app_name = app_name
         self.app_dir = app_dir or Path(sys.executable).parent
         self._update_info: Optional[Dict[str, Any]] = None
+        self._user_agent = f'{app_name}/{current_version}'
+        self._check_cache_path = self.app_dir / '.update_cache.json'
+        
+        self._ssl_context = self._create_ssl_context(ca_file)
+        
+        # Keep-alive connection shared by the check and download requests
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._conn_key: Optional[Tuple[str, str]] = None
+        # Headers for a plain HTTP proxy, which takes absolute request URLs
+        self._forward_headers: Optional[Dict[str, str]] = None
     
     def check_for_updates(self, beta: bool = False) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """Check for available updates.
@@ -50,34 +126,46 @@ class UpdateManager:
             Tuple of (update_available, update_info)
         """
         try:
-            # Build the update URL
-            os_name = platform.system().lower()
-            arch = platform.machine().lower()
-            
-            # Map common architecture names
-            if arch in ('x86_64', 'amd64'):
-                arch = 'x64'
-            elif arch in ('i386', 'i686', 'x86'):
-                arch = 'x86'
-            elif arch in ('arm64', 'aarch64'):
-                arch = 'arm64'
-            
             # Create request with user agent
             headers = {
-                'User-Agent': f'{self.app_name}/{self.current_version}',
+                'User-Agent': self._user_agent,
                 'Accept': 'application/json'
             }
             
             # Check for updates
-            check_url = f"{self.update_url}/check?version={self.current_version}&os={os_name}&arch={arch}"
+            check_url = f"{self.update_url}/check?version={self.current_version}&os={_OS}&arch={_ARCH}"
             if beta:
                 check_url += "&beta=true"
             
             logger.info(f"Checking for updates at {check_url}")
             
-            req = Request(check_url, headers=headers)
-            with urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode('utf-8'))
+            # Revalidate the last response instead of refetching it
+            cache = self._load_check_cache()
+            if cache.get('url') != check_url:
+                cache = {}
+            if cache.get('etag'):
+                headers['If-None-Match'] = cache['etag']
+            if cache.get('last_modified'):
+                headers['If-Modified-Since'] = cache['last_modified']
+            
+            with self._open(check_url, headers, timeout=10) as response:
+                not_modified = response.status == 304 and 'data' in cache
+                body = response.read()
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+            
+            if not_modified:
+                logger.info("Update manifest not modified; using cached response")
+                data = cache['data']
+            else:
+                data = json.loads(body.decode('utf-8'))
+                if etag or last_modified:
+                    self._save_check_cache({
+                        'url': check_url,
+                        'etag': etag,
+                        'last_modified': last_modified,
+                        'data': data,
+                    })
             
             # Check if update is available
             if not isinstance(data, dict) or 'success' not in data:
@@ -103,12 +191,133 @@ class UpdateManager:
             return True, self._update_info
             
         except URLError as e:
+            self._close_connection()
             logger.error(f"Network error checking for updates: {e}")
             return False, None
         except Exception as e:
+            self._close_connection()
             logger.error(f"Error checking for updates: {e}", exc_info=True)
             return False, None
     
+    def close(self) -> None:
+        """Close the kept-alive connection to the update server."""
+        self._close_connection()
+    
+    def _open(self, url: str, headers: Dict[str, str], timeout: float):
+        """GET ``url``, reusing the open connection to the same host.
+        
+        Redirects are followed, and configured HTTP(S) proxies are used.
+        Non-HTTP(S) URLs fall back to urlopen.
+        The caller must read the response to the end (or close the
+        connection) before the next request.
+        
+        Raises:
+            HTTPError: If the server answers with a 4xx/5xx status
+        """
+        for _ in range(_MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            if parts.scheme not in ('http', 'https'):
+                return urlopen(Request(url, headers=headers), timeout=timeout)
+            
+            path = parts.path or '/'
+            if parts.query:
+                path += '?' + parts.query
+            
+            reused = self._conn is not None and self._conn_key == (parts.scheme, parts.netloc)
+            conn = self._get_connection(parts.scheme, parts.netloc, timeout)
+            if self._forward_headers is not None:
+                path = url
+                headers = {**headers, **self._forward_headers}
+            try:
+                conn.request('GET', path, headers=headers)
+                response = conn.getresponse()
+            except (OSError, http.client.HTTPException):
+                self._close_connection()
+                if not reused:
+                    raise
+                # The server dropped the idle connection; retry on a fresh one
+                conn = self._get_connection(parts.scheme, parts.netloc, timeout)
+                conn.request('GET', path, headers=headers)
+                response = conn.getresponse()
+            
+            location = response.headers.get('Location')
+            if response.status in _REDIRECT_CODES and location:
+                response.read()
+                url = urljoin(url, location)
+                continue
+            if response.status >= 400:
+                response.read()
+                raise HTTPError(url, response.status, response.reason,
+                                response.headers, None)
+            return response
+        
+        raise URLError(f"Too many redirects fetching {url}")
+    
+    def _get_connection(self, scheme: str, netloc: str,
+                        timeout: float) -> http.client.HTTPConnection:
+        """Return the open connection for ``scheme://netloc``, creating it if needed.
+        
+        Through a proxy, HTTPS is tunnelled with CONNECT; plain HTTP goes to
+        the proxy itself and _open sends the absolute URL.
+        """
+        key = (scheme, netloc)
+        if self._conn is None or self._conn_key != key:
+            self._close_connection()
+            proxy = _find_proxy(scheme, netloc)
+            host = netloc if proxy is None else proxy[0]
+            if scheme == 'https':
+                self._conn = http.client.HTTPSConnection(
+                    host, timeout=timeout, context=self._ssl_context
+                )
+                if proxy is not None:
+                    self._conn.set_tunnel(netloc, headers=proxy[1])
+            else:
+                self._conn = http.client.HTTPConnection(host, timeout=timeout)
+                if proxy is not None:
+                    self._forward_headers = proxy[1]
+            self._conn_key = key
+        else:
+            self._conn.timeout = timeout
+            if self._conn.sock is not None:
+                self._conn.sock.settimeout(timeout)
+        return self._conn
+    
+    @staticmethod
+    def _create_ssl_context(ca_file: Optional[Path]) -> ssl.SSLContext:
+        """Build the TLS context used for update requests.
+        
+        With ``ca_file`` only that bundle is trusted, and a missing file is
+        an error rather than a silent fallback to the system trust store.
+        """
+        if ca_file is None:
+            return ssl.create_default_context()
+        return ssl.create_default_context(cafile=str(ca_file))
+    
+    def _close_connection(self) -> None:
+        """Drop the kept-alive connection, if any."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self._conn_key = None
+            self._forward_headers = None
+    
+    def _load_check_cache(self) -> Dict[str, Any]:
+        """Load the cached update check response, if any."""
+        try:
+            with open(self._check_cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_check_cache(self, cache: Dict[str, Any]) -> None:
+        """Persist the update check response with its validators."""
+        try:
+            with open(self._check_cache_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+        except OSError as e:
+            logger.warning(f"Could not write update cache: {e}")
+    
     def download_update(self, 
                        progress_callback: Optional[Callable[[int, int], None]] = None) -> bool:
         """Download the available update.
@@ -128,45 +337,68 @@ class UpdateManager:
             logger.error("No download URL available in update info")
             return False
         
+        expected_sha256 = self._update_info.get('sha256')
+        if not expected_sha256:
+            logger.warning("Update info has no sha256; download will not be verified")
+        
+        temp_path: Optional[Path] = None
         try:
             # Create a temporary file for the download
             with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as temp_file:
                 temp_path = Path(temp_file.name)
                 
+                # Hash while streaming so verification needs no second pass
+                digest = hashlib.sha256()
+                
                 # Download the update
                 logger.info(f"Downloading update from {download_url}")
                 
-                req = Request(download_url, headers={'User-Agent': f'{self.app_name}/{self.current_version}'})
-                with urlopen(req, timeout=30) as response:
+                headers = {'User-Agent': self._user_agent}
+                with self._open(download_url, headers, timeout=30) as response:
                     # Get file size for progress tracking
                     total_size = int(response.headers.get('content-length', 0))
-                    received = 0
                     
-                    # Download chunks and write to file
-                    chunk_size = 8192
-                    while True:
-                        chunk = response.read(chunk_size)
-                        if not chunk:
-                            break
+                    if progress_callback is None or total_size <= 0:
+                        # No progress to report: let shutil stream in large blocks
+                        shutil.copyfileobj(response, _HashingWriter(temp_file, digest),
+                                           length=_COPY_BUFFER_SIZE)
+                        received = temp_file.tell()
+                    else:
+                        # Download chunks, reporting progress in ~1% steps
+                        received = 0
+                        last_reported = 0
+                        report_step = max(1, total_size // 100)
+                        while True:
+                            chunk = response.read(_PROGRESS_CHUNK_SIZE)
+                            if not chunk:
+                                break
+                            
+                            temp_file.write(chunk)
+                            digest.update(chunk)
+                            received += len(chunk)
                             
-                        temp_file.write(chunk)
-                        received += len(chunk)
-                        
-                        # Call progress callback if provided
-                        if progress_callback and total_size > 0:
-                            progress_callback(received, total_size)
+                            if received - last_reported >= report_step or received >= total_size:
+                                progress_callback(received, total_size)
+                                last_reported = received
                 
                 logger.info(f"Downloaded {received} bytes to {temp_path}")
                 
+                if expected_sha256 and digest.hexdigest() != expected_sha256.lower():
+                    raise ValueError(
+                        f"SHA-256 mismatch: expected {expected_sha256}, "
+                        f"got {digest.hexdigest()}"
+                    )
+                
                 # Store the downloaded file path
                 self._update_info['downloaded_file'] = temp_path
                 
                 return True
                 
         except Exception as e:
+            self._close_connection()
             logger.error(f"Error downloading update: {e}", exc_info=True)
             # Clean up partially downloaded file
-            if 'downloaded_file' in locals() and temp_path.exists():
+            if temp_path is not None and temp_path.exists():
                 try:
                     temp_path.unlink()
                 except Exception as cleanup_error:
@@ -217,14 +449,17 @@ class UpdateManager:
         """
         try:
             # On Windows, we might have an installer executable
-            if platform.system().lower() == 'windows' and update_file.suffix.lower() == '.exe':
+            if _OS == 'windows' and update_file.suffix.lower() == '.exe':
                 logger.info("Launching installer...")
-                subprocess.Popen([str(update_file), '/SILENT', '/NORESTART'], 
-                               shell=True)
+                # Launch directly (no cmd.exe) and detach so we can exit
+                subprocess.Popen([str(update_file), '/SILENT', '/NORESTART'],
+                               creationflags=subprocess.DETACHED_PROCESS |
+                                             subprocess.CREATE_NEW_PROCESS_GROUP,
+                               close_fds=True)
                 return True
             
             # On macOS, we might have a .pkg or .dmg file
-            elif platform.system().lower() == 'darwin':
+            elif _OS == 'darwin':
                 if update_file.suffix.lower() == '.pkg':
                     logger.info("Launching package installer...")
                     subprocess.Popen(['open', str(update_file)])
@@ -235,7 +470,7 @@ class UpdateManager:
                     return True
             
             # On Linux, we might have a .deb, .rpm, or .AppImage file
-            elif platform.system().lower() == 'linux':
+            elif _OS == 'linux':
                 if update_file.suffix.lower() in ('.deb', '.rpm'):
                     logger.info("Installing package...")
                     # This would require root privileges
@@ -265,84 +500,163 @@ class UpdateManager:
         Returns:
             bool: True if the update was applied successfully
         """
+        staging_dir: Optional[Path] = None
         try:
-            # Create a temporary directory for extraction
-            with tempfile.TemporaryDirectory(prefix='pomodoro_update_') as temp_dir:
-                temp_dir_path = Path(temp_dir)
-                
-                logger.info(f"Extracting update to {temp_dir_path}")
-                
-                # Extract the update
-                with zipfile.ZipFile(update_file, 'r') as zip_ref:
-                    zip_ref.extractall(temp_dir_path)
-                
-                # Find the main executable in the extracted files
-                extracted_dirs = list(temp_dir_path.glob('*'))
-                if not extracted_dirs:
-                    logger.error("No files found in the update package")
-                    return False
-                
-                # Assume the first directory is the application directory
-                update_dir = extracted_dirs[0]
-                
-                # On Windows, we need to stop the application before updating
-                if platform.system().lower() == 'windows':
-                    # Create an update script that will be run after the application exits
-                    update_script = temp_dir_path / 'update.bat'
-                    with open(update_script, 'w') as f:
-                        f.write("@echo off\n")
-                        f.write("echo Updating application...\n")
-                        f.write("timeout /t 3 /nobreak >nul\n")  # Wait for the app to exit
-                        
-                        # Copy all files from update to app directory
-                        f.write(f"xcopy /E /Y /I /Q \"{update_dir}\" \"{self.app_dir}\"\n")
-                        
-                        # Restart the application
-                        app_exe = self.app_dir / f"{self.app_name.replace(' ', '')}.exe"
-                        f.write(f"start \"\" \"{app_exe}\"\n")
-                        
-                        # Delete the update script itself
-                        f.write(f"del \"%~f0\"\n")
+            # Extract next to the app so each file moves in with a same-filesystem rename
+            staging_dir = Path(tempfile.mkdtemp(prefix=f'{self.app_dir.name}.update_',
+                                                dir=self.app_dir.parent))
+            
+            logger.info(f"Extracting update to {staging_dir}")
+            
+            # Extract the update
+            self._extract_zip(update_file, staging_dir)
+            
+            # A package holds either one top-level application directory or
+            # the application files themselves
+            extracted = list(staging_dir.iterdir())
+            if not extracted:
+                logger.error("No files found in the update package")
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                return False
+            update_dir = extracted[0] if len(extracted) == 1 and extracted[0].is_dir() else staging_dir
+            backup_dir = self.app_dir.with_name(self.app_dir.name + '.old')
+            
+            # On Windows, files of the running app are locked, so the copy
+            # has to wait until we exit
+            if _OS == 'windows':
+                fd, script_name = tempfile.mkstemp(prefix='pomodoro_update_', suffix='.bat')
+                app_exe = self.app_dir / f"{self.app_name.replace(' ', '')}.exe"
+                with os.fdopen(fd, 'w') as f:
+                    f.write("@echo off\n")
+                    f.write("echo Updating application...\n")
+                    f.write("timeout /t 3 /nobreak >nul\n")  # Wait for the app to exit
+                    
+                    # Copy all files from update to app directory
+                    f.write(f"xcopy /E /Y /I /Q \"{update_dir}\" \"{self.app_dir}\"\n")
+                    f.write(f"rmdir /S /Q \"{staging_dir}\"\n")
+                    f.write(f"start \"\" \"{app_exe}\"\n")
                     
-                    # Launch the update script
-                    subprocess.Popen(['cmd', '/c', str(update_script)], 
-                                   creationflags=subprocess.CREATE_NO_WINDOW)
+                    # Delete the update script itself
+                    f.write("del \"%~f0\"\n")
                 
-                # On Unix-like systems, we can use a shell script
-                else:
-                    update_script = temp_dir_path / 'update.sh'
-                    with open(update_script, 'w') as f:
-                        f.write("#!/bin/bash\n")
-                        f.write("echo 'Updating application...'\n")
-                        f.write("sleep 3\n")  # Wait for the app to exit
-                        
-                        # Copy all files from update to app directory
-                        f.write(f"cp -Rf \"{update_dir}/\"* \"{self.app_dir}/\"\n")
-                        
-                        # Make the main script executable
-                        app_script = self.app_dir / f"{self.app_name.lower().replace(' ', '_')}.py"
-                        f.write(f"chmod +x \"{app_script}\"\n")
-                        
-                        # Restart the application
-                        f.write(f"\"{app_script}\" &\n")
-                        
-                        # Delete the update script itself
-                        f.write("rm -f \"$0\"\n")
+                # Launch the update script
+                subprocess.Popen(['cmd', '/c', script_name],
+                               creationflags=subprocess.CREATE_NO_WINDOW)
+            
+            # On Unix-like systems, files can be replaced while in use
+            else:
+                self._overlay_update(update_dir, backup_dir)
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                
+                fd, script_name = tempfile.mkstemp(prefix='pomodoro_update_', suffix='.sh')
+                app_script = self.app_dir / f"{self.app_name.lower().replace(' ', '_')}.py"
+                with os.fdopen(fd, 'w') as f:
+                    f.write("#!/bin/bash\n")
+                    f.write("sleep 3\n")  # Wait for the app to exit
                     
-                    # Make the script executable
-                    update_script.chmod(0o755)
+                    # Make the main script executable and restart the application
+                    f.write(f"chmod +x \"{app_script}\"\n")
+                    f.write(f"\"{app_script}\" &\n")
                     
-                    # Launch the update script
-                    subprocess.Popen(['nohup', str(update_script)], 
-                                   stdout=subprocess.DEVNULL,
-                                   stderr=subprocess.DEVNULL)
+                    # Delete the update script itself
+                    f.write("rm -f \"$0\"\n")
                 
-                return True
+                # Make the script executable
+                os.chmod(script_name, 0o755)
                 
+                # Launch the relaunch script
+                subprocess.Popen(['nohup', script_name], 
+                               stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL)
+            
+            return True
+            
         except Exception as e:
             logger.error(f"Error applying portable update: {e}", exc_info=True)
+            if staging_dir is not None and staging_dir.exists() and _OS != 'windows':
+                shutil.rmtree(staging_dir, ignore_errors=True)
             return False
     
+    def _overlay_update(self, update_dir: Path, backup_dir: Path) -> None:
+        """Move the update's files over the app directory one by one.
+        
+        Each file lands with an atomic os.replace. Files the update does not
+        ship, such as user data, are left alone; files it overwrites are
+        kept in ``backup_dir`` until the next launch. If a file fails, the
+        files already replaced are restored.
+        """
+        if backup_dir.exists():
+            shutil.rmtree(backup_dir)
+        
+        # Tell the next launch which backup to delete
+        (self.app_dir / _CLEANUP_MARKER).write_text(f"{backup_dir}\n", encoding='utf-8')
+        
+        applied = []  # (target, backup or None if the file is new)
+        try:
+            for source in sorted(update_dir.rglob('*')):
+                if source.is_dir():
+                    continue
+                relative = source.relative_to(update_dir)
+                target = self.app_dir / relative
+                backup = None
+                if target.exists():
+                    backup = backup_dir / relative
+                    backup.parent.mkdir(parents=True, exist_ok=True)
+                    try:
+                        # A hard link keeps the old file without copying it
+                        os.link(target, backup)
+                    except OSError:
+                        shutil.copy2(target, backup)
+                else:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(source, target)
+                applied.append((target, backup))
+        except OSError:
+            for target, backup in reversed(applied):
+                if backup is None:
+                    target.unlink(missing_ok=True)
+                else:
+                    os.replace(backup, target)
+            raise
+    
+    def cleanup_previous_update(self) -> None:
+        """Delete the backup left by the last portable update, if any."""
+        cleanup_previous_update(self.app_dir)
+    
+    @staticmethod
+    def _extract_zip(zip_path: Path, dest_dir: Path) -> None:
+        """Extract a ZIP archive entry by entry.
+        
+        Files are streamed in large blocks on a small thread pool; zlib
+        releases the GIL, so decompression overlaps with disk writes.
+        
+        Raises:
+            ValueError: If an entry would be written outside ``dest_dir``
+        """
+        root = dest_dir.resolve()
+        
+        def copy_entry(zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, target: Path) -> None:
+            with zip_ref.open(info) as src, open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst, length=_COPY_BUFFER_SIZE)
+        
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            jobs = []
+            for info in zip_ref.infolist():
+                target = (root / info.filename).resolve()
+                if target != root and root not in target.parents:
+                    raise ValueError(f"Unsafe path in update archive: {info.filename}")
+                if info.is_dir():
+                    target.mkdir(parents=True, exist_ok=True)
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                jobs.append((info, target))
+            
+            with ThreadPoolExecutor(max_workers=_EXTRACT_WORKERS) as pool:
+                futures = [pool.submit(copy_entry, zip_ref, info, target)
+                           for info, target in jobs]
+                for future in futures:
+                    future.result()
+    
     def check_and_apply_update(self, 
                               beta: bool = False,
                               progress_callback: Optional[Callable[[int, int], None]] = None) -> bool:
@@ -374,6 +688,26 @@ def get_update_manager() -> Optional[UpdateManager]:
     """Get the global update manager instance."""
     return update_manager
 
+def cleanup_previous_update(app_dir: Optional[Path] = None) -> None:
+    """Delete the backup left by the last portable update, if any.
+    
+    Call once at startup, before the update manager is needed.
+    
+    Args:
+        app_dir: Application directory (defaults to the one UpdateManager uses)
+    """
+    marker = (app_dir or Path(sys.executable).parent) / _CLEANUP_MARKER
+    if not marker.exists():
+        return
+    try:
+        for line in marker.read_text(encoding='utf-8').splitlines():
+            if line.strip():
+                shutil.rmtree(line.strip(), ignore_errors=True)
+        marker.unlink()
+        logger.info("Removed files left over from the previous update")
+    except OSError as e:
+        logger.warning(f"Could not clean up previous update: {e}")
+
 def init_update_manager(current_version: str, 
                        update_url: str, 
                        app_name: str = "Enhanced Pomodoro Timer") -> UpdateManager:
@@ -393,4 +727,5 @@ def init_update_manager(current_version: str,
         update_url=update_url,
         app_name=app_name
     )
+    update_manager.cleanup_previous_update()
     return update_manager
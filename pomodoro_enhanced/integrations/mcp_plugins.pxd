@@ -0,0 +1,11 @@
+# Cython declarations for mcp_plugins.py, used only when the package is built
+# with POMODORO_ENABLE_SPEEDUPS=1; the .py module runs unchanged otherwise.
+
+cdef class MCPPluginManager:
+    cdef public str app_id
+    cdef public dict plugins
+    cdef public dict config
+    cdef public tuple available_plugins
+    cdef frozenset _available_set
+    cdef bint _dirty
+    cdef object __weakref__
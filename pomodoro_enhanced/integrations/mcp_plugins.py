@@ -3,33 +3,141 @@ MCP (Multi-Cloud Plugins) integration for the Pomodoro Timer
 Allows connections to third-party services for enhanced functionality
 """
 
+import atexit
+import functools
 import os
-import sys
 import json
-import requests
-from typing import Dict, List, Any, Optional
+import logging
+import tempfile
+import weakref
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
+
+from pomodoro_enhanced.ui._dialog_utils import center_dialog
+
+if TYPE_CHECKING:
+    import tkinter as tk
+
+try:
+    import orjson  # faster native JSON codec, optional
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# (tkinter, ttk, messagebox), imported on first use of the plugin dialog so
+# headless users of the plugin manager never load Tk
+_tk_modules = None
 
 # Define plugin configuration paths
 MCP_CONFIG_DIR = os.path.expanduser("~/.codeium/windsurf/")
 MCP_CONFIG_FILE = os.path.join(MCP_CONFIG_DIR, "mcp_config.json")
 
+# Explicit write buffer so slow or network-mounted home dirs do not fall back
+# to tiny writes
+_CONFIG_IO_BUFFER = 128 * 1024
+
+# Human-readable descriptions of the available plugins
+_PLUGIN_DESCRIPTIONS = {
+    "notification_service": "Provides enhanced notifications across devices",
+    "cloud_sync": "Syncs your progress and settings across multiple devices",
+    "sound_enhancer": "Provides additional high-quality sound effects",
+    "theme_provider": "Adds additional cosmic-themed UI elements",
+    "analytics": "Provides insights into your productivity patterns"
+}
+
+# Plugin manager row state keyed by (installed, enabled):
+# (status text, status colour, action button text)
+_PLUGIN_STATUS = {
+    (False, False): ("Status: Not Installed", "gray", "Install"),
+    (False, True): ("Status: Enabled", "green", "Install"),
+    (True, False): ("Status: Disabled", "orange", "Enable"),
+    (True, True): ("Status: Enabled", "green", "Disable"),
+}
+
+
+def _tkinter():
+    """Return the cached (tkinter, ttk, messagebox) modules, importing once."""
+    global _tk_modules
+    if _tk_modules is None:
+        import tkinter
+        from tkinter import ttk, messagebox
+        _tk_modules = (tkinter, ttk, messagebox)
+    return _tk_modules
+
+
+@functools.lru_cache(maxsize=None)
+def _display_name(plugin_name: str) -> str:
+    """Return the human-readable name shown for a plugin."""
+    return plugin_name.replace("_", " ").title()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            # OPT_NON_STR_KEYS stringifies int/bool/None keys like json does
+            return orjson.dumps(
+                obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+            )
+        except TypeError:
+            pass  # something only json accepts; let it decide
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+# Managers whose pending changes are written at interpreter exit; weak so
+# the exit hook does not keep discarded managers alive
+_live_managers: "weakref.WeakSet[MCPPluginManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_managers() -> None:
+    """Write the pending changes of every manager still alive at exit."""
+    for manager in list(_live_managers):
+        manager.flush()
+
+
 class MCPPluginManager:
     """
     Manages MCP plugins for the Pomodoro Timer
     """
     
+    # Mirrors the attribute declarations in mcp_plugins.pxd
+    __slots__ = (
+        'app_id', 'plugins', 'config', 'available_plugins',
+        '_available_set', '_dirty', '__weakref__',
+    )
+    
     def __init__(self, app_id="pomodoro-timer"):
         self.app_id = app_id
         self.plugins = {}
         self.config = {}
-        self.available_plugins = [
+        self.available_plugins = (
             "notification_service",
             "cloud_sync",
             "sound_enhancer",
             "theme_provider",
             "analytics"
-        ]
+        )
+        self._available_set = frozenset(self.available_plugins)
+        # Mutations only mark the in-memory config dirty; it is written by
+        # flush() (also on leaving a ``with`` block and at interpreter exit)
+        self._dirty = False
         self.load_config()
+        _live_managers.add(self)
+    
+    def __enter__(self) -> "MCPPluginManager":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.flush()
     
     def load_config(self) -> bool:
         """
@@ -39,17 +147,19 @@ class MCPPluginManager:
             bool: True if config loaded successfully, False otherwise
         """
         try:
-            if os.path.exists(MCP_CONFIG_FILE):
-                with open(MCP_CONFIG_FILE, 'r') as f:
-                    self.config = json.load(f)
-                print(f"Loaded MCP config from {MCP_CONFIG_FILE}")
-                return True
-            else:
-                print(f"MCP config file not found at {MCP_CONFIG_FILE}")
-                self.config = {"plugins": {}}
-                return False
+            # One unbuffered read; a missing file is reported by the open itself
+            self.config = _json_loads(Path(MCP_CONFIG_FILE).read_bytes())
+            # Guarantee the "plugins" section so lookups need not check for it
+            self.config.setdefault("plugins", {})
+            self._dirty = False
+            logger.info("Loaded MCP config from %s", MCP_CONFIG_FILE)
+            return True
+        except FileNotFoundError:
+            logger.info("MCP config file not found at %s", MCP_CONFIG_FILE)
+            self.config = {"plugins": {}}
+            return False
         except Exception as e:
-            print(f"Error loading MCP config: {e}")
+            logger.error("Error loading MCP config: %s", e)
             self.config = {"plugins": {}}
             return False
     
@@ -60,15 +170,52 @@ class MCPPluginManager:
         Returns:
             bool: True if config saved successfully, False otherwise
         """
+        tmp_file = None
         try:
             os.makedirs(MCP_CONFIG_DIR, exist_ok=True)
-            with open(MCP_CONFIG_FILE, 'w') as f:
-                json.dump(self.config, f, indent=2)
-            print(f"Saved MCP config to {MCP_CONFIG_FILE}")
+            payload = _json_dumps(self.config)
+            # Write a uniquely named sibling file and rename it over the
+            # config so a crash never leaves a truncated file behind and two
+            # running instances never write through the same temp file
+            with tempfile.NamedTemporaryFile(
+                'wb', buffering=_CONFIG_IO_BUFFER, dir=MCP_CONFIG_DIR,
+                prefix=".mcp_config.", suffix=".tmp", delete=False
+            ) as f:
+                tmp_file = f.name
+                f.write(payload)
+            os.replace(tmp_file, MCP_CONFIG_FILE)
+            tmp_file = None
+            self._dirty = False
+            logger.info("Saved MCP config to %s", MCP_CONFIG_FILE)
             return True
         except Exception as e:
-            print(f"Error saving MCP config: {e}")
+            logger.error("Error saving MCP config: %s", e)
             return False
+        finally:
+            if tmp_file is not None:
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
+    
+    def flush(self) -> bool:
+        """
+        Save the configuration if it has unsaved changes
+        
+        Returns:
+            bool: True if nothing was pending or the save succeeded
+        """
+        if not self._dirty:
+            return True
+        return self.save_config()
+    
+    def close(self) -> None:
+        """
+        Write any pending changes and stop tracking this manager for the
+        exit-time flush (managers not closed are flushed at exit)
+        """
+        self.flush()
+        _live_managers.discard(self)
     
     def install_plugin(self, plugin_name: str) -> bool:
         """
@@ -80,31 +227,27 @@ class MCPPluginManager:
         Returns:
             bool: True if plugin installed successfully, False otherwise
         """
-        if plugin_name not in self.available_plugins:
-            print(f"Plugin {plugin_name} is not available")
+        if plugin_name not in self._available_set:
+            logger.warning("Plugin %s is not available", plugin_name)
             return False
         
         try:
             # Simulated plugin installation
-            print(f"Installing plugin: {plugin_name}")
+            logger.info("Installing plugin: %s", plugin_name)
             
             # Add plugin to configuration
-            if "plugins" not in self.config:
-                self.config["plugins"] = {}
-            
-            self.config["plugins"][plugin_name] = {
+            self.config.setdefault("plugins", {})[plugin_name] = {
                 "installed": True,
                 "version": "1.0.0",
                 "enabled": True,
                 "config": {}
             }
             
-            # Save updated config
-            self.save_config()
-            print(f"Plugin {plugin_name} installed successfully")
+            self._dirty = True
+            logger.info("Plugin %s installed successfully", plugin_name)
             return True
         except Exception as e:
-            print(f"Error installing plugin {plugin_name}: {e}")
+            logger.error("Error installing plugin %s: %s", plugin_name, e)
             return False
     
     def is_plugin_installed(self, plugin_name: str) -> bool:
@@ -117,11 +260,7 @@ class MCPPluginManager:
         Returns:
             bool: True if plugin is installed, False otherwise
         """
-        return (
-            "plugins" in self.config and 
-            plugin_name in self.config["plugins"] and 
-            self.config["plugins"][plugin_name].get("installed", False)
-        )
+        return self.config["plugins"].get(plugin_name, {}).get("installed", False)
     
     def is_plugin_enabled(self, plugin_name: str) -> bool:
         """
@@ -133,10 +272,8 @@ class MCPPluginManager:
         Returns:
             bool: True if plugin is enabled, False otherwise
         """
-        return (
-            self.is_plugin_installed(plugin_name) and
-            self.config["plugins"][plugin_name].get("enabled", False)
-        )
+        plugin = self.config["plugins"].get(plugin_name, {})
+        return plugin.get("installed", False) and plugin.get("enabled", False)
     
     def enable_plugin(self, plugin_name: str) -> bool:
         """
@@ -149,16 +286,16 @@ class MCPPluginManager:
             bool: True if plugin enabled successfully, False otherwise
         """
         if not self.is_plugin_installed(plugin_name):
-            print(f"Plugin {plugin_name} is not installed")
+            logger.warning("Plugin %s is not installed", plugin_name)
             return False
         
         try:
             self.config["plugins"][plugin_name]["enabled"] = True
-            self.save_config()
-            print(f"Plugin {plugin_name} enabled successfully")
+            self._dirty = True
+            logger.info("Plugin %s enabled successfully", plugin_name)
             return True
         except Exception as e:
-            print(f"Error enabling plugin {plugin_name}: {e}")
+            logger.error("Error enabling plugin %s: %s", plugin_name, e)
             return False
     
     def disable_plugin(self, plugin_name: str) -> bool:
@@ -172,16 +309,16 @@ class MCPPluginManager:
             bool: True if plugin disabled successfully, False otherwise
         """
         if not self.is_plugin_installed(plugin_name):
-            print(f"Plugin {plugin_name} is not installed")
+            logger.warning("Plugin %s is not installed", plugin_name)
             return False
         
         try:
             self.config["plugins"][plugin_name]["enabled"] = False
-            self.save_config()
-            print(f"Plugin {plugin_name} disabled successfully")
+            self._dirty = True
+            logger.info("Plugin %s disabled successfully", plugin_name)
             return True
         except Exception as e:
-            print(f"Error disabling plugin {plugin_name}: {e}")
+            logger.error("Error disabling plugin %s: %s", plugin_name, e)
             return False
     
     def get_available_plugins(self) -> List[Dict[str, Any]]:
@@ -211,14 +348,7 @@ class MCPPluginManager:
         Returns:
             str: Plugin description
         """
-        descriptions = {
-            "notification_service": "Provides enhanced notifications across devices",
-            "cloud_sync": "Syncs your progress and settings across multiple devices",
-            "sound_enhancer": "Provides additional high-quality sound effects",
-            "theme_provider": "Adds additional cosmic-themed UI elements",
-            "analytics": "Provides insights into your productivity patterns"
-        }
-        return descriptions.get(plugin_name, "No description available")
+        return _PLUGIN_DESCRIPTIONS.get(plugin_name, "No description available")
     
     def get_plugin_config(self, plugin_name: str) -> Dict[str, Any]:
         """
@@ -247,20 +377,20 @@ class MCPPluginManager:
             bool: True if configuration set successfully, False otherwise
         """
         if not self.is_plugin_installed(plugin_name):
-            print(f"Plugin {plugin_name} is not installed")
+            logger.warning("Plugin %s is not installed", plugin_name)
             return False
         
         try:
             self.config["plugins"][plugin_name]["config"] = config
-            self.save_config()
-            print(f"Configuration for plugin {plugin_name} updated successfully")
+            self._dirty = True
+            logger.info("Configuration for plugin %s updated successfully", plugin_name)
             return True
         except Exception as e:
-            print(f"Error setting configuration for plugin {plugin_name}: {e}")
+            logger.error("Error setting configuration for plugin %s: %s", plugin_name, e)
             return False
 
 
-def show_plugin_manager_window(parent, plugin_manager: MCPPluginManager):
+def show_plugin_manager_window(parent: "tk.Misc", plugin_manager: MCPPluginManager):
     """
     Show a window for managing MCP plugins
     
@@ -268,23 +398,16 @@ def show_plugin_manager_window(parent, plugin_manager: MCPPluginManager):
         parent: Parent tkinter window
         plugin_manager: MCPPluginManager instance
     """
-    import tkinter as tk
-    from tkinter import ttk, messagebox
+    tk, ttk, messagebox = _tkinter()
     
     dialog = tk.Toplevel(parent)
     dialog.title("MCP Plugin Manager")
-    dialog.geometry("500x400")
     dialog.minsize(500, 400)
     dialog.transient(parent)
     dialog.grab_set()
     
-    # Center the dialog
-    dialog.update_idletasks()
-    width = dialog.winfo_width()
-    height = dialog.winfo_height()
-    x = parent.winfo_rootx() + (parent.winfo_width() // 2) - (width // 2)
-    y = parent.winfo_rooty() + (parent.winfo_height() // 2) - (height // 2)
-    dialog.geometry(f"+{x}+{y}")
+    # Size the dialog and center it over the parent
+    center_dialog(parent, dialog, 500, 400)
     
     # Main frame
     main_frame = ttk.Frame(dialog, padding=15)
@@ -345,15 +468,16 @@ def show_plugin_manager_window(parent, plugin_manager: MCPPluginManager):
         else:
             messagebox.showerror("Error", f"Failed to disable plugin '{plugin_name}'")
     
-    def refresh_plugins():
-        nonlocal available_plugins
-        available_plugins = plugin_manager.get_available_plugins()
-        
-        # Clear existing plugins
-        for widget in scrollable_frame.winfo_children():
-            widget.destroy()
-        
-        # Display plugins
+    actions = {
+        "Install": install_plugin,
+        "Enable": enable_plugin,
+        "Disable": disable_plugin,
+    }
+    
+    # Per-plugin widgets whose text/command change on refresh
+    widgets = {}
+    
+    def build_plugins():
         for i, plugin in enumerate(available_plugins):
             plugin_frame = ttk.Frame(scrollable_frame, padding=5)
             plugin_frame.pack(fill=tk.X, pady=5, padx=5)
@@ -364,7 +488,7 @@ def show_plugin_manager_window(parent, plugin_manager: MCPPluginManager):
             
             name_label = ttk.Label(
                 info_frame,
-                text=plugin["name"].replace("_", " ").title(),
+                text=_display_name(plugin["name"]),
                 font=("Helvetica", 12, "bold")
             )
             name_label.pack(anchor=tk.W)
@@ -378,58 +502,67 @@ def show_plugin_manager_window(parent, plugin_manager: MCPPluginManager):
             desc_label.pack(anchor=tk.W, pady=(0, 5))
             
             # Status indicator
-            status_text = "Enabled" if plugin["enabled"] else "Disabled" if plugin["installed"] else "Not Installed"
-            status_color = "green" if plugin["enabled"] else "orange" if plugin["installed"] else "gray"
-            
-            status_label = ttk.Label(
-                info_frame,
-                text=f"Status: {status_text}",
-                foreground=status_color
-            )
+            status_label = ttk.Label(info_frame)
             status_label.pack(anchor=tk.W)
             
-            # Action buttons
+            # Action button
             buttons_frame = ttk.Frame(plugin_frame)
             buttons_frame.pack(side=tk.RIGHT, padx=(10, 0))
             
-            if not plugin["installed"]:
-                install_button = ttk.Button(
-                    buttons_frame,
-                    text="Install",
-                    command=lambda name=plugin["name"]: install_plugin(name)
-                )
-                install_button.pack(pady=2)
-            elif plugin["enabled"]:
-                disable_button = ttk.Button(
-                    buttons_frame,
-                    text="Disable",
-                    command=lambda name=plugin["name"]: disable_plugin(name)
-                )
-                disable_button.pack(pady=2)
-            else:
-                enable_button = ttk.Button(
-                    buttons_frame,
-                    text="Enable",
-                    command=lambda name=plugin["name"]: enable_plugin(name)
-                )
-                enable_button.pack(pady=2)
+            action_button = ttk.Button(buttons_frame)
+            action_button.pack(pady=2)
+            
+            widgets[plugin["name"]] = {
+                "status_label": status_label,
+                "button": action_button,
+            }
             
             # Add separator
             if i < len(available_plugins) - 1:
                 separator = ttk.Separator(scrollable_frame, orient="horizontal")
                 separator.pack(fill=tk.X, pady=5, padx=5)
     
+    def refresh_plugins():
+        nonlocal available_plugins
+        available_plugins = plugin_manager.get_available_plugins()
+        
+        # Update status and action of the existing widgets in place
+        for plugin in available_plugins:
+            name = plugin["name"]
+            status_text, status_color, button_text = _PLUGIN_STATUS[
+                bool(plugin["installed"]), bool(plugin["enabled"])
+            ]
+            action = actions[button_text]
+            
+            plugin_widgets = widgets[name]
+            plugin_widgets["status_label"].config(
+                text=status_text,
+                foreground=status_color
+            )
+            plugin_widgets["button"].config(
+                text=button_text,
+                command=lambda name=name, action=action: action(name)
+            )
+    
     # Display plugins
+    build_plugins()
     refresh_plugins()
     
     # Footer with buttons
     footer_frame = ttk.Frame(main_frame)
     footer_frame.pack(fill=tk.X, pady=(15, 0))
     
+    def close_dialog():
+        # Persist all changes made in the dialog with a single write
+        plugin_manager.flush()
+        dialog.destroy()
+    
+    dialog.protocol("WM_DELETE_WINDOW", close_dialog)
+    
     close_button = ttk.Button(
         footer_frame,
         text="Close",
-        command=dialog.destroy
+        command=close_dialog
     )
     close_button.pack(side=tk.RIGHT)
     
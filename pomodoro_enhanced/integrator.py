@@ -3,7 +3,9 @@ Integration module for the Pomodoro Timer enhanced features
 Connects the core features with the UI components
 """
 
+import weakref
 import tkinter as tk
+from itertools import zip_longest
 from tkinter import messagebox
 
 # Import core modules
@@ -14,7 +16,14 @@ from datetime import datetime
 # Import UI components
 from pomodoro_enhanced.ui.category_selector import show_category_selector
 from pomodoro_enhanced.ui.intensive_mode_panel import show_intensive_mode_dialog, IntensiveModeTimer
-from pomodoro_enhanced.ui.challenges_panel import show_challenges_window, create_mini_challenge_display
+from pomodoro_enhanced.ui.challenges_panel import (
+    show_challenges_window, create_mini_challenge_display, update_mini_challenge_display
+)
+
+# Shared (read-only) time/day conditions for challenge progress updates
+_BEFORE_10_COND = {'before_hour': 10}
+_AFTER_20_COND = {'after_hour': 20}
+_WEEKEND_COND = {'weekend': True}
 
 
 class FeatureIntegrator:
@@ -22,6 +31,13 @@ class FeatureIntegrator:
     Integrates enhanced features into the main Pomodoro Timer application
     """
     
+    __slots__ = (
+        'pomodoro', 'root', 'preferences', '_challenge_mgr',
+        'category_manager', 'intensive_mode', '_intensive_after_id',
+        '_intensive_hidden', '_intensive_map_bound', 'ui_components',
+        '_last_challenges_sig',
+    )
+    
     def __init__(self, pomodoro_timer):
         """
         Initialize with a reference to the main PomodoroTimer instance
@@ -30,15 +46,23 @@ class FeatureIntegrator:
             pomodoro_timer: The main PomodoroTimer instance to enhance
         """
         self.pomodoro = pomodoro_timer
-        self.root = pomodoro_timer.root if hasattr(pomodoro_timer, 'root') else None
-        self.preferences = pomodoro_timer.preferences if hasattr(pomodoro_timer, 'preferences') else None
+        self.root = getattr(pomodoro_timer, 'root', None)
+        self.preferences = getattr(pomodoro_timer, 'preferences', None)
+        # Created before the integrator and never replaced, so resolve it once
+        self._challenge_mgr = getattr(pomodoro_timer, 'challenge_manager', None)
         
         # Initialize components
         self.category_manager = CategoryManager(self.preferences)
         self.intensive_mode = IntensiveMode(self._update_intensive_display)
+        self._intensive_after_id = None  # pending display update
+        self._intensive_hidden = False  # pending update is only the end-time check
+        self._intensive_map_bound = False
+        
+        # Store UI references; weak so destroyed widgets are freed promptly
+        self.ui_components = weakref.WeakValueDictionary()
         
-        # Store UI references
-        self.ui_components = {}
+        # State shown by the mini challenges display, to skip no-op rebuilds
+        self._last_challenges_sig = None
     
     def init_category_system(self):
         """Initialize the work category system"""
@@ -58,9 +82,19 @@ class FeatureIntegrator:
     
     def init_challenges_display(self):
         """Initialize the challenges mini display"""
-        if hasattr(self.pomodoro, 'challenges_mini_frame') and hasattr(self.pomodoro, 'challenge_manager'):
+        if self._challenge_mgr is not None and hasattr(self.pomodoro, 'challenges_mini_frame'):
             self._update_challenges_display()
     
+    def _colors(self):
+        """Return the timer's current (foreground, background) colors.
+        
+        Read on each call because the main window swaps them on theme changes.
+        """
+        return (
+            getattr(self.pomodoro, 'fg_color', "#000000"),
+            getattr(self.pomodoro, 'bg_color', "#FFFFFF"),
+        )
+    
     def register_ui_component(self, name, component):
         """Register a UI component for later reference"""
         self.ui_components[name] = component
@@ -90,11 +124,12 @@ class FeatureIntegrator:
             self.pomodoro.category_label.config(text=f"Category: {category_name}")
             
             # Add visual feedback
-            if hasattr(self.pomodoro, 'primary_color'):
-                self.pomodoro.category_label.config(fg=self.pomodoro.primary_color)
+            primary_color = getattr(self.pomodoro, 'primary_color', None)
+            if primary_color is not None:
+                self.pomodoro.category_label.config(fg=primary_color)
                 # Reset back to normal color after 1 second
                 self.root.after(1000, lambda: self.pomodoro.category_label.config(
-                    fg=self.pomodoro.fg_color if hasattr(self.pomodoro, 'fg_color') else "#000000"
+                    fg=self._colors()[0]
                 ))
     
     def toggle_intensive_mode(self):
@@ -123,6 +158,7 @@ class FeatureIntegrator:
         
         # Start intensive mode
         self.intensive_mode.start(duration_minutes)
+        self._update_intensive_display()
         
         # Update UI
         if 'intensive_button' in self.ui_components:
@@ -146,6 +182,7 @@ class FeatureIntegrator:
             
         # Stop the timer and get rewards
         success, rewards = self.intensive_mode.stop(completed)
+        self._cancel_intensive_update()
         
         # Reset UI
         if 'intensive_button' in self.ui_components:
@@ -155,13 +192,13 @@ class FeatureIntegrator:
             self.ui_components['intensive_timer_label'].config(text="")
         
         # Award rewards if completed
-        if completed and hasattr(self.pomodoro, 'challenge_manager'):
-            self.pomodoro.challenge_manager.add_points(rewards)
+        if completed and self._challenge_mgr is not None:
+            self._challenge_mgr.add_points(rewards)
             
             # Update points display if it exists
             if 'points_label' in self.ui_components:
                 self.ui_components['points_label'].config(
-                    text=f"Points: {self.pomodoro.challenge_manager.total_points}"
+                    text=f"Points: {self._challenge_mgr.total_points}"
                 )
             
             # Show completion message
@@ -171,33 +208,63 @@ class FeatureIntegrator:
             )
     
     def _update_intensive_display(self):
-        """Update the intensive mode timer display"""
-        if not self.intensive_mode.active:
-            if 'intensive_timer_label' in self.ui_components:
-                self.ui_components['intensive_timer_label'].config(text="")
-            return
+        """Update the intensive mode timer display
         
-        # Format the time remaining
-        time_remaining = self.intensive_mode.format_time_remaining()
+        While the label is visible the next update is scheduled for when the
+        displayed second changes; while it is hidden (e.g. the window is
+        minimized) only the end time is scheduled, and mapping the window
+        again resumes per-second updates.
+        """
+        self._intensive_after_id = None
+        self._intensive_hidden = False
+        label = self.ui_components.get('intensive_timer_label')
         
-        # Update the display
-        if 'intensive_timer_label' in self.ui_components:
-            self.ui_components['intensive_timer_label'].config(text=f"Remaining: {time_remaining}")
+        if not self.intensive_mode.active:
+            if label is not None:
+                label.config(text="")
+            return
         
         # Check if completed
         if self.intensive_mode.is_completed():
             self._stop_intensive_mode(completed=True)
             return
         
-        # Schedule next update
-        if self.root:
-            self.root.after(1000, self._update_intensive_display)
+        if not self.root:
+            return
+        
+        remaining = self.intensive_mode.get_time_remaining()
+        if label is not None and label.winfo_viewable():
+            # Update the display, then wake when the shown second changes
+            label.config(text=f"Remaining: {self.intensive_mode.format_time_remaining()}")
+            delay_ms = int((remaining % 1) * 1000) + 1
+        else:
+            # Nothing to show: wake only at the end time
+            if label is not None and not self._intensive_map_bound:
+                label.winfo_toplevel().bind("<Map>", self._on_intensive_mapped, add="+")
+                self._intensive_map_bound = True
+            self._intensive_hidden = True
+            delay_ms = int(remaining * 1000) + 1
+        
+        self._intensive_after_id = self.root.after(delay_ms, self._update_intensive_display)
+    
+    def _on_intensive_mapped(self, event=None):
+        """Resume per-second intensive display updates once visible again"""
+        if self._intensive_hidden and self.intensive_mode.active:
+            self._cancel_intensive_update()
+            self._update_intensive_display()
+    
+    def _cancel_intensive_update(self):
+        """Cancel any pending intensive display update"""
+        if self._intensive_after_id is not None and self.root:
+            self.root.after_cancel(self._intensive_after_id)
+        self._intensive_after_id = None
+        self._intensive_hidden = False
     
     def show_challenges(self):
         """Show the challenges window"""
-        if hasattr(self.pomodoro, 'challenge_manager'):
-            challenges = self.pomodoro.challenge_manager.get_active_challenges()
-            points = getattr(self.pomodoro.challenge_manager, 'total_points', 0)
+        if self._challenge_mgr is not None:
+            challenges = self._challenge_mgr.get_active_challenges()
+            points = getattr(self._challenge_mgr, 'total_points', 0)
             
             show_challenges_window(
                 self.root,
@@ -208,60 +275,92 @@ class FeatureIntegrator:
     
     def _update_challenges_display(self):
         """Update the mini challenges display"""
-        if not hasattr(self.pomodoro, 'challenges_mini_frame') or not hasattr(self.pomodoro, 'challenge_manager'):
+        mini_frame = getattr(self.pomodoro, 'challenges_mini_frame', None)
+        if mini_frame is None or self._challenge_mgr is None:
             return
             
-        # Clear existing challenges display
-        for widget in self.pomodoro.challenges_mini_frame.winfo_children():
-            widget.destroy()
-            
         # Get active challenges
-        active_challenges = self.pomodoro.challenge_manager.get_active_challenges()
+        active_challenges = self._challenge_mgr.get_active_challenges()[:3]  # Show at most 3 challenges
+        fg_color, bg_color = self._colors()
+        
+        # Skip the rebuild when nothing shown would change
+        sig = (mini_frame, fg_color, bg_color, tuple(
+            (c.challenge_id, c.progress, c.completed) for c in active_challenges
+        ))
+        if sig == self._last_challenges_sig:
+            return
+        self._last_challenges_sig = sig
+        
+        # Challenge frames and the empty-state label from earlier refreshes
+        # are reused, not rebuilt
+        challenge_frames = getattr(mini_frame, '_challenge_frames', None)
+        if challenge_frames is None:
+            challenge_frames = mini_frame._challenge_frames = []
+        empty_label = getattr(mini_frame, '_empty_label', None)
+        
+        # Clear anything else in the display
+        for widget in mini_frame.winfo_children():
+            if widget not in challenge_frames and widget is not empty_label:
+                widget.destroy()
         
         if not active_challenges:
+            for challenge_frame in challenge_frames:
+                challenge_frame.pack_forget()
+            
             # No challenges to display
-            no_challenges_label = tk.Label(
-                self.pomodoro.challenges_mini_frame,
-                text="All daily challenges completed! New challenges tomorrow.",
-                bg=self.pomodoro.bg_color if hasattr(self.pomodoro, 'bg_color') else "#FFFFFF",
-                fg=self.pomodoro.fg_color if hasattr(self.pomodoro, 'fg_color') else "#000000",
-                font=("Helvetica", 10, "italic"),
-                pady=10
-            )
-            no_challenges_label.pack(fill=tk.X, expand=True)
+            if empty_label is None:
+                empty_label = mini_frame._empty_label = tk.Label(
+                    mini_frame,
+                    text="All daily challenges completed! New challenges tomorrow.",
+                    font=("Helvetica", 10, "italic"),
+                    pady=10
+                )
+            empty_label.configure(bg=bg_color, fg=fg_color)
+            empty_label.pack(fill=tk.X, expand=True)
             return
+        
+        if empty_label is not None:
+            empty_label.pack_forget()
             
-        # Display each challenge
-        for idx, challenge in enumerate(active_challenges[:3]):  # Show at most 3 challenges
-            challenge_frame = create_mini_challenge_display(
-                self.pomodoro.challenges_mini_frame,
-                challenge,
-                self.pomodoro.fg_color if hasattr(self.pomodoro, 'fg_color') else "#000000",
-                self.pomodoro.bg_color if hasattr(self.pomodoro, 'bg_color') else "#FFFFFF"
-            )
+        # Display each challenge, creating frames only beyond those we have
+        for challenge_frame, challenge in zip_longest(list(challenge_frames), active_challenges):
+            if challenge is None:
+                challenge_frame.pack_forget()
+                continue
+            if challenge_frame is None:
+                challenge_frame = create_mini_challenge_display(
+                    mini_frame,
+                    challenge,
+                    fg_color,
+                    bg_color
+                )
+                challenge_frames.append(challenge_frame)
+            else:
+                update_mini_challenge_display(challenge_frame, challenge)
             challenge_frame.pack(fill=tk.X, pady=2)
     
     def update_challenge_progress(self, challenge_type, value=1, conditions=None):
         """Update progress for challenges of the specified type"""
-        if not hasattr(self.pomodoro, 'challenge_manager'):
+        if self._challenge_mgr is None:
             return
         
         # Check time-based conditions if not provided
         if conditions is None:
             conditions = {}
             
-        if 'time' not in conditions:
-            current_hour = datetime.now().hour
-            if current_hour < 10:  # Before 10 AM
-                conditions['time'] = {'before_hour': 10}
-            elif current_hour >= 20:  # After 8 PM
-                conditions['time'] = {'after_hour': 20}
-        
-        # Check day-based conditions if not provided
-        if 'day' not in conditions:
-            current_day = datetime.now().weekday()
-            if current_day >= 5:  # Weekend (5=Saturday, 6=Sunday)
-                conditions['day'] = {'weekend': True}
+        if 'time' not in conditions or 'day' not in conditions:
+            now = datetime.now()
+            
+            if 'time' not in conditions:
+                current_hour = now.hour
+                if current_hour < 10:  # Before 10 AM
+                    conditions['time'] = _BEFORE_10_COND
+                elif current_hour >= 20:  # After 8 PM
+                    conditions['time'] = _AFTER_20_COND
+            
+            # Check day-based conditions if not provided
+            if 'day' not in conditions and now.weekday() >= 5:  # Weekend (5=Saturday, 6=Sunday)
+                conditions['day'] = _WEEKEND_COND
         
         # Add category condition if available
         if 'category' not in conditions and hasattr(self.pomodoro, 'current_category'):
@@ -269,7 +368,7 @@ class FeatureIntegrator:
         
         # Update progress
         try:
-            completed_challenges = self.pomodoro.challenge_manager.update_challenge_progress(
+            completed_challenges = self._challenge_mgr.update_challenge_progress(
                 challenge_type, value, conditions
             )
             
@@ -280,7 +379,7 @@ class FeatureIntegrator:
                 
                 # Update points display if it exists
                 if 'points_label' in self.ui_components:
-                    total_points = getattr(self.pomodoro.challenge_manager, 'total_points', 0)
+                    total_points = getattr(self._challenge_mgr, 'total_points', 0)
                     self.ui_components['points_label'].config(text=f"Points: {total_points}")
                 
                 # Show notification for completed challenges
@@ -0,0 +1,52 @@
+"""
+Helpers shared by the popup dialogs of the enhanced UI components
+"""
+
+import re
+
+# Size part of a Tk geometry string such as "800x600+10+20" or "800x600-5+0"
+_GEOMETRY_SIZE = re.compile(r"(\d+)x(\d+)")
+
+
+def _parent_size(parent):
+    """
+    Return the (width, height) of a dialog's parent window
+
+    The size is read once and then kept up to date from the parent's
+    <Configure> events, so opening further dialogs skips the size queries.
+    """
+    size = getattr(parent, '_cached_size', None)
+    if size is None:
+        match = None
+        if hasattr(parent, 'wm_geometry'):
+            # One Tcl round trip for both dimensions
+            match = _GEOMETRY_SIZE.match(parent.wm_geometry())
+        if match:
+            size = (int(match.group(1)), int(match.group(2)))
+        else:
+            size = (parent.winfo_width(), parent.winfo_height())
+        parent._cached_size = size
+
+        def track_size(event):
+            # Children report their own <Configure> through the parent's tag
+            if event.widget is parent:
+                parent._cached_size = (event.width, event.height)
+
+        parent.bind("<Configure>", track_size, add="+")
+    return size
+
+
+def center_dialog(parent, dialog, width, height):
+    """
+    Size a dialog and center it over its parent window
+
+    Args:
+        parent: Window the dialog belongs to
+        dialog: Toplevel to place
+        width: Dialog width in pixels
+        height: Dialog height in pixels
+    """
+    parent_width, parent_height = _parent_size(parent)
+    x = parent.winfo_rootx() + (parent_width - width) // 2
+    y = parent.winfo_rooty() + (parent_height - height) // 2
+    dialog.geometry(f"{width}x{height}+{x}+{y}")
@@ -0,0 +1,40 @@
+"""
+Shared named fonts for the enhanced UI components
+
+Passing a font tuple makes Tk parse and resolve it again for every widget;
+a named font is resolved once and then referenced by name.
+"""
+
+import tkinter.font as tkfont
+
+
+def ui_font(widget, spec):
+    """
+    Return the named font for a font tuple, creating it on first use
+
+    Fonts belong to a Tk interpreter, so the cache lives on the widget's root
+    window and a new root gets fresh fonts.
+
+    Args:
+        widget: Any widget of the Tk interpreter the font is used in
+        spec: Font tuple such as ("Helvetica", 10, "bold")
+
+    Returns:
+        tkinter.font.Font for the tuple
+    """
+    root = widget._root()
+    fonts = getattr(root, '_ui_fonts', None)
+    if fonts is None:
+        fonts = root._ui_fonts = {}
+
+    font = fonts.get(spec)
+    if font is None:
+        family, size, *styles = spec
+        font = fonts[spec] = tkfont.Font(
+            root=root,
+            family=family,
+            size=size,
+            weight="bold" if "bold" in styles else "normal",
+            slant="italic" if "italic" in styles else "roman"
+        )
+    return font
@@ -5,6 +5,21 @@ Category selector UI component for the Pomodoro Timer
 import tkinter as tk
 from tkinter import ttk, simpledialog
 
+from pomodoro_enhanced.ui._dialog_utils import center_dialog
+from pomodoro_enhanced.ui._fonts import ui_font
+
+# Font specs, resolved to shared named fonts by ui_font
+_F14B = ("Helvetica", 14, "bold")
+
+# Look of the category list; the selected row uses the highlight colour the
+# old per-row Selected.TFrame style was meant to show
+_LIST_OPTIONS = {
+    "activestyle": "dotbox",
+    "exportselection": False,
+    "selectbackground": "#e1f5fe",
+    "selectforeground": "#000000",
+}
+
 def show_category_selector(parent, categories, current_category, callback):
     """
     Display a popup dialog for selecting a work category
@@ -17,83 +32,46 @@ def show_category_selector(parent, categories, current_category, callback):
     """
     dialog = tk.Toplevel(parent)
     dialog.title("Select Work Category")
-    dialog.geometry("300x400")
     dialog.resizable(False, False)
     dialog.transient(parent)
     dialog.grab_set()
     
-    # Center the dialog
-    dialog.update_idletasks()
-    width = dialog.winfo_width()
-    height = dialog.winfo_height()
-    x = parent.winfo_rootx() + (parent.winfo_width() // 2) - (width // 2)
-    y = parent.winfo_rooty() + (parent.winfo_height() // 2) - (height // 2)
-    dialog.geometry(f"+{x}+{y}")
+    # Size the dialog and center it over the parent
+    center_dialog(parent, dialog, 300, 400)
     
     # Create main frame
     main_frame = ttk.Frame(dialog, padding=10)
     main_frame.pack(fill=tk.BOTH, expand=True)
     
     # Add title
-    title_label = ttk.Label(main_frame, text="Work Categories", font=("Helvetica", 14, "bold"))
+    title_label = ttk.Label(main_frame, text="Work Categories", font=ui_font(dialog, _F14B))
     title_label.pack(pady=(0, 10))
     
-    # Create scrollable frame for categories
+    # Category list; one native listbox draws every row, however many
+    # custom categories there are
     container = ttk.Frame(main_frame)
     container.pack(fill=tk.BOTH, expand=True, pady=5)
     
-    canvas = tk.Canvas(container, highlightthickness=0)
-    scrollbar = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
-    scrollable_frame = ttk.Frame(canvas)
+    listbox = tk.Listbox(container, **_LIST_OPTIONS)
+    scrollbar = ttk.Scrollbar(container, orient="vertical", command=listbox.yview)
+    listbox.configure(yscrollcommand=scrollbar.set)
     
-    scrollable_frame.bind(
-        "<Configure>",
-        lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-    )
-    
-    canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-    canvas.configure(yscrollcommand=scrollbar.set)
+    listbox.insert(tk.END, *categories)
     
-    canvas.pack(side="left", fill="both", expand=True)
+    listbox.pack(side="left", fill="both", expand=True)
     scrollbar.pack(side="right", fill="y")
     
-    # Category list
-    for i, category in enumerate(categories):
-        category_frame = ttk.Frame(scrollable_frame)
-        category_frame.pack(fill=tk.X, pady=2)
-        
-        # Highlight current category
-        bg_color = "#f0f0f0" if category != current_category else "#e1f5fe"
-        category_frame.configure(style="Selected.TFrame" if category == current_category else "TFrame")
-        
-        # Category button
-        cat_button = ttk.Button(
-            category_frame, 
-            text=category,
-            command=lambda cat=category: select_category(cat)
-        )
-        cat_button.pack(fill=tk.X, padx=5, pady=2)
-    
-    # Add custom category button
-    separator = ttk.Separator(main_frame, orient="horizontal")
-    separator.pack(fill=tk.X, pady=10)
-    
-    add_button = ttk.Button(
-        main_frame,
-        text="+ Add Custom Category",
-        command=add_custom_category
-    )
-    add_button.pack(fill=tk.X, pady=5)
-    
-    # Close button
-    close_button = ttk.Button(main_frame, text="Close", command=dialog.destroy)
-    close_button.pack(fill=tk.X, pady=10)
-    
     def select_category(category):
         """Handle category selection"""
         callback(category)
         dialog.destroy()
     
+    def on_choose(event):
+        """Select the clicked or keyboard-chosen category"""
+        selection = listbox.curselection()
+        if selection:
+            select_category(listbox.get(selection[0]))
+    
     def add_custom_category():
         """Create a new custom category"""
         new_category = simpledialog.askstring(
@@ -106,5 +84,31 @@ def show_category_selector(parent, categories, current_category, callback):
             callback(new_category.strip())
             dialog.destroy()
     
+    # Highlight current category
+    if current_category in categories:
+        current_index = categories.index(current_category)
+        listbox.selection_set(current_index)
+        listbox.activate(current_index)
+        listbox.see(current_index)
+    
+    listbox.bind("<ButtonRelease-1>", on_choose)
+    listbox.bind("<Return>", on_choose)
+    listbox.focus_set()
+    
+    # Add custom category button
+    separator = ttk.Separator(main_frame, orient="horizontal")
+    separator.pack(fill=tk.X, pady=10)
+    
+    add_button = ttk.Button(
+        main_frame,
+        text="+ Add Custom Category",
+        command=add_custom_category
+    )
+    add_button.pack(fill=tk.X, pady=5)
+    
+    # Close button
+    close_button = ttk.Button(main_frame, text="Close", command=dialog.destroy)
+    close_button.pack(fill=tk.X, pady=10)
+    
     # Wait for the dialog to close
     parent.wait_window(dialog)
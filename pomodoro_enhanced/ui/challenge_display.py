@@ -6,6 +6,18 @@ Provides UI components for showing challenges in the main application window
 import tkinter as tk
 from tkinter import ttk
 
+from pomodoro_enhanced.ui._fonts import ui_font
+
+# Font specs, resolved to shared named fonts by ui_font
+_F8 = ("Helvetica", 8)
+_F9 = ("Helvetica", 9)
+_F10 = ("Helvetica", 10)
+_F10I = ("Helvetica", 10, "italic")
+
+# Natural size of the mini progress bar, in pixels
+_PROGRESS_WIDTH = 200
+_PROGRESS_HEIGHT = 10
+
 class MiniChallengeDisplay(ttk.Frame):
     """A compact widget for displaying challenge information in the main UI"""
     
@@ -35,115 +47,200 @@ class MiniChallengeDisplay(ttk.Frame):
         info_frame.pack(fill=tk.X, expand=True)
         
         # Challenge description with icon
-        description = self.challenge.get('description', 'Challenge')
-        
-        description_label = tk.Label(
+        self._desc_lbl = tk.Label(
             info_frame,
-            text=description,
-            font=("Helvetica", 10),
-            fg=self.fg_color,
-            bg=self.bg_color,
+            font=ui_font(self, _F10),
             anchor='w',
             justify=tk.LEFT
         )
-        description_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self._desc_lbl.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         # Points indicator
-        points = self.challenge.get('reward_points', 0)
-        points_label = tk.Label(
+        self._points_lbl = tk.Label(
             info_frame,
-            text=f"{points} pts",
-            font=("Helvetica", 9),
-            fg=self.fg_color,
-            bg=self.bg_color
+            font=ui_font(self, _F9)
         )
-        points_label.pack(side=tk.RIGHT, padx=5)
+        self._points_lbl.pack(side=tk.RIGHT, padx=5)
         
         # Progress bar if applicable
-        if 'target_value' in self.challenge and self.challenge['target_value'] is not None:
+        self._has_target = self.challenge.get('target_value') is not None
+        if self._has_target:
             progress_frame = ttk.Frame(self)
             progress_frame.pack(fill=tk.X, padx=5, pady=(0, 5))
             
-            progress = self.challenge.get('progress', 0)
-            target = self.challenge.get('target_value', 1)
+            # Create progress bar; a plain canvas rectangle whose width is
+            # moved on update, cheaper to redraw than a themed Progressbar
+            self._progress_bar = tk.Canvas(
+                progress_frame,
+                width=_PROGRESS_WIDTH,
+                height=_PROGRESS_HEIGHT,
+                highlightthickness=0,
+                bg="#e0e0e0"
+            )
+            self._progress_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            self._progress_fill = self._progress_bar.create_rectangle(
+                0, 0, 0, _PROGRESS_HEIGHT, fill="#4caf50", outline=""
+            )
+            self._progress_value = 0
+            self._progress_bar.bind("<Configure>", self._draw_progress)
             
-            # Create progress bar
-            progress_bar = ttk.Progressbar(
+            # Progress text
+            self._progress_text = tk.Label(
                 progress_frame,
-                orient="horizontal",
-                length=200,
-                mode="determinate"
+                font=ui_font(self, _F8)
             )
-            progress_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            self._progress_text.pack(side=tk.LEFT, padx=5)
+        else:
+            self._progress_bar = None
+            self._progress_text = None
+        
+        self._refresh_widgets()
+    
+    def _refresh_widgets(self):
+        """Show the current challenge data and colors in the existing widgets"""
+        challenge = self.challenge
+        fg_color = self.fg_color
+        bg_color = self.bg_color
+        
+        self._desc_lbl.configure(
+            text=challenge.get('description', 'Challenge'),
+            fg=fg_color,
+            bg=bg_color
+        )
+        self._points_lbl.configure(
+            text=f"{challenge.get('reward_points', 0)} pts",
+            fg=fg_color,
+            bg=bg_color
+        )
+        
+        if self._has_target:
+            progress = challenge.get('progress', 0)
+            target = challenge['target_value']
             
             # Calculate progress percentage
             progress_value = min(100, (progress / target) * 100) if target > 0 else 0
-            progress_bar["value"] = progress_value
-            
-            # Progress text
-            progress_text = tk.Label(
-                progress_frame,
+            self._progress_value = progress_value
+            self._draw_progress()
+            self._progress_text.configure(
                 text=f"{progress}/{target}",
-                font=("Helvetica", 8),
-                fg=self.fg_color,
-                bg=self.bg_color
+                fg=fg_color,
+                bg=bg_color
             )
-            progress_text.pack(side=tk.LEFT, padx=5)
+    
+    def _draw_progress(self, event=None):
+        """Size the progress fill to the current value and bar width"""
+        width = event.width if event is not None else self._progress_bar.winfo_width()
+        if width <= 1:
+            # Not laid out yet; <Configure> redraws once it is
+            width = _PROGRESS_WIDTH
+        self._progress_bar.coords(
+            self._progress_fill,
+            0, 0, width * self._progress_value / 100, _PROGRESS_HEIGHT
+        )
     
     def update(self, challenge=None):
         """Update the display with new challenge data"""
         if challenge:
             self.challenge = challenge
         
-        # Clear existing widgets
-        for widget in self.winfo_children():
-            widget.destroy()
-        
-        # Recreate widgets with updated data
-        self._create_widgets()
+        # Widgets are rebuilt only when the progress section appears or goes
+        if (self.challenge.get('target_value') is not None) != self._has_target:
+            for widget in self.winfo_children():
+                widget.destroy()
+            self._create_widgets()
+        else:
+            self._refresh_widgets()
 
 
 def populate_challenges_frame(parent_frame, challenges, fg_color="#000000", bg_color="#FFFFFF"):
     """
-    Add challenge displays to a parent frame
+    Show challenge displays in a parent frame
+    
+    The first call fills the frame right away. Further calls made before Tk
+    next goes idle are coalesced: only the last one is applied, from an
+    after_idle callback, so a burst of refreshes costs one extra rebuild.
     
     Args:
         parent_frame: Frame to add challenge displays to
         challenges: List of challenge dictionaries
         fg_color: Foreground color for text
         bg_color: Background color
-    
+        
     Returns:
-        List of created MiniChallengeDisplay widgets
+        List of created MiniChallengeDisplay widgets, or None if the call
+        was coalesced into the pending idle rebuild
     """
-    # Clear any existing widgets
+    if getattr(parent_frame, '_populate_idle_id', None) is not None:
+        parent_frame._pending_challenges = (list(challenges), fg_color, bg_color)
+        return None
+    
+    parent_frame._pending_challenges = None
+    parent_frame._populate_idle_id = parent_frame.after_idle(_flush_challenges_frame, parent_frame)
+    return _fill_challenges_frame(parent_frame, challenges, fg_color, bg_color)
+
+
+def _flush_challenges_frame(parent_frame):
+    """Apply the last call coalesced since the frame was filled, if any"""
+    parent_frame._populate_idle_id = None
+    pending = parent_frame._pending_challenges
+    if pending is not None:
+        parent_frame._pending_challenges = None
+        _fill_challenges_frame(parent_frame, *pending)
+
+
+def _fill_challenges_frame(parent_frame, challenges, fg_color, bg_color):
+    """Rebuild the challenge displays of a frame now"""
+    # Displays and the empty-state label from earlier calls are kept and
+    # reused instead of rebuilt
+    pool = getattr(parent_frame, '_mini_displays', None)
+    if pool is None:
+        pool = parent_frame._mini_displays = []
+    empty_label = getattr(parent_frame, '_empty_label', None)
+    
+    # Clear any other existing widgets
     for widget in parent_frame.winfo_children():
-        widget.destroy()
+        if widget not in pool and widget is not empty_label:
+            widget.destroy()
     
     # If no challenges, show a message
     if not challenges:
-        no_challenges_label = tk.Label(
-            parent_frame,
-            text="All daily challenges completed!",
-            font=("Helvetica", 10, "italic"),
-            fg=fg_color,
-            bg=bg_color,
-            pady=10
-        )
-        no_challenges_label.pack(fill=tk.X, expand=True)
+        for display in pool:
+            display.pack_forget()
+        if empty_label is None:
+            empty_label = parent_frame._empty_label = tk.Label(
+                parent_frame,
+                text="All daily challenges completed!",
+                font=ui_font(parent_frame, _F10I),
+                pady=10
+            )
+        empty_label.configure(fg=fg_color, bg=bg_color)
+        empty_label.pack(fill=tk.X, expand=True)
         return []
     
-    # Create display widgets for each challenge (up to 3)
-    displays = []
-    for challenge in challenges[:3]:
-        display = MiniChallengeDisplay(
-            parent_frame,
-            challenge,
-            fg_color,
-            bg_color,
-            padding=5
-        )
+    if empty_label is not None:
+        empty_label.pack_forget()
+    
+    # Show a display for each challenge (up to 3)
+    shown = challenges[:3]
+    for index, challenge in enumerate(shown):
+        if index < len(pool):
+            display = pool[index]
+            display.fg_color = fg_color
+            display.bg_color = bg_color
+            display.update(challenge)
+        else:
+            display = MiniChallengeDisplay(
+                parent_frame,
+                challenge,
+                fg_color,
+                bg_color,
+                padding=5
+            )
+            pool.append(display)
         display.pack(fill=tk.X, pady=2)
-        displays.append(display)
     
-    return displays
+    # Hide displays left over from longer lists
+    for display in pool[len(shown):]:
+        display.pack_forget()
+    
+    return pool[:len(shown)]
@@ -3,26 +3,60 @@ Challenges UI panel for the Pomodoro Timer
 Displays active challenges and progress in a visually appealing way
 """
 
+import bisect
+import functools
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime
+from datetime import date
+
+from pomodoro_enhanced.ui._dialog_utils import center_dialog
+from pomodoro_enhanced.ui._fonts import ui_font
+
+# Font specs, resolved to shared named fonts by ui_font
+_F8 = ("Helvetica", 8)
+_F10 = ("Helvetica", 10)
+_F10B = ("Helvetica", 10, "bold")
+_F11 = ("Helvetica", 11)
+_F11B = ("Helvetica", 11, "bold")
+_F12 = ("Helvetica", 12)
+_F16B = ("Helvetica", 16, "bold")
+
+
+# Gap kept around each card in the challenges list
+_CARD_PAD = 5
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_expiry(expiry_date):
+    """Parse a challenge's YYYY-MM-DD expiry date"""
+    return date.fromisoformat(expiry_date)
+
+
+def _field(challenge, key, default=None):
+    """Read a field from a Challenge object or a challenge dictionary"""
+    if isinstance(challenge, dict):
+        return challenge.get(key, default)
+    return getattr(challenge, key, default)
 
 
 class ChallengeCard(ttk.Frame):
     """A card widget that displays a single challenge with its progress"""
     
-    def __init__(self, parent, challenge, **kwargs):
+    def __init__(self, parent, challenge, today=None, **kwargs):
         """
         Initialize a challenge card
         
         Args:
             parent: Parent widget
             challenge: Challenge data dictionary
+            today: Date expiry is counted from, so a list of cards can share
+                one clock reading; defaults to today
             **kwargs: Additional keyword arguments for the frame
         """
         super().__init__(parent, **kwargs)
         
-        self.challenge = challenge
+        self.challenge = None
+        self._today = today if today is not None else date.today()
         
         # Configure style
         self.configure(relief="raised", borderwidth=1, padding=8)
@@ -32,133 +66,207 @@ class ChallengeCard(ttk.Frame):
         title_frame.pack(fill=tk.X, expand=True)
         
         # Challenge title
-        if hasattr(challenge, 'title'):
-            title = challenge.title
-        elif isinstance(challenge, dict) and 'title' in challenge:
-            title = challenge['title']
-        else:
-            title = 'Challenge'
-            
-        title_label = ttk.Label(
+        self._title_label = ttk.Label(
             title_frame, 
-            text=title,
-            font=("Helvetica", 11, "bold")
+            font=ui_font(self, _F11B)
         )
-        title_label.pack(side=tk.LEFT, anchor=tk.W)
+        self._title_label.pack(side=tk.LEFT, anchor=tk.W)
         
         # Points indicator
-        if hasattr(challenge, 'reward_points'):
-            points = challenge.reward_points
-        elif isinstance(challenge, dict) and 'reward_points' in challenge:
-            points = challenge['reward_points']
-        else:
-            points = 0
-            
-        points_label = ttk.Label(
+        self._points_label = ttk.Label(
             title_frame,
-            text=f"{points} pts",
-            font=("Helvetica", 10),
+            font=ui_font(self, _F10),
         )
-        points_label.pack(side=tk.RIGHT, anchor=tk.E)
+        self._points_label.pack(side=tk.RIGHT, anchor=tk.E)
         
         # Description
-        if hasattr(challenge, 'description'):
-            description = challenge.description
-        elif isinstance(challenge, dict) and 'description' in challenge:
-            description = challenge['description']
-        else:
-            description = ''
-            
-        desc_label = ttk.Label(
+        self._desc_label = ttk.Label(
             self,
-            text=description,
             wraplength=300,
             justify=tk.LEFT
         )
-        desc_label.pack(fill=tk.X, pady=(5, 10), anchor=tk.W)
+        self._desc_label.pack(fill=tk.X, pady=(5, 10), anchor=tk.W)
+        
+        # Progress section, packed only for challenges with a target
+        self._progress_frame = ttk.Frame(self)
+        
+        self._progress_bar = ttk.Progressbar(
+            self._progress_frame,
+            orient="horizontal",
+            length=200,
+            mode="determinate"
+        )
+        self._progress_bar.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        
+        self._progress_text = ttk.Label(self._progress_frame)
+        self._progress_text.pack(side=tk.RIGHT)
+        
+        # Completion status, packed only for completed challenges
+        self._status_label = ttk.Label(
+            self,
+            text="✓ Completed",
+            foreground="green",
+            font=ui_font(self, _F10B)
+        )
         
-        # Progress section
-        progress_frame = ttk.Frame(self)
-        progress_frame.pack(fill=tk.X)
+        # Expiry info, packed only when the expiry date can be read
+        self._expiry_label = ttk.Label(
+            self,
+            font=ui_font(self, _F8),
+            foreground="gray"
+        )
+        
+        self.rebind(challenge)
+    
+    def rebind(self, challenge):
+        """
+        Show another challenge in this card, reusing its widgets
+        
+        Args:
+            challenge: Challenge object or data dictionary
+        """
+        self.challenge = challenge
+        
+        # Optional sections are re-packed below in their fixed order
+        self._progress_frame.pack_forget()
+        self._status_label.pack_forget()
+        self._expiry_label.pack_forget()
+        
+        # Read every field once, from an object or a dictionary
+        title = _field(challenge, 'title', 'Challenge')
+        points = _field(challenge, 'reward_points', 0)
+        description = _field(challenge, 'description', '')
+        target = _field(challenge, 'target_value')
+        completed = _field(challenge, 'completed', False)
+        expiry_date = _field(challenge, 'expiry_date')
+        
+        # Challenge title, points indicator and description
+        self._title_label.configure(text=title)
+        self._points_label.configure(text=f"{points} pts")
+        self._desc_label.configure(text=description)
         
         # Add progress bar if applicable
-        has_target = False
-        if hasattr(challenge, 'target_value') and challenge.target_value is not None:
-            has_target = True
-            target = challenge.target_value
-            progress = getattr(challenge, 'progress', 0)
-        elif isinstance(challenge, dict) and 'target_value' in challenge and challenge['target_value'] is not None:
-            has_target = True
-            target = challenge['target_value']
-            progress = challenge.get('progress', 0)
-            
-        if has_target:
-            
-            # Progress bar
-            progress_bar = ttk.Progressbar(
-                progress_frame,
-                orient="horizontal",
-                length=200,
-                mode="determinate"
-            )
-            progress_bar.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        if target is not None:
+            progress = _field(challenge, 'progress', 0)
             
             # Set progress value (0-100)
             progress_percentage = min(100, (progress / target) * 100) if target > 0 else 0
-            progress_bar["value"] = progress_percentage
-            
-            # Progress text
-            progress_text = ttk.Label(
-                progress_frame,
-                text=f"{progress}/{target}"
-            )
-            progress_text.pack(side=tk.RIGHT)
+            self._progress_bar["value"] = progress_percentage
+            self._progress_text.configure(text=f"{progress}/{target}")
+            self._progress_frame.pack(fill=tk.X)
         
         # Completion status
-        if hasattr(challenge, 'completed'):
-            completed = challenge.completed
-        elif isinstance(challenge, dict) and 'completed' in challenge:
-            completed = challenge['completed']
-        else:
-            completed = False
-            
         if completed:
-            status_label = ttk.Label(
-                self,
-                text="✓ Completed",
-                foreground="green",
-                font=("Helvetica", 10, "bold")
-            )
-            status_label.pack(anchor=tk.E, pady=(5, 0))
+            self._status_label.pack(anchor=tk.E, pady=(5, 0))
         
         # Add expiry info
-        has_expiry = False
-        if hasattr(challenge, 'expiry_date'):
-            expiry_date = challenge.expiry_date
-            has_expiry = True
-        elif isinstance(challenge, dict) and 'expiry_date' in challenge:
-            expiry_date = challenge['expiry_date']
-            has_expiry = True
-            
-        if has_expiry:
+        if expiry_date is not None:
             try:
-                expiry = datetime.strptime(expiry_date, "%Y-%m-%d")
-                today = datetime.now()
-                days_left = (expiry - today).days + 1
+                days_left = (_parse_expiry(expiry_date) - self._today).days
                 
                 expiry_text = f"Expires today" if days_left == 0 else f"Expires in {days_left} days"
                 
-                expiry_label = ttk.Label(
-                    self,
-                    text=expiry_text,
-                    font=("Helvetica", 8),
-                    foreground="gray"
-                )
-                expiry_label.pack(anchor=tk.W, pady=(5, 0))
+                self._expiry_label.configure(text=expiry_text)
+                self._expiry_label.pack(anchor=tk.W, pady=(5, 0))
             except Exception:
                 pass
 
 
+class _VirtualCardList:
+    """
+    Challenge cards laid out in rows of their own height on a canvas
+    
+    Only rows overlapping the visible part of the canvas have a card; cards
+    of rows scrolled out of view are hidden and rebound to rows scrolling in,
+    so the widget count stays proportional to the viewport, not the list.
+    Row heights are measured once and kept as a prefix-sum offset table, so
+    the rows in view are found by bisection.
+    """
+    
+    def __init__(self, canvas, challenges):
+        """
+        Args:
+            canvas: Canvas the cards are drawn on
+            challenges: Challenges to list, in display order
+        """
+        self.canvas = canvas
+        self.challenges = challenges
+        self.today = date.today()  # shared by every card's expiry text
+        self.visible = {}  # row index -> (card, canvas window id)
+        self.pool = []  # hidden (card, canvas window id) pairs
+        self.offsets = self._measure_offsets()  # row i spans offsets[i]..offsets[i + 1]
+        
+        canvas.configure(scrollregion=(0, 0, 0, self.offsets[-1]))
+        canvas.bind("<Configure>", self._on_resize, add="+")
+    
+    def _new_card(self, challenge):
+        """Create a hidden card with its canvas window"""
+        card = ChallengeCard(self.canvas, challenge, today=self.today)
+        item = self.canvas.create_window(0, 0, window=card, anchor="nw", state="hidden")
+        return card, item
+    
+    def _measure_offsets(self):
+        """Measure every row on one off-screen card and sum up the offsets"""
+        probe, item = self._new_card(self.challenges[0])
+        heights = {}  # card content that sets the height -> row height
+        offsets = [0]
+        for challenge in self.challenges:
+            key = (
+                str(_field(challenge, 'description', '')),
+                _field(challenge, 'target_value') is not None,
+                bool(_field(challenge, 'completed', False)),
+                _field(challenge, 'expiry_date'),
+            )
+            height = heights.get(key)
+            if height is None:
+                probe.rebind(challenge)
+                probe.update_idletasks()
+                height = heights[key] = probe.winfo_reqheight() + 2 * _CARD_PAD
+            offsets.append(offsets[-1] + height)
+        self.pool.append((probe, item))
+        return offsets
+    
+    def _on_resize(self, event):
+        """Stretch the shown cards to the new canvas width"""
+        width = max(1, event.width - 2 * _CARD_PAD)
+        for card, item in self.visible.values():
+            self.canvas.itemconfigure(item, width=width)
+        self.refresh()
+    
+    def refresh(self):
+        """Materialize the rows in view and recycle the rest"""
+        canvas = self.canvas
+        offsets = self.offsets
+        top = canvas.canvasy(0)
+        first = max(0, bisect.bisect_right(offsets, top) - 1)
+        last = min(
+            len(self.challenges),
+            bisect.bisect_left(offsets, top + canvas.winfo_height())
+        )
+        
+        # Hide cards whose rows left the viewport
+        for index in [i for i in self.visible if not first <= i < last]:
+            card, item = self.visible.pop(index)
+            canvas.itemconfigure(item, state="hidden")
+            self.pool.append((card, item))
+        
+        # Bind cards to rows that entered it
+        width = max(1, canvas.winfo_width() - 2 * _CARD_PAD)
+        for index in range(first, last):
+            if index in self.visible:
+                continue
+            challenge = self.challenges[index]
+            if self.pool:
+                card, item = self.pool.pop()
+                card.rebind(challenge)
+            else:
+                card, item = self._new_card(challenge)
+            height = offsets[index + 1] - offsets[index] - 2 * _CARD_PAD
+            canvas.coords(item, _CARD_PAD, offsets[index] + _CARD_PAD)
+            canvas.itemconfigure(item, state="normal", width=width, height=height)
+            self.visible[index] = (card, item)
+
+
 def show_challenges_window(parent, challenges, points=0, callback=None):
     """
     Display a window showing all active challenges
@@ -171,18 +279,12 @@ def show_challenges_window(parent, challenges, points=0, callback=None):
     """
     dialog = tk.Toplevel(parent)
     dialog.title("Daily Challenges")
-    dialog.geometry("400x500")
     dialog.minsize(350, 400)
     dialog.transient(parent)
     dialog.grab_set()
     
-    # Center the dialog
-    dialog.update_idletasks()
-    width = dialog.winfo_width()
-    height = dialog.winfo_height()
-    x = parent.winfo_rootx() + (parent.winfo_width() // 2) - (width // 2)
-    y = parent.winfo_rooty() + (parent.winfo_height() // 2) - (height // 2)
-    dialog.geometry(f"+{x}+{y}")
+    # Size the dialog and center it over the parent
+    center_dialog(parent, dialog, 400, 500)
     
     # Create main frame
     main_frame = ttk.Frame(dialog, padding=15)
@@ -195,14 +297,14 @@ def show_challenges_window(parent, challenges, points=0, callback=None):
     title_label = ttk.Label(
         header_frame, 
         text="Daily Challenges", 
-        font=("Helvetica", 16, "bold")
+        font=ui_font(dialog, _F16B)
     )
     title_label.pack(side=tk.LEFT)
     
     points_label = ttk.Label(
         header_frame,
         text=f"Total Points: {points}",
-        font=("Helvetica", 12)
+        font=ui_font(dialog, _F12)
     )
     points_label.pack(side=tk.RIGHT)
     
@@ -212,39 +314,37 @@ def show_challenges_window(parent, challenges, points=0, callback=None):
     
     canvas = tk.Canvas(container, highlightthickness=0)
     scrollbar = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
-    scrollable_frame = ttk.Frame(canvas)
-    
-    scrollable_frame.bind(
-        "<Configure>",
-        lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-    )
-    
-    canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
     canvas.configure(yscrollcommand=scrollbar.set)
     
     canvas.pack(side="left", fill="both", expand=True)
     scrollbar.pack(side="right", fill="y")
     
-    # Sort challenges - completed ones at the bottom
-    active_challenges = [c for c in challenges if not c.get('completed', False)]
-    completed_challenges = [c for c in challenges if c.get('completed', False)]
-    sorted_challenges = active_challenges + completed_challenges
-    
     # Display challenges
-    if not sorted_challenges:
+    if not challenges:
         no_challenges_label = ttk.Label(
-            scrollable_frame,
+            canvas,
             text="No active challenges. New challenges will appear tomorrow!",
-            font=("Helvetica", 11),
+            font=ui_font(dialog, _F11),
             padding=20,
             wraplength=300,
             justify=tk.CENTER
         )
-        no_challenges_label.pack(pady=50)
+        canvas.create_window((0, 50), window=no_challenges_label, anchor="nw")
     else:
-        for challenge in sorted_challenges:
-            challenge_card = ChallengeCard(scrollable_frame, challenge)
-            challenge_card.pack(fill=tk.X, pady=5, padx=5)
+        # Completed challenges go to the bottom; the sort is stable, so
+        # each group keeps the caller's order
+        sorted_challenges = sorted(
+            challenges, key=lambda c: bool(_field(c, 'completed', False))
+        )
+        
+        # Only cards in view are built; scrolling rebinds them to new rows
+        card_list = _VirtualCardList(canvas, sorted_challenges)
+        
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            card_list.refresh()
+        
+        canvas.configure(yscrollcommand=on_scroll)
     
     # Footer with buttons
     footer_frame = ttk.Frame(main_frame)
@@ -269,6 +369,18 @@ def show_challenges_window(parent, challenges, points=0, callback=None):
     parent.wait_window(dialog)
 
 
+def _mini_challenge_text(challenge):
+    """Build the one-line text of a mini challenge display"""
+    get = challenge.get
+    target = get('target_value')
+    text = f"{get('description', 'Challenge')} ({get('reward_points', 0)} pts)"
+    
+    # Challenge name with progress
+    if target is not None:
+        return f"{get('progress', 0)}/{target} - {text}"
+    return text
+
+
 def create_mini_challenge_display(parent, challenge, fg_color="#000000", bg_color="#FFFFFF"):
     """
     Create a compact challenge display for the main UI
@@ -283,25 +395,30 @@ def create_mini_challenge_display(parent, challenge, fg_color="#000000", bg_colo
         Frame containing the challenge display
     """
     frame = ttk.Frame(parent)
-    
-    # Challenge name with progress
-    if challenge.get('target_value') is not None:
-        progress = challenge.get('progress', 0)
-        target = challenge.get('target_value', 1)
-        progress_text = f"{progress}/{target} - "
-    else:
-        progress_text = ""
-    
-    description = challenge.get('description', 'Challenge')
-    points = challenge.get('reward_points', 0)
-    
-    challenge_text = f"{progress_text}{description} ({points} pts)"
+    frame._last_txt = _mini_challenge_text(challenge)
     
     challenge_label = ttk.Label(
         frame,
-        text=challenge_text,
+        text=frame._last_txt,
         wraplength=350
     )
     challenge_label.pack(side=tk.LEFT, anchor=tk.W, pady=2)
+    frame._challenge_label = challenge_label
     
     return frame
+
+
+def update_mini_challenge_display(frame, challenge):
+    """
+    Show another challenge in a frame from create_mini_challenge_display
+    
+    Args:
+        frame: Frame returned by create_mini_challenge_display
+        challenge: Challenge dictionary
+    """
+    text = _mini_challenge_text(challenge)
+    
+    # Leave the label alone, and unrepainted, when its text is unchanged
+    if text != frame._last_txt:
+        frame._last_txt = text
+        frame._challenge_label.configure(text=text)
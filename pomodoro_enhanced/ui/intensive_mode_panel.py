@@ -2,9 +2,16 @@
 Intensive Mode UI components for the Pomodoro Timer
 """
 
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime, timedelta
+
+from pomodoro_enhanced.ui._dialog_utils import center_dialog
+from pomodoro_enhanced.ui._fonts import ui_font
+
+# Font specs, resolved to shared named fonts by ui_font
+_F10B = ("Helvetica", 10, "bold")
+_F16B = ("Helvetica", 16, "bold")
 
 def show_intensive_mode_dialog(parent, callback):
     """
@@ -16,18 +23,12 @@ def show_intensive_mode_dialog(parent, callback):
     """
     dialog = tk.Toplevel(parent)
     dialog.title("Intensive Work Mode")
-    dialog.geometry("350x400")
     dialog.resizable(False, False)
     dialog.transient(parent)
     dialog.grab_set()
     
-    # Center the dialog
-    dialog.update_idletasks()
-    width = dialog.winfo_width()
-    height = dialog.winfo_height()
-    x = parent.winfo_rootx() + (parent.winfo_width() // 2) - (width // 2)
-    y = parent.winfo_rooty() + (parent.winfo_height() // 2) - (height // 2)
-    dialog.geometry(f"+{x}+{y}")
+    # Size the dialog and center it over the parent
+    center_dialog(parent, dialog, 350, 400)
     
     # Create main frame
     main_frame = ttk.Frame(dialog, padding=15)
@@ -37,7 +38,7 @@ def show_intensive_mode_dialog(parent, callback):
     title_label = ttk.Label(
         main_frame, 
         text="Intensive Mode", 
-        font=("Helvetica", 16, "bold")
+        font=ui_font(dialog, _F16B)
     )
     title_label.pack(pady=(0, 5))
     
@@ -183,16 +184,17 @@ class IntensiveModeTimer(tk.Frame):
         super().__init__(parent, **kwargs)
         
         self.active = False
-        self.end_time = None
-        self.update_interval = 1000  # Update every second
-        self.after_id = None
+        self._end_mono = None  # time.monotonic() deadline, immune to clock changes
+        self._last_str = None  # text last written to timer_var
+        self.after_id = None  # next display refresh
+        self._completion_id = None  # completion check at the end time
         
         # Timer display
         self.timer_var = tk.StringVar(value="")
         self.timer_label = ttk.Label(
             self,
             textvariable=self.timer_var,
-            font=("Helvetica", 10, "bold")
+            font=ui_font(self, _F10B)
         )
         self.timer_label.pack(side=tk.LEFT, padx=5)
         
@@ -210,49 +212,77 @@ class IntensiveModeTimer(tk.Frame):
     
     def start(self, duration_minutes, stop_callback=None):
         """Start the intensive mode timer"""
+        self._cancel_pending()
         self.active = True
-        self.end_time = datetime.now() + timedelta(minutes=duration_minutes)
+        self._end_mono = time.monotonic() + duration_minutes * 60
         self.stop_callback = stop_callback
         
         # Show the stop button
         self.stop_button.pack(side=tk.LEFT, padx=5)
         
-        # Update the timer
+        # Completion fires once at the end time; the display refreshes on its
+        # own schedule
+        self._completion_id = self.after(int(duration_minutes * 60 * 1000), self._on_complete)
         self._update_timer()
     
     def stop(self):
         """Stop the timer"""
         self.active = False
-        self.timer_var.set("")
+        self._set_text("")
         self.stop_button.pack_forget()
         
+        self._cancel_pending()
+    
+    def _cancel_pending(self):
+        """Cancel the scheduled display refresh and completion check"""
         if self.after_id:
             self.after_cancel(self.after_id)
             self.after_id = None
+        if self._completion_id:
+            self.after_cancel(self._completion_id)
+            self._completion_id = None
     
     def _update_timer(self):
         """Update the timer display"""
-        if not self.active or not self.end_time:
+        self.after_id = None
+        if not self.active or self._end_mono is None:
             return
         
-        remaining = self.end_time - datetime.now()
-        
-        # Check if timer has expired
-        if remaining.total_seconds() <= 0:
-            self.timer_var.set("Completed!")
-            if self.stop_callback:
-                self.stop_callback(completed=True)
+        remaining = self._end_mono - time.monotonic()
+        if remaining <= 0:
+            # Completion is handled by _on_complete
             return
         
         # Format remaining time
-        hours, remainder = divmod(remaining.total_seconds(), 3600)
+        hours, remainder = divmod(int(remaining), 3600)
         minutes, seconds = divmod(remainder, 60)
-        time_str = f"{int(hours):02d}:{int(minutes):02d}:{int(seconds):02d}"
+        self._set_text(f"Remaining: {hours:02d}:{minutes:02d}:{seconds:02d}")
         
-        self.timer_var.set(f"Remaining: {time_str}")
+        # Refresh just after the shown second ticks over
+        self.after_id = self.after(int((remaining % 1) * 1000) + 1, self._update_timer)
+    
+    def _on_complete(self):
+        """Finish the session once the end time is reached"""
+        self._completion_id = None
+        if not self.active or self._end_mono is None:
+            return
         
-        # Schedule next update
-        self.after_id = self.after(self.update_interval, self._update_timer)
+        # Re-check against the clock in case the callback ran early
+        remaining = self._end_mono - time.monotonic()
+        if remaining > 0:
+            self._completion_id = self.after(int(remaining * 1000) + 1, self._on_complete)
+            return
+        
+        self._cancel_pending()
+        self._set_text("Completed!")
+        if self.stop_callback:
+            self.stop_callback(completed=True)
+    
+    def _set_text(self, text):
+        """Write the timer text, skipping the redraw when it is unchanged"""
+        if text != self._last_str:
+            self._last_str = text
+            self.timer_var.set(text)
     
     def _stop_pressed(self):
         """Handle stop button press"""
@@ -1,11 +1,14 @@
-""
+"""
 Main window for the Enhanced Pomodoro Timer application.
 """
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, Set
 import logging
+import queue
+import time
+from collections import deque
 from datetime import datetime, timedelta
 
 from ..core.models import Task, TimerMode, TaskStatus
@@ -13,10 +16,49 @@ from ..core.timer_service import TimerService, TimerState, TimerUpdate
 from .task_panel import TaskPanel
 from .stats_panel import StatsPanel
 from .settings_panel import SettingsPanel
+from ._dialog_utils import center_dialog
+
+# Minimum gap between timer display writes unless the shown seconds change
+_DISPLAY_MIN_INTERVAL = 0.2
+
+# Target refresh rate of the UI tick, in frames per second
+_UI_TICK_RATE = 4
+# How far back measured tick delays are averaged, in seconds
+_UI_TICK_WINDOW = 10.0
+
+# "MM:SS" text for every time up to an hour, indexed by seconds left
+_MMSS = tuple(f"{i // 60:02d}:{i % 60:02d}" for i in range(3601))
+
+# Label text for each timer mode
+_MODE_DISPLAY = {mode: mode.name.replace('_', ' ').title() for mode in TimerMode}
+
+# Style options applied for work and break modes
+_WORK_STYLE = {
+    'TFrame': {'background': '#2d2d2d'},
+    'Accent.TButton': {'background': '#e74c3c'},  # Red
+}
+_BREAK_STYLE = {
+    'TFrame': {'background': '#1e3a5f'},
+    'Accent.TButton': {'background': '#27ae60'},  # Green
+}
 
 class MainWindow(tk.Tk):
     """Main application window."""
     
+    # Style options per timer mode; every mode but WORK is a break
+    _MODE_STYLE = {
+        mode: _WORK_STYLE if mode is TimerMode.WORK else _BREAK_STYLE
+        for mode in TimerMode
+    }
+    
+    # (start button text, stop button state, skip button state) per timer state
+    _STATE_BUTTONS = {
+        TimerState.RUNNING: ("Pause", tk.NORMAL, tk.NORMAL),
+        TimerState.PAUSED: ("Resume", tk.NORMAL, tk.NORMAL),
+        TimerState.STOPPED: ("Start", tk.DISABLED, tk.DISABLED),
+        TimerState.COMPLETED: ("Start", tk.DISABLED, tk.DISABLED),
+    }
+    
     def __init__(self, timer_service: TimerService, data_manager, *args, **kwargs):
         """Initialize the main window."""
         super().__init__(*args, **kwargs)
@@ -25,6 +67,39 @@ class MainWindow(tk.Tk):
         self.data_manager = data_manager
         self.logger = logging.getLogger(f"{__name__}.MainWindow")
         
+        # Notebook panels, set as they are built
+        self.task_panel: Optional[TaskPanel] = None
+        self.stats_panel: Optional[StatsPanel] = None
+        self.settings_panel: Optional[SettingsPanel] = None
+        
+        # Last values written to the timer display, to skip redundant writes
+        self._last_time_text: Optional[str] = None
+        self._last_progress_bucket: Optional[int] = None
+        self._last_display_ts = 0.0
+        
+        # Handoff from the timer thread to the UI tick: only the latest timer
+        # update is kept, while every state/mode change and completed session
+        # is delivered
+        self._update_queue: "queue.Queue[TimerUpdate]" = queue.Queue(maxsize=1)
+        self._control_queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()  # TimerState/TimerMode
+        self._session_queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._interval_ms = 1000 // _UI_TICK_RATE
+        self._tick_delays: deque = deque()  # (timestamp, net delay) pairs
+        self._last_tick_ts: Optional[float] = None
+        
+        # State and mode the controls were last updated for
+        self._last_state: Optional[TimerState] = None
+        self._last_mode: Optional[TimerMode] = None
+        
+        # Pending after/after_idle ids, cancelled when the window closes
+        self._after_ids: Set[str] = set()
+        
+        # Message currently shown in the status bar
+        self._last_status: Optional[str] = None
+        
+        # Open confirmation dialog, if any
+        self._confirm_dialog: Optional[tk.Toplevel] = None
+        
         # Window configuration
         self.title("Enhanced Pomodoro Timer")
         self.geometry("800x600")
@@ -39,10 +114,15 @@ class MainWindow(tk.Tk):
         # Update UI with current state
         self.update_ui_state()
         self.update_ui_mode(self.timer_service.mode)
+        
+        # Start the display refresh loop
+        self._schedule_ui_tick()
+        
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
     
     def _setup_styles(self) -> None:
         """Configure application styles."""
-        style = ttk.Style()
+        style = self._style = ttk.Style(self)
         
         # Configure theme
         self.tk.call('source', 'themes/azure/azure.tcl')
@@ -74,20 +154,28 @@ class MainWindow(tk.Tk):
         self.notebook = ttk.Notebook(self.main_container)
         self.notebook.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
         
-        # Create tabs
+        # Create tabs; Statistics and Settings start as empty placeholders
+        # and are built the first time they are selected
         self.task_panel = TaskPanel(self.notebook, self.data_manager, self._on_task_selected)
-        self.stats_panel = StatsPanel(self.notebook, self.data_manager)
-        self.settings_panel = SettingsPanel(self.notebook, self.timer_service, self.data_manager)
-        
         self.notebook.add(self.task_panel, text="Tasks")
-        self.notebook.add(self.stats_panel, text="Statistics")
-        self.notebook.add(self.settings_panel, text="Settings")
+        
+        # Placeholder widget path -> (attribute, panel factory, tab text)
+        self._lazy_tabs: Dict[str, Any] = {}
+        self._add_lazy_tab(
+            'stats_panel',
+            lambda: StatsPanel(self.notebook, self.data_manager),
+            "Statistics"
+        )
+        self._add_lazy_tab(
+            'settings_panel',
+            lambda: SettingsPanel(self.notebook, self.timer_service, self.data_manager),
+            "Settings"
+        )
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Status bar
-        self.status_var = tk.StringVar()
         self.status_bar = ttk.Label(
             self.main_container,
-            textvariable=self.status_var,
             relief=tk.SUNKEN,
             anchor=tk.W,
             padding=5
@@ -97,34 +185,55 @@ class MainWindow(tk.Tk):
         # Set initial status
         self.update_status("Ready")
     
+    def _add_lazy_tab(self, attr: str, factory: Callable[[], ttk.Frame], text: str) -> None:
+        """Add a placeholder tab whose panel is built on first selection."""
+        placeholder = ttk.Frame(self.notebook)
+        self.notebook.add(placeholder, text=text)
+        self._lazy_tabs[str(placeholder)] = (attr, factory, text)
+    
+    def _on_tab_changed(self, event) -> None:
+        """Replace a placeholder tab with its real panel when first selected."""
+        selected = str(self.notebook.select())
+        entry = self._lazy_tabs.pop(selected, None)
+        if entry is None:
+            return
+        
+        attr, factory, text = entry
+        panel = factory()
+        setattr(self, attr, panel)
+        
+        # Put the panel in the placeholder's position before dropping it
+        placeholder = self.nametowidget(selected)
+        self.notebook.insert(placeholder, panel, text=text)
+        self.notebook.select(panel)
+        self.notebook.forget(placeholder)
+        placeholder.destroy()
+    
     def _create_timer_frame(self) -> None:
         """Create the timer display frame."""
         timer_frame = ttk.LabelFrame(self.main_container, text="Pomodoro Timer", padding=10)
         timer_frame.pack(fill=tk.X, pady=(0, 10))
         
         # Mode label
-        self.mode_var = tk.StringVar(value="Work")
         self.mode_label = ttk.Label(
             timer_frame,
-            textvariable=self.mode_var,
+            text=_MODE_DISPLAY[TimerMode.WORK],
             style='Mode.TLabel'
         )
         self.mode_label.pack(pady=(0, 5))
         
         # Timer display
-        self.time_var = tk.StringVar(value="25:00")
         self.timer_label = ttk.Label(
             timer_frame,
-            textvariable=self.time_var,
+            text="25:00",
             style='Timer.TLabel'
         )
         self.timer_label.pack(pady=10)
         
         # Current task display
-        self.task_var = tk.StringVar(value="No task selected")
         self.task_label = ttk.Label(
             timer_frame,
-            textvariable=self.task_var,
+            text="No task selected",
             wraplength=400
         )
         self.task_label.pack(fill=tk.X, pady=(0, 10))
@@ -158,55 +267,190 @@ class MainWindow(tk.Tk):
             command=self._on_skip_clicked
         )
         self.skip_button.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        
+        # One Tcl script per timer state that sets all three buttons in a
+        # single call
+        self._state_scripts = {
+            state: (
+                f"{self.start_button} configure -text {{{start_text}}}; "
+                f"{self.stop_button} configure -state {stop_state}; "
+                f"{self.skip_button} configure -state {skip_state}"
+            )
+            for state, (start_text, stop_state, skip_state) in self._STATE_BUTTONS.items()
+        }
     
     # Public methods for UI updates
     
     def update_timer_display(self, update: TimerUpdate) -> None:
-        """Update the timer display with the current time."""
-        minutes = update.time_left // 60
-        seconds = update.time_left % 60
-        self.time_var.set(f"{minutes:02d}:{seconds:02d}")
-        
-        # Update progress in task panel if we have a task
-        if hasattr(self, 'task_panel') and update.current_task:
-            self.task_panel.update_task_progress(update.current_task.id, update.progress)
+        """Queue a timer update for the next UI tick.
+        
+        Safe to call from the timer thread. Only the latest update is kept;
+        the widgets are written from _ui_tick on the Tk thread at the UI tick
+        rate, whatever rate the timer service notifies at.
+        """
+        try:
+            self._update_queue.get_nowait()  # drop the stale pending update
+        except queue.Empty:
+            pass
+        try:
+            self._update_queue.put_nowait(update)
+        except queue.Full:
+            pass
+    
+    def _take_pending_update(self) -> Optional[TimerUpdate]:
+        """Return the queued timer update, or None if there is none."""
+        try:
+            return self._update_queue.get_nowait()
+        except queue.Empty:
+            return None
+    
+    def _track_after(self, func: Callable[[], Any], delay_ms: Optional[int] = None) -> None:
+        """Run func after delay_ms, or at idle time if None, tracked for _on_close."""
+        def run() -> None:
+            self._after_ids.discard(after_id)
+            func()
+        
+        if delay_ms is None:
+            after_id = self.after_idle(run)
+        else:
+            after_id = self.after(delay_ms, run)
+        self._after_ids.add(after_id)
+    
+    def _schedule_ui_tick(self) -> None:
+        """Schedule the next UI tick."""
+        self._track_after(self._ui_tick, self._interval_ms)
+    
+    def _ui_tick(self) -> None:
+        """Flush queued timer events and completed sessions, then schedule the next tick.
+        
+        The wait before the next tick is adapted from the net delay measured
+        over the last _UI_TICK_WINDOW seconds, so that ticks land at
+        _UI_TICK_RATE per second: w = 1/r - max(min(E[N], 1/r - 0.001), 0).
+        """
+        now = time.perf_counter()
+        if self._last_tick_ts is not None:
+            net_delay = (now - self._last_tick_ts) - self._interval_ms / 1000
+            delays = self._tick_delays
+            delays.append((now, net_delay))
+            while delays[0][0] < now - _UI_TICK_WINDOW:
+                delays.popleft()
+            mean_delay = sum(delay for _, delay in delays) / len(delays)
+            period = 1 / _UI_TICK_RATE
+            wait = period - max(min(mean_delay, period - 0.001), 0)
+            self._interval_ms = max(1, round(wait * 1000))
+        self._last_tick_ts = now
+        
+        # State and mode changes first, so the display is drawn in the new mode
+        while True:
+            try:
+                change = self._control_queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(change, TimerMode):
+                self.update_ui_mode(change)
+            else:
+                self.update_ui_state()
+        
+        update = self._take_pending_update()
+        if update is not None:
+            self._flush_timer_display(update)
+        
+        # Schedule before handling sessions so the display keeps ticking
+        # behind the completion notification
+        self._schedule_ui_tick()
+        
+        while True:
+            try:
+                session = self._session_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._handle_session_complete(session)
+    
+    def _flush_timer_display(self, update: TimerUpdate) -> None:
+        """Write a timer update to the timer display.
+        
+        Updates that would not change what is on screen are dropped, and
+        writes are limited to one per _DISPLAY_MIN_INTERVAL unless the
+        displayed seconds change.
+        """
+        time_left = update.time_left
+        if 0 <= time_left < len(_MMSS):
+            time_text = _MMSS[time_left]
+        else:
+            minutes, seconds = divmod(time_left, 60)
+            time_text = f"{minutes:02d}:{seconds:02d}"
+        now = time.monotonic()
+        if (time_text == self._last_time_text
+                and now - self._last_display_ts < _DISPLAY_MIN_INTERVAL):
+            return
+        
+        if time_text != self._last_time_text:
+            self._last_time_text = time_text
+            self._last_display_ts = now
+            self.timer_label.configure(text=time_text)
+        
+        # Update progress in task panel if we have a task, in whole percent steps
+        if update.current_task:
+            bucket = max(0, min(100, int(update.progress * 100)))
+            if bucket != self._last_progress_bucket:
+                self._last_progress_bucket = bucket
+                self._last_display_ts = now
+                self.task_panel.update_task_progress(update.current_task.id, update.progress)
     
     def update_ui_state(self) -> None:
         """Update UI elements based on the current timer state."""
         state = self.timer_service.state
+        if state == self._last_state:
+            return
+        self._last_state = state
         
         # Update button states and text
-        if state == TimerState.RUNNING:
-            self.start_button.config(text="Pause")
-            self.stop_button.config(state=tk.NORMAL)
-            self.skip_button.config(state=tk.NORMAL)
-        elif state == TimerState.PAUSED:
-            self.start_button.config(text="Resume")
-            self.stop_button.config(state=tk.NORMAL)
-            self.skip_button.config(state=tk.NORMAL)
-        else:  # STOPPED or COMPLETED
-            self.start_button.config(text="Start")
-            self.stop_button.config(state=tk.DISABLED)
-            self.skip_button.config(state=tk.DISABLED)
+        self.tk.eval(self._state_scripts[state])
     
     def update_ui_mode(self, mode: TimerMode) -> None:
         """Update UI elements based on the current timer mode."""
-        self.mode_var.set(mode.name.replace('_', ' ').title())
+        if mode is self._last_mode:
+            return
+        self._last_mode = mode
+        
+        self.mode_label.configure(text=_MODE_DISPLAY[mode])
         
         # Update colors based on mode
-        style = ttk.Style()
-        if mode == TimerMode.WORK:
-            style.configure('TFrame', background='#2d2d2d')
-            style.configure('Accent.TButton', background='#e74c3c')  # Red
-        else:  # BREAK modes
-            style.configure('TFrame', background='#1e3a5f')
-            style.configure('Accent.TButton', background='#27ae60')  # Green
+        for style_name, options in self._MODE_STYLE[mode].items():
+            self._style.configure(style_name, **options)
+    
+    def on_state_change(self, state: TimerState) -> None:
+        """Queue a timer state change for the next UI tick.
+        
+        Safe to call from the timer thread.
+        """
+        self._control_queue.put(state)
+    
+    def on_mode_change(self, mode: TimerMode) -> None:
+        """Queue a timer mode change for the next UI tick.
+        
+        Safe to call from the timer thread.
+        """
+        self._control_queue.put(mode)
     
     def on_session_complete(self, session) -> None:
+        """Queue a completed session for the next UI tick.
+        
+        Safe to call from the timer thread.
+        """
+        self._session_queue.put(session)
+    
+    def _handle_session_complete(self, session) -> None:
         """Handle session completion."""
         # Play sound
         self.bell()
         
+        # Show the final time before the modal notification blocks redraws
+        update = self._take_pending_update()
+        if update is not None:
+            self._flush_timer_display(update)
+        self.update_idletasks()
+        
         # Show notification
         if session.mode == TimerMode.WORK:
             messagebox.showinfo(
@@ -219,17 +463,23 @@ class MainWindow(tk.Tk):
                 "Break is over. Ready for the next work session?"
             )
         
-        # Refresh tasks and stats
-        if hasattr(self, 'task_panel'):
-            self.task_panel.refresh_tasks()
+        # Refresh tasks and stats once pending redraws and events are handled
+        if self.task_panel is not None:
+            self._track_after(self.task_panel.refresh_tasks)
         
-        if hasattr(self, 'stats_panel'):
-            self.stats_panel.refresh_stats()
+        if self.stats_panel is not None:
+            self._track_after(self.stats_panel.refresh_stats)
     
     def update_status(self, message: str) -> None:
-        """Update the status bar with a message."""
-        self.status_var.set(message)
-        self.logger.info(f"Status: {message}")
+        """Update the status bar with a message.
+        
+        Repeats of the message already shown are ignored.
+        """
+        if message == self._last_status:
+            return
+        self._last_status = message
+        self.status_bar.configure(text=message)
+        self.logger.info("Status: %s", message)
     
     # Event handlers
     
@@ -242,18 +492,70 @@ class MainWindow(tk.Tk):
     
     def _on_stop_clicked(self) -> None:
         """Handle Stop button click."""
-        if messagebox.askyesno("Stop Timer", "Are you sure you want to stop the current session?"):
-            self.timer_service.stop()
+        self._confirm(
+            "Stop Timer",
+            "Are you sure you want to stop the current session?",
+            on_yes=self.timer_service.stop
+        )
     
     def _on_skip_clicked(self) -> None:
         """Handle Skip button click."""
-        if messagebox.askyesno("Skip Session", "Are you sure you want to skip the current session?"):
-            self.timer_service.skip()
+        self._confirm(
+            "Skip Session",
+            "Are you sure you want to skip the current session?",
+            on_yes=self.timer_service.skip
+        )
+    
+    def _confirm(self, title: str, message: str, on_yes: Callable[[], Any]) -> None:
+        """Ask a yes/no question without blocking the event loop.
+        
+        Unlike messagebox.askyesno this does not run a nested event loop, so
+        the timer display keeps updating while the dialog is open. on_yes is
+        run from after_idle once the dialog is gone, so the window repaints
+        first.
+        """
+        if self._confirm_dialog is not None:
+            self._confirm_dialog.lift()
+            return
+        
+        dialog = self._confirm_dialog = tk.Toplevel(self)
+        dialog.title(title)
+        dialog.resizable(False, False)
+        dialog.transient(self)
+        dialog.grab_set()
+        
+        # Size the dialog and center it over the window
+        center_dialog(self, dialog, 320, 120)
+        
+        def close(confirmed: bool) -> None:
+            self._confirm_dialog = None
+            dialog.destroy()
+            if confirmed:
+                self._track_after(on_yes)
+        
+        frame = ttk.Frame(dialog, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        ttk.Label(frame, text=message, wraplength=280).pack(fill=tk.X, pady=(0, 10))
+        
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(side=tk.BOTTOM, fill=tk.X)
+        no_button = ttk.Button(button_frame, text="No", command=lambda: close(False))
+        no_button.pack(side=tk.RIGHT, padx=5)
+        ttk.Button(
+            button_frame,
+            text="Yes",
+            command=lambda: close(True)
+        ).pack(side=tk.RIGHT, padx=5)
+        
+        dialog.protocol("WM_DELETE_WINDOW", lambda: close(False))
+        dialog.bind("<Escape>", lambda event: close(False))
+        no_button.focus_set()
     
     def _on_task_selected(self, task: Optional[Task]) -> None:
         """Handle task selection from the task panel."""
         if task:
-            self.task_var.set(f"Current Task: {task.title}")
+            self.task_label.configure(text=f"Current Task: {task.title}")
             self.update_status(f"Selected task: {task.title}")
             
             # Update the timer service with the selected task
@@ -263,9 +565,30 @@ class MainWindow(tk.Tk):
             if self.timer_service.state == TimerState.STOPPED:
                 self.task_label.config(foreground='white')
         else:
-            self.task_var.set("No task selected")
+            self.task_label.configure(text="No task selected")
             self.timer_service.current_task = None
     
+    def _on_close(self) -> None:
+        """Tear down the window when it is closed.
+        
+        Cancels pending after() callbacks, drops the window's timer update
+        subscription and destroys the panels before the window itself, so
+        nothing keeps calling into or referencing the destroyed widgets.
+        """
+        for after_id in self._after_ids:
+            self.after_cancel(after_id)
+        self._after_ids.clear()
+        
+        # A no-op unless a host subscribed the window directly
+        self.timer_service.unregister_update_callback(self.update_timer_display)
+        
+        for panel in (self.task_panel, self.stats_panel, self.settings_panel):
+            if panel is not None:
+                panel.destroy()
+        self.task_panel = self.stats_panel = self.settings_panel = None
+        
+        self.destroy()
+    
     def mainloop(self, *args, **kwargs) -> None:
         """Start the main event loop."""
         self.update_status("Application started")
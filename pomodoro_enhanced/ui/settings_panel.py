@@ -397,7 +397,8 @@ class SettingsPanel(ttk.Frame):
             self.settings.desktop_notifications = self.desktop_notifications.get()
             
             # Save settings
-            self.data_manager.save_settings(self.settings)
+            self.data_manager.update_settings(self.settings)
+            self.timer_service.reload_settings(self.settings)
             
             # Apply theme if changed
             self._apply_theme()
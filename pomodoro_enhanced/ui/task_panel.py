@@ -1,4 +1,4 @@
-""
+"""
 Task management panel for the Enhanced Pomodoro Timer.
 """
 
@@ -14,6 +14,15 @@ version = {}
 with open("pomodoro_enhanced/__init__.py", "r", encoding="utf-8") as fh:
     exec(fh.read(), version)
 
+# Optionally compile pure-Python modules that have a .pxd companion with Cython
+ext_modules = []
+if os.environ.get("POMODORO_ENABLE_SPEEDUPS"):
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        ["pomodoro_enhanced/integrations/mcp_plugins.py"],
+        compiler_directives={"language_level": "3"},
+    )
+
 setup(
     name="enhanced-pomodoro-timer",
     version=version.get("__version__", "0.1.0"),
@@ -24,6 +33,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/enhanced-pomodoro-timer",
     packages=find_packages(),
+    ext_modules=ext_modules,
     package_data={
         "pomodoro_enhanced": [
             "assets/*.png",
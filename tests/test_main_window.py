@@ -0,0 +1,95 @@
+"""Tests for the MainWindow logic that runs without a display."""
+import queue
+import sys
+import threading
+import types
+from collections import deque
+from unittest import mock
+
+import pytest
+
+from pomodoro_enhanced.core.models import TimerMode
+from pomodoro_enhanced.core.timer_service import TimerState, TimerUpdate
+
+# The statistics panel is not part of this tree; give main_window a placeholder
+sys.modules.setdefault(
+    "pomodoro_enhanced.ui.stats_panel",
+    types.SimpleNamespace(StatsPanel=object),
+)
+from pomodoro_enhanced.ui import main_window  # noqa: E402
+from pomodoro_enhanced.ui.main_window import MainWindow  # noqa: E402
+
+
+@pytest.fixture
+def window():
+    """A MainWindow with its queues and tick state but no Tk widgets."""
+    w = object.__new__(MainWindow)
+    w.tk = mock.Mock()
+    w._update_queue = queue.Queue(maxsize=1)
+    w._control_queue = queue.SimpleQueue()
+    w._session_queue = queue.SimpleQueue()
+    w._interval_ms = 1000 // main_window._UI_TICK_RATE
+    w._tick_delays = deque()
+    w._last_tick_ts = None
+    w._schedule_ui_tick = mock.Mock()
+    w._flush_timer_display = mock.Mock()
+    w.update_ui_state = mock.Mock()
+    w.update_ui_mode = mock.Mock()
+    return w
+
+
+def make_update(time_left):
+    return TimerUpdate(time_left=time_left, mode=TimerMode.WORK,
+                       state=TimerState.RUNNING, current_cycle=1, total_cycles=4)
+
+
+def test_only_latest_timer_update_is_kept(window):
+    """Test that queued timer updates replace the one still pending."""
+    for time_left in (60, 59, 58):
+        window.update_timer_display(make_update(time_left))
+
+    assert window._take_pending_update().time_left == 58
+    assert window._take_pending_update() is None
+
+
+def test_ui_tick_interval_adapts_to_delay(window, monkeypatch):
+    """Test that the next tick is brought forward by the mean net delay."""
+    now = [100.0]
+    monkeypatch.setattr(main_window.time, "perf_counter", lambda: now[0])
+    window._ui_tick()
+    assert window._interval_ms == 250
+
+    # Tick arrived 50 ms late: wait 250 - 50 ms for the next one
+    now[0] += 0.3
+    window._ui_tick()
+    assert window._interval_ms == 200
+
+    # Delays longer than the period are capped to a 1 ms wait
+    now[0] += 0.2 + 2.0
+    window._ui_tick()
+    assert window._interval_ms == 1
+    assert window._schedule_ui_tick.call_count == 3
+
+
+def test_ui_tick_flushes_latest_update(window):
+    """Test that a tick writes the pending update to the display."""
+    window.update_timer_display(make_update(30))
+    window._ui_tick()
+
+    window._flush_timer_display.assert_called_once()
+    assert window._flush_timer_display.call_args[0][0].time_left == 30
+
+
+def test_state_and_mode_changes_apply_on_ui_tick(window):
+    """Test that changes queued from another thread apply on the next tick."""
+    thread = threading.Thread(target=lambda: (
+        window.on_state_change(TimerState.RUNNING),
+        window.on_mode_change(TimerMode.SHORT_BREAK),
+    ))
+    thread.start()
+    thread.join()
+    window.update_ui_state.assert_not_called()
+
+    window._ui_tick()
+    window.update_ui_state.assert_called_once_with()
+    window.update_ui_mode.assert_called_once_with(TimerMode.SHORT_BREAK)
@@ -0,0 +1,71 @@
+"""Tests for applying settings from the settings panel."""
+from unittest import mock
+
+from pomodoro_enhanced.core.models import TimerSettings
+from pomodoro_enhanced.core.timer_service import TimerService
+from pomodoro_enhanced.ui import settings_panel
+from pomodoro_enhanced.ui.settings_panel import SettingsPanel
+
+
+class FakeDataManager:
+    """In-memory stand-in for DataManager."""
+
+    def __init__(self, settings):
+        self.settings = settings
+        self.saved = []
+
+    def get_settings(self):
+        return self.settings
+
+    def update_settings(self, settings):
+        self.settings = settings
+        self.saved.append(settings)
+        return True
+
+
+class Value:
+    """Stand-in for a Tk variable."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+def make_panel(data_manager, timer_service, **values):
+    """Create a SettingsPanel without widgets, its fields holding ``values``."""
+    panel = object.__new__(SettingsPanel)
+    panel.timer_service = timer_service
+    panel.data_manager = data_manager
+    panel.settings = data_manager.get_settings()
+    panel.logger = mock.Mock()
+    panel.analytics = mock.Mock()
+    panel._apply_theme = mock.Mock()
+    fields = {
+        "work_duration": 25, "short_break_duration": 5, "long_break_duration": 15,
+        "long_break_interval": 4, "auto_start_breaks": False,
+        "auto_start_pomodoros": False, "notifications": True, "theme_var": "Light",
+        "font_size": "12", "notification_sound": "default",
+        "notification_volume": 75, "desktop_notifications": True,
+    }
+    fields.update(values)
+    for name, value in fields.items():
+        setattr(panel, name, Value(value))
+    return panel
+
+
+def test_apply_saves_and_reloads_timer_settings(monkeypatch):
+    """Test that applied settings are saved and reach the running timer."""
+    monkeypatch.setattr(settings_panel, "messagebox", mock.Mock())
+    data_manager = FakeDataManager(TimerSettings(auto_start_breaks=False))
+    service = TimerService(data_manager)
+    panel = make_panel(data_manager, service,
+                       auto_start_breaks=True, long_break_interval=2)
+
+    panel._on_apply_settings()
+
+    settings_panel.messagebox.showerror.assert_not_called()
+    assert data_manager.saved == [panel.settings]
+    assert service._auto_start_breaks is True
+    assert service._long_break_interval == 2
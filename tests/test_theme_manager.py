@@ -1,6 +1,7 @@
 """Tests for the refactored ThemeManager."""
 import unittest
 import tkinter as tk
+from tkinter import ttk
 from unittest.mock import patch, MagicMock
 from pomodoro_enhanced.core.theme import (
     ThemeManager, 
@@ -92,6 +93,26 @@ class TestThemeConfigFactory(unittest.TestCase):
         self.assertEqual(theme.bg, self.config.BACKGROUND_COLOR_LIGHT)
         self.assertEqual(theme.primary, self.config.PRIMARY_COLOR_LIGHT)
     
+    def test_create_reuses_theme_per_mode(self):
+        """Test that each mode's theme is built once and is hashable."""
+        dark = self.factory.create("dark")
+        self.assertIs(self.factory.create("dark"), dark)
+        self.assertIsNot(self.factory.create("light"), dark)
+        self.assertEqual(len({dark, self.factory.create("light")}), 2)
+    
+    def test_light_theme_defaults(self):
+        """Test that missing light overrides fall back to built-in defaults."""
+        class DarkOnlyConfig:
+            BACKGROUND_COLOR = "#1e1e1e"
+            FOREGROUND_COLOR = "#ffffff"
+            SURFACE_COLOR = "#2d2d2d"
+            PRIMARY_COLOR = "#0078d7"
+            SECONDARY_COLOR = "#ff8c00"
+
+        theme = ThemeConfigFactory(DarkOnlyConfig()).create("light")
+        self.assertEqual(theme.bg, "#f5f5f5")
+        self.assertEqual(theme.brk, "#00796b")
+    
     def test_missing_required_attributes(self):
         """Test validation of required config attributes."""
         class IncompleteConfig:
@@ -166,6 +187,40 @@ class TestThemeManager(unittest.TestCase):
         # Apply theme with on_break=True
         manager.apply({"timer_label": timer_label}, on_break=True)
         self.assertEqual(timer_label.cget("fg"), manager.theme.brk)
+    
+    def test_apply_theme_direct_configure(self):
+        """Test applying the theme through raw Tcl configure calls."""
+        manager = ThemeManager(self.root, self.config, direct_configure=True)
+        frame = tk.Frame(self.root)
+        timer_label = tk.Label(self.root, text="Timer")
+        
+        manager.apply({"test_frame": frame, "timer_label": timer_label}, on_break=True)
+        self.assertEqual(frame.cget("bg"), manager.theme.bg)
+        self.assertEqual(timer_label.cget("fg"), manager.theme.brk)
+    
+    def test_apply_timer_color(self):
+        """Test recoloring only the timer label."""
+        manager = ThemeManager(self.root, self.config)
+        timer_label = tk.Label(self.root, text="Timer")
+        
+        manager.apply_timer_color(timer_label, on_break=True)
+        self.assertEqual(timer_label.cget("fg"), manager.theme.brk)
+        manager.apply_timer_color(timer_label, on_break=False)
+        self.assertEqual(timer_label.cget("fg"), manager.theme.work)
+    
+    def test_ensure_styles_registers_lazy_group(self):
+        """Test registering an on-demand ttk style group."""
+        manager = ThemeManager(self.root, self.config)
+        manager.ensure_styles("Treeview")
+        self.assertEqual(
+            ttk.Style().lookup("Treeview", "fieldbackground"), manager.theme.surface
+        )
+    
+    def test_ensure_styles_unknown_group(self):
+        """Test that unknown style groups are rejected."""
+        manager = ThemeManager(self.root, self.config)
+        with self.assertRaises(ValueError):
+            manager.ensure_styles("TMissing")
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,191 @@
+"""Tests for the core Pomodoro TimerService."""
+import pytest
+from pomodoro_enhanced.core import timer
+from pomodoro_enhanced.core.timer import TimerService, TimerMode
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic_ns."""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += int(seconds * 1_000_000_000)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(timer.time, "monotonic_ns", fake)
+    return fake
+
+
+def test_remaining_is_whole_seconds(clock):
+    """Test that remaining time is reported as an integer number of seconds."""
+    service = TimerService(work_duration=60)
+    service.start()
+    clock.advance(10.4)
+    service.update()
+    assert service.state.remaining == 50
+    assert isinstance(service.state.remaining, int)
+
+
+def test_pause_keeps_elapsed_time(clock):
+    """Test that pausing preserves the time already elapsed."""
+    service = TimerService(work_duration=60)
+    service.start()
+    clock.advance(20)
+    service.pause()
+    clock.advance(100)
+    assert service.state.remaining == 40
+    service.start()
+    clock.advance(39.5)
+    service.update()
+    assert service.state.remaining == 1
+
+
+def test_completion_moves_to_short_break(clock):
+    """Test that a finished work period switches to a short break."""
+    service = TimerService(work_duration=60, short_break_duration=5)
+    service.start()
+    clock.advance(61)
+    service.update()
+    state = service.state
+    assert state.mode == TimerMode.SHORT_BREAK
+    assert state.remaining == 5
+    assert not state.is_running
+    assert state.current_cycle == 1
+
+
+def test_update_notifies_only_on_second_change(clock):
+    """Test that sub-second updates do not re-notify observers."""
+    service = TimerService(work_duration=60)
+    seen = []
+    service.add_observer(lambda state: seen.append(state.remaining))
+    service.start()
+    for _ in range(5):
+        clock.advance(0.1)
+        service.update()
+    clock.advance(0.6)
+    service.update()
+    assert seen == [60, 59]
+
+
+def test_state_snapshot_is_cached_until_change(clock):
+    """Test that the state snapshot is reused until the timer changes."""
+    service = TimerService(work_duration=60)
+    first = service.state
+    assert service.state is first
+    service.start()
+    assert service.state is not first
+    assert service.state.is_running
+
+
+def test_state_snapshot_sees_changed_settings(clock):
+    """Test that assigning a duration or interval refreshes the snapshot."""
+    service = TimerService(work_duration=60)
+    assert service.state.work_duration == 60
+    service.work_duration = 90
+    service.long_break_interval = 2
+    assert service.state.work_duration == 90
+    assert service.state.long_break_interval == 2
+
+
+def test_observer_can_remove_itself(clock):
+    """Test that an observer may unsubscribe while being notified."""
+    service = TimerService(work_duration=60)
+    calls = []
+
+    def once(state):
+        calls.append(state.remaining)
+        service.remove_observer(once)
+
+    service.add_observer(once)
+    service.start()
+    service.pause()
+    assert calls == [60]
+
+
+def test_skip_cycles_through_long_break(clock):
+    """Test that skipping phases reaches a long break after the interval."""
+    service = TimerService(long_break_interval=2)
+    modes = []
+    for _ in range(4):
+        service.skip()
+        modes.append(service.state.mode)
+    assert modes == [
+        TimerMode.SHORT_BREAK,
+        TimerMode.WORK,
+        TimerMode.LONG_BREAK,
+        TimerMode.WORK,
+    ]
+    assert service.state.remaining == service.work_duration
+
+
+class FakeRoot:
+    """Minimal stand-in for the Tk after()/after_cancel() API."""
+
+    def __init__(self):
+        self.pending = {}
+        self._next_id = 0
+
+    def after(self, ms, callback):
+        self._next_id += 1
+        after_id = f"after#{self._next_id}"
+        self.pending[after_id] = (ms, callback)
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def fire(self, clock):
+        after_id, (ms, callback) = next(iter(self.pending.items()))
+        del self.pending[after_id]
+        clock.advance(ms / 1000)
+        callback()
+        return ms
+
+
+def test_scheduled_updates_fire_once_per_second(clock):
+    """Test that Tk-driven updates wake once per displayed second."""
+    service = TimerService(work_duration=3)
+    root = FakeRoot()
+    seen = []
+    service.add_observer(lambda state: seen.append(state.remaining))
+    service.schedule_updates(root)
+    service.start()
+    delays = [root.fire(clock) for _ in range(3)]
+    assert delays == [1000, 1000, 1000]
+    assert seen == [3, 2, 1, 5 * 60]
+    assert root.pending == {}
+
+
+def test_pause_cancels_scheduled_update(clock):
+    """Test that pausing cancels the pending Tk-driven update."""
+    service = TimerService(work_duration=60)
+    root = FakeRoot()
+    service.schedule_updates(root)
+    service.start()
+    assert len(root.pending) == 1
+    service.pause()
+    assert root.pending == {}
+
+
+def test_update_skips_work_before_next_second(clock, monkeypatch):
+    """Test that updates before the next whole second skip recomputation."""
+    service = TimerService(work_duration=60)
+    service.start()
+    synced = []
+    original = service._sync_remaining
+    monkeypatch.setattr(service, "_sync_remaining", lambda now: (synced.append(now), original(now)))
+    clock.advance(0.5)
+    service.update()
+    assert synced == []
+    clock.advance(0.5)
+    service.update()
+    assert len(synced) == 1
+    assert service.state.remaining == 59
@@ -0,0 +1,283 @@
+"""Tests for the threaded TimerService."""
+import threading
+import time
+
+import pytest
+
+from pomodoro_enhanced.core import timer_service
+from pomodoro_enhanced.core.models import TimerMode, TimerSettings
+from pomodoro_enhanced.core.timer_service import TimerService, TimerState
+
+
+class FakeDataManager:
+    """In-memory stand-in for DataManager."""
+
+    def __init__(self, settings=None):
+        self.settings = settings or TimerSettings(auto_start_breaks=False)
+        self.sessions = []
+        self.tasks = []
+
+    def get_settings(self):
+        return self.settings
+
+    def add_session(self, session):
+        self.sessions.append(session)
+
+    def update_task(self, task):
+        self.tasks.append(task)
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic_ns."""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += int(seconds * 1_000_000_000)
+
+
+class FakeScheduler:
+    """Stand-in for the shared scheduler that runs calls only when told."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.calls = []
+
+    def schedule(self, deadline_ns, callback):
+        call = timer_service._ScheduledCall(callback)
+        self.calls.append((deadline_ns, call))
+        return call
+
+    def run_due(self):
+        """Run every live call whose deadline has passed, in deadline order."""
+        while True:
+            due = [entry for entry in self.calls
+                   if entry[0] <= self.clock.now and not entry[1].cancelled]
+            if not due:
+                return
+            entry = min(due, key=lambda entry: entry[0])
+            self.calls.remove(entry)
+            entry[1].callback()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(timer_service.time, "monotonic_ns", fake)
+    return fake
+
+
+@pytest.fixture
+def scheduler(clock, monkeypatch):
+    fake = FakeScheduler(clock)
+    monkeypatch.setattr(timer_service, "_scheduler", fake)
+    return fake
+
+
+def make_service(seconds):
+    """Create a stopped TimerService whose work period lasts ``seconds``."""
+    data_manager = FakeDataManager()
+    service = TimerService(data_manager)
+    service.time_left = seconds
+    return service, data_manager
+
+
+def test_timer_completes_at_deadline():
+    """Test that a running timer completes and moves to a break."""
+    service, data_manager = make_service(0.3)
+    done = threading.Event()
+    service.register_mode_change_callback(lambda mode: done.set())
+
+    service.start()
+    assert done.wait(timeout=2)
+    assert service.flush(timeout=2)
+    assert data_manager.sessions[0].was_completed
+    assert service.mode == TimerMode.SHORT_BREAK
+    assert service.state == TimerState.STOPPED
+
+
+def test_pause_freezes_time_left():
+    """Test that pausing stops the countdown until resumed."""
+    service, _ = make_service(5)
+    service.start()
+    time.sleep(0.2)
+    service.pause()
+    paused_at = service.time_left
+    assert 4.5 < paused_at < 5
+    time.sleep(0.2)
+    assert service.time_left == paused_at
+    service.stop()
+
+
+def test_unchanged_update_is_not_renotified():
+    """Test that identical consecutive updates reach callbacks only once."""
+    service, _ = make_service(60)
+    service._min_notify_interval_ns = 0  # debounce is covered separately
+    updates = []
+    service.register_update_callback(lambda update: updates.append(update.time_left))
+    service._notify_update()
+    service._notify_update()
+    service.time_left = 59.5
+    service._notify_update()
+    assert updates == [60]
+    service.time_left = 58.2
+    service._notify_update()
+    assert updates == [60, 59]
+
+
+def test_kept_update_is_not_overwritten():
+    """Test that an update kept by a callback keeps its values."""
+    service, _ = make_service(60)
+    service._min_notify_interval_ns = 0
+    updates = []
+    service.register_update_callback(updates.append)
+    service._notify_update()
+    service.time_left = 30
+    service._notify_update()
+    assert [update.time_left for update in updates] == [60, 30]
+
+
+def test_rapid_updates_are_debounced():
+    """Test that quick time-only updates collapse into one trailing update."""
+    service, _ = make_service(60)
+    updates = []
+    delivered = threading.Event()
+    service.register_update_callback(lambda update: updates.append(update.time_left))
+    service.register_update_callback(
+        lambda update: update.time_left == 57 and delivered.set()
+    )
+    service._notify_update()
+    for seconds in (59, 58, 57):
+        service.time_left = seconds
+        service._notify_update()
+    assert updates == [60]
+    assert delivered.wait(timeout=1)
+    assert updates == [60, 57]
+
+
+def test_state_change_bypasses_debounce():
+    """Test that a state change is delivered without waiting."""
+    service, _ = make_service(60)
+    updates = []
+    service.register_update_callback(lambda update: updates.append(update.state))
+    service._notify_update()
+    service.start()
+    assert updates == [TimerState.STOPPED, TimerState.RUNNING]
+    service.stop()
+
+
+def test_stop_persists_session_in_background():
+    """Test that a stopped session is saved by the persistence worker."""
+    service, data_manager = make_service(60)
+    service.start()
+    service.stop()
+    assert service.flush(timeout=2)
+    assert len(data_manager.sessions) == 1
+    assert not data_manager.sessions[0].was_completed
+
+
+def test_failing_callback_does_not_block_others():
+    """Test that an exception in one callback does not skip the rest."""
+    service, _ = make_service(60)
+    seen = []
+
+    def broken(update):
+        raise RuntimeError("boom")
+
+    service.register_update_callback(broken)
+    service.register_update_callback(lambda update: seen.append(update.time_left))
+    service.set_duration(2)
+    assert seen == [120]
+
+
+def test_concurrent_timers_share_scheduler():
+    """Test that several running timers complete in deadline order."""
+    finished = []
+    services = []
+    for seconds in (0.4, 0.1, 0.25):
+        service, _ = make_service(seconds)
+        service.register_mode_change_callback(
+            lambda mode, seconds=seconds: finished.append(seconds)
+        )
+        services.append(service)
+    threads_before = threading.active_count()
+
+    for service in services:
+        service.start()
+    assert threading.active_count() <= threads_before + 1
+    deadline = time.monotonic() + 2
+    while len(finished) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert finished == [0.1, 0.25, 0.4]
+
+
+def test_reload_settings_updates_long_break_interval():
+    """Test that reloaded settings drive the next mode transition."""
+    service, data_manager = make_service(60)
+    data_manager.settings.long_break_interval = 1
+    service._next_mode()
+    assert service.mode == TimerMode.SHORT_BREAK
+
+    service.reload_settings()
+    service.mode = TimerMode.WORK
+    service._next_mode()
+    assert service.mode == TimerMode.LONG_BREAK
+
+
+def test_completion_auto_starts_break(clock, scheduler):
+    """Test that a completed work period rolls straight into a break."""
+    data_manager = FakeDataManager(TimerSettings(auto_start_breaks=True))
+    service = TimerService(data_manager)
+    service.time_left = 2
+    states = []
+    modes = []
+    service.register_state_change_callback(states.append)
+    service.register_update_callback(lambda update: modes.append(update.mode))
+
+    service.start()
+    clock.advance(2)
+    scheduler.run_due()
+    assert modes[-1] == TimerMode.SHORT_BREAK
+    assert service.state == TimerState.RUNNING
+    assert service.mode == TimerMode.SHORT_BREAK
+    assert states == [TimerState.RUNNING]
+    service.stop()
+    assert service.flush(timeout=2)
+    assert [s.was_completed for s in data_manager.sessions] == [True, False]
+    assert data_manager.sessions[1].mode == TimerMode.SHORT_BREAK
+
+
+def test_callback_registration_is_idempotent():
+    """Test that registering twice notifies once and unregistering removes it."""
+    service, _ = make_service(60)
+    seen = []
+    callback = seen.append
+    service.register_update_callback(callback)
+    service.register_update_callback(seen.append)
+    service._notify_update()
+    assert seen and len(seen) == 1
+
+    service.unregister_update_callback(seen.append)
+    service.time_left = 30
+    service._notify_update()
+    assert len(seen) == 1
+
+
+def test_without_update_callbacks_only_deadline_is_scheduled():
+    """Test that an unobserved timer wakes only once, at its deadline."""
+    service, _ = make_service(0.3)
+    changed = threading.Event()
+    service.register_mode_change_callback(lambda mode: changed.set())
+    ticks = []
+    original = service._on_tick
+    service._on_tick = lambda: (ticks.append(service.get_time_left()), original())
+
+    service.start()
+    time.sleep(0.1)
+    assert 0 < service.get_time_left() < 0.3
+    assert changed.wait(timeout=2)
+    assert ticks == [0]